@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the changelog compression, on a synthetic full history changelog laid out like the ones of
+`GTNHModpackManager.generate_changelog`.
+
+Usage: poetry run python scripts/benchmark_changelog.py [mods] [versions per mod] [rounds]
+"""
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import TextIO
+
+from gtnh.utils import blockquote, compress_changelog
+
+
+def write_changelog(file: TextIO, mods: int, versions: int) -> None:
+    rng = random.Random(0)
+    file.write("# New Mods: \n")
+    file.write("".join(f"> * Mod{mod}\n" for mod in range(0, mods, 10)))
+    for mod in range(mods):
+        name = f"Mod{mod}"
+        if mod % 10 == 0:
+            file.write(f"# New Mod - {name}:2.{versions}.0\n")
+        else:
+            file.write(f"# Updated - {name} - 2.0.0 --> 2.{versions}.0\n")
+        if mod % 7 == 0:
+            file.write("Mod is Client Only.\n")
+        for version in range(versions, 0, -1):
+            tag = f"2.{version}.0"
+            changes = "\n".join(
+                f"* {rng.choice(['Fix', 'Add', 'Update'])} thing {rng.randrange(1000)} by @dev{rng.randrange(50)} in "
+                f"https://github.com/GTNewHorizons/{name}/pull/{version * 10 + change}"
+                for change in range(rng.randrange(1, 6))
+            )
+            body = f"## What's Changed\n{changes}\n\n**Full Changelog**: https://github.com/GTNewHorizons/{name}"
+            body += f"/compare/2.{version - 1}.0...{tag}" if version > 1 else f"/commits/{tag}"
+            if version % 25 == 0:
+                body = body.replace("\n\n**Full", f"\n## New Contributors\n* @new{version} made a PR\n\n**Full")
+            file.write(f"## *{tag}*\n" + blockquote(body) + "\n\n")
+
+
+def main(mods: int, versions: int, rounds: int) -> None:
+    work_dir = Path(tempfile.mkdtemp())
+    try:
+        source = work_dir / "source.md"
+        with open(source, "w") as file:
+            write_changelog(file, mods, versions)
+        changelog = work_dir / "changelog.md"
+
+        durations = []
+        for _ in range(rounds):
+            shutil.copy(source, changelog)
+            start = time.perf_counter()
+            compress_changelog(changelog)
+            durations.append(time.perf_counter() - start)
+
+        shutil.copy(source, changelog)
+        tracemalloc.start()
+        compress_changelog(changelog)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        print(
+            f"{mods} mods x {versions} versions: {source.stat().st_size / 2**20:.1f} MiB -> "
+            f"{changelog.stat().st_size / 2**20:.1f} MiB | best of {rounds} {min(durations) * 1000:.0f} ms | "
+            f"peak memory {peak / 2**20:.1f} MiB"
+        )
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == "__main__":
+    mods, versions, rounds = (
+        int(sys.argv[i]) if len(sys.argv) > i else default for i, default in [(1, 300), (2, 20), (3, 5)]
+    )
+    main(mods, versions, rounds)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of the exclusion lookups, on the listing of a config zip and the exclusions of the modpack.
+
+Usage: poetry run python scripts/benchmark_exclusions.py <config zip> [rounds]
+"""
+import sys
+import timeit
+from pathlib import Path
+from typing import List
+from zipfile import ZipFile
+
+from gtnh.assembler.exclusions import Exclusions
+from gtnh.defs import GTNH_MODPACK_FILE, ROOT_DIR
+from gtnh.models.gtnh_modpack import GTNHModpack
+
+
+def legacy_contains(exclusions: List[str], item: str) -> bool:
+    # The lookup as it was before the exclusions were compiled
+    obj = Path(item)
+    for exclu in exclusions:
+        if item == exclu:
+            return True
+        if Path(exclu) in obj.parents:
+            return True
+        if exclu.endswith("*") and Path(exclu[:-1]) in obj.parents:
+            return True
+    return False
+
+
+def main(config_zip: Path, rounds: int) -> None:
+    with ZipFile(config_zip) as config:
+        names = config.namelist()
+    mod_pack = GTNHModpack.parse_file(ROOT_DIR / GTNH_MODPACK_FILE)
+
+    for side, exclusion_list in [
+        ("client", mod_pack.client_exclusions + mod_pack.client_java8_exclusions),
+        ("server", mod_pack.server_exclusions + mod_pack.server_java8_exclusions),
+    ]:
+        exclusions = Exclusions(list(exclusion_list))
+        legacy = [name for name in names if legacy_contains(exclusion_list, name)]
+        compiled = [name for name in names if name in exclusions]
+        assert legacy == compiled, f"{side}: the compiled exclusions don't match the legacy lookup"
+
+        legacy_time = timeit.timeit(lambda: [legacy_contains(exclusion_list, name) for name in names], number=rounds)
+        compiled_time = timeit.timeit(lambda: [name in exclusions for name in names], number=rounds)
+        print(
+            f"{side}: {len(names)} entries, {len(exclusion_list)} exclusions, {len(compiled)} excluded | "
+            f"legacy {legacy_time / rounds * 1000:.2f} ms | compiled {compiled_time / rounds * 1000:.2f} ms | "
+            f"x{legacy_time / compiled_time:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        sys.exit(__doc__)
+    main(Path(sys.argv[1]), int(sys.argv[2]) if len(sys.argv) > 2 else 10)
@@ -1,19 +1,91 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Awaitable, Callable, Dict, List, Optional
+from queue import Empty
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type
+
+from httpx import AsyncClient
 
 from gtnh.assembler.curse import CurseAssembler
+from gtnh.assembler.generic_assembler import GenericAssembler
 from gtnh.assembler.modrinth import ModrinthAssembler
 from gtnh.assembler.multi_poly import MMCAssembler
 from gtnh.assembler.technic import TechnicAssembler
 from gtnh.assembler.zip_assembler import ZipAssembler
-from gtnh.defs import RELEASE_CHANGELOG_DIR, RELEASE_CHANGELOG_NIGHTLY_BUILDS_DIR, Archive, Side
+from gtnh.defs import RELEASE_CHANGELOG_DIR, RELEASE_CHANGELOG_NIGHTLY_BUILDS_DIR, Archive, ModEntry, Side
 from gtnh.gtnh_logger import get_logger
 from gtnh.models.gtnh_release import GTNHRelease
 from gtnh.modpack_manager import GTNHModpackManager
-from gtnh.utils import compress_changelog
+from gtnh.utils import atomic_write, render_changelog
 
 log = get_logger(__name__)
 
+ARCHIVE_ASSEMBLERS: Dict[str, Type[GenericAssembler]] = {
+    Archive.ZIP: ZipAssembler,
+    Archive.MMC: MMCAssembler,
+    Archive.TECHNIC: TechnicAssembler,
+    Archive.CURSEFORGE: CurseAssembler,
+    Archive.MODRINTH: ModrinthAssembler,
+}
+
+# The archives that can be built from the ones of the previous release, see GenericAssembler.build_from_previous
+DELTA_ARCHIVES = {Archive.ZIP, Archive.MMC}
+
+
+def _assemble_in_subprocess(
+    platform: str,
+    side: Side,
+    verbose: bool,
+    release: GTNHRelease,
+    changelog_path: Path,
+    deterministic: bool,
+    previous_release: Optional[GTNHRelease],
+    progress: Any,
+) -> Dict[str, Dict[str, str]]:
+    """
+    Assemble one archive in a worker process of ReleaseAssembler.assemble.
+
+    :param platform: the archive to assemble
+    :param side: the target side
+    :param verbose: flag to control verbose mode
+    :param release: the target release
+    :param changelog_path: the path to the changelog of the release
+    :param deterministic: build a deterministic archive, see GenericAssembler.finalize_archive
+    :param previous_release: if given, the archive is built from the one of this release, see
+                             GenericAssembler.build_from_previous
+    :param progress: the queue the (delta, message) progress reports are sent to
+    :return: the maven urls found while assembling, as {mod name: {version: maven url}}
+    """
+
+    def report(delta: float, message: str) -> None:
+        progress.put((delta, message))
+
+    async def run() -> Dict[str, Dict[str, str]]:
+        async with AsyncClient(http2=True) as client:
+            mod_manager = GTNHModpackManager(client, lazy_assets=True)
+            assembler = ARCHIVE_ASSEMBLERS[platform](
+                mod_manager,
+                release,
+                report,
+                changelog_path=changelog_path,
+            )
+            assembler.deterministic = deterministic
+            if previous_release is not None:
+                assembler.build_from_previous(previous_release)
+            await assembler.assemble(side, verbose)
+
+        maven_urls: Dict[str, Dict[str, str]] = {}
+        for mod_name in release.github_mods:
+            if not mod_manager.assets.has_mod(mod_name):
+                continue
+            mod = mod_manager.assets.get_mod(mod_name)
+            if mod.is_dirty():
+                maven_urls[mod_name] = {v.version_tag: v.maven_url for v in mod.versions if v.maven_url}
+        return maven_urls
+
+    return asyncio.run(run())
+
 
 class ReleaseAssembler:
     """
@@ -27,6 +99,7 @@ class ReleaseAssembler:
         task_callback: Optional[Callable[[float, str], None]] = None,
         global_callback: Optional[Callable[[float, str], None]] = None,
         current_task_reset_callback: Optional[Callable[[], None]] = None,
+        deterministic: bool = False,
     ) -> None:
         """
         Constructor of the ReleaseAssemblerClass.
@@ -35,6 +108,8 @@ class ReleaseAssembler:
         :param release: the target GTNHRelease
         :param global_progress_callback: the global_progress_callback to use to report progress
         :param current_task_reset_callback: the callback to reset the progress bar for the current task
+        :param deterministic: build archives whose bytes only depend on the release, see
+                              GenericAssembler.finalize_archive
         """
         self.mod_manager: GTNHModpackManager = mod_manager
         self.release: GTNHRelease = release
@@ -59,6 +134,21 @@ class ReleaseAssembler:
             mod_manager, release, task_callback, changelog_path=changelog_path
         )
 
+        self.deterministic: bool = deterministic
+        for assembler in [
+            self.zip_assembler,
+            self.mmc_assembler,
+            self.curse_assembler,
+            self.technic_assembler,
+            self.modrinth_assembler,
+        ]:
+            assembler.deterministic = deterministic
+
+        self.task_callback: Optional[Callable[[float, str], None]] = task_callback
+        self.changelog_path: Path = changelog_path
+        # set by build_from_previous
+        self.previous_release: Optional[GTNHRelease] = None
+
         # computation of the progress per mod for the progressbar
         self.delta_progress: float = 0.0
 
@@ -79,12 +169,25 @@ class ReleaseAssembler:
         """
         return self.delta_progress
 
-    async def assemble(self, side: Side, verbose: bool = False) -> None:
+    def build_from_previous(self, previous_release: GTNHRelease) -> None:
+        """
+        Method to build the zip and MMC archives from the ones of the previous release, see
+        GenericAssembler.build_from_previous.
+
+        :param previous_release: the release the existing archives were built for
+        :return: None
+        """
+        self.previous_release = previous_release
+        self.zip_assembler.build_from_previous(previous_release)
+        self.mmc_assembler.build_from_previous(previous_release)
+
+    async def assemble(self, side: Side, verbose: bool = False, parallel: bool = False) -> None:
         """
         Method called to assemble the release for all the supported platforms.
 
         :param side: the target side
         :param verbose: bool flag enabling verbose mod
+        :param parallel: assemble the archives concurrently, each one in its own process
         :return: None
         """
 
@@ -110,11 +213,15 @@ class ReleaseAssembler:
             assemblers_client if side.is_client() else assemblers_server
         )
 
-        for platform, assembling in assemblers.items():
-            if side.is_java9() and platform in [Archive.TECHNIC, Archive.CURSEFORGE]:
-                # Java 9 is currently not supported on Technic and Curse
-                continue
+        if side.is_java9():
+            # Java 9 is currently not supported on Technic and Curse
+            assemblers = {p: a for p, a in assemblers.items() if p not in [Archive.TECHNIC, Archive.CURSEFORGE]}
+
+        if parallel:
+            await self.assemble_parallel([(side, platform) for platform in assemblers], verbose)
+            return
 
+        for platform, assembling in assemblers.items():
             if self.current_task_reset_callback is not None:
                 self.current_task_reset_callback()
 
@@ -125,6 +232,81 @@ class ReleaseAssembler:
         # TODO: Remove when the maven urls are calculated on add, instead of in curse
         self.mod_manager.save_assets()
 
+    async def assemble_parallel(self, archives: List[Tuple[Side, str]], verbose: bool = False) -> None:
+        """
+        Assemble the given archives concurrently in a process pool. The archives are independent files, so the only
+        state brought back from the workers are the maven urls resolved by the curse assembler.
+
+        :param archives: the archives to assemble, as (side, platform)
+        :param verbose: flag to control verbose mode
+        :return: None
+        """
+        # The workers load the assets from disk
+        self.mod_manager.save_assets()
+
+        # spawn rather than fork: the parent runs an event loop and owns an http client
+        context = multiprocessing.get_context("spawn")
+        loop = asyncio.get_running_loop()
+        with context.Manager() as process_manager, ProcessPoolExecutor(len(archives), mp_context=context) as pool:
+            progress = process_manager.Queue()
+            futures = {
+                (side, platform): loop.run_in_executor(
+                    pool,
+                    _assemble_in_subprocess,
+                    platform,
+                    side,
+                    verbose,
+                    self.release,
+                    self.changelog_path,
+                    self.deterministic,
+                    self.previous_release if platform in DELTA_ARCHIVES else None,
+                    progress,
+                )
+                for side, platform in archives
+            }
+
+            def drain_progress() -> None:
+                while True:
+                    try:
+                        delta, message = progress.get_nowait()
+                    except Empty:
+                        return
+                    if self.task_callback is not None:
+                        # every archive reports its own 0-100% progress, they share the task progress bar
+                        self.task_callback(delta / len(archives), message)
+
+            pending = set(futures.values())
+            while pending:
+                done, pending = await asyncio.wait(pending, timeout=0.1)
+                drain_progress()
+                for (side, platform), future in futures.items():
+                    if future in done:
+                        log.info(f"Assembled {side} {platform} archive")
+                        if self.callback:
+                            self.callback(self.get_progress(), f"Assembled {side} {platform} archive")
+            drain_progress()
+
+        for future in futures.values():
+            self.merge_maven_urls(future.result())
+
+        # TODO: Remove when the maven urls are calculated on add, instead of in curse
+        self.mod_manager.save_assets()
+
+    def merge_maven_urls(self, maven_urls: Dict[str, Dict[str, str]]) -> None:
+        """
+        Bring the maven urls resolved by a worker of assemble_parallel back into the assets; only the versions whose
+        url changed mark their mod as dirty.
+
+        :param maven_urls: the maven urls returned by the worker, as {mod name: {version: maven url}}
+        :return: None
+        """
+        for mod_name, version_urls in maven_urls.items():
+            mod = self.mod_manager.assets.get_mod(mod_name)
+            for version in mod.versions:
+                if version.version_tag in version_urls and version.maven_url != version_urls[version.version_tag]:
+                    version.maven_url = version_urls[version.version_tag]
+                    mod.mark_dirty()
+
     async def assemble_zip(self, side: Side, verbose: bool = False) -> None:
         """
         Method called to assemble the zip archive.
@@ -175,7 +357,6 @@ class ReleaseAssembler:
         """
         await self.technic_assembler.assemble(side, verbose)
 
-    # Changes to this method may need updates to utils.compress_changelog()
     def generate_changelog(self) -> Path:
         """
         Method to generate the changelog of a release.
@@ -188,7 +369,7 @@ class ReleaseAssembler:
         previous_release: Optional[GTNHRelease] = (
             None if previous_version is None else self.mod_manager.get_release(previous_version)
         )
-        changelog: Dict[str, List[str]] = self.mod_manager.generate_changelog(self.release, previous_release)
+        changelog: List[str | ModEntry] = self.mod_manager.generate_changelog_entries(self.release, previous_release)
         changelog_path: Path
         if "nightly" in current_version:
             changelog_path = (
@@ -199,15 +380,7 @@ class ReleaseAssembler:
         else:
             changelog_path = RELEASE_CHANGELOG_DIR / f"changelog from {previous_version} to {current_version}.md"
 
-        with open(changelog_path, "w") as file:
-
-            for mod, mod_changelog in changelog.items():
-                for item in mod_changelog:
-                    try:
-                        file.write(item + "\n")
-                    except UnicodeEncodeError:
-                        file.write((item + "\n").encode("ascii", "ignore").decode())
-
-        compress_changelog(changelog_path)
+        # the entries are compressed as they're generated, the changelog is written once
+        atomic_write(changelog_path, "".join(render_changelog(changelog)).encode())
 
         return changelog_path
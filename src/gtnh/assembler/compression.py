@@ -0,0 +1,72 @@
+import time
+from pathlib import Path
+from typing import IO, Optional, Tuple
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
+
+from gtnh.defs import ARCHIVE_COMPRESSED_ENTRIES_LEVEL, ARCHIVE_COMPRESSED_EXTENSIONS
+
+
+class CompressionPolicy:
+    """
+    Chooses how each entry of a release archive is compressed: the entries that are already compressed (jars, zips,
+    pngs) are stored, or deflated at a given level, while the others, mostly text configs, are deflated with the
+    settings of the archive.
+    """
+
+    def __init__(
+        self,
+        compressed_extensions: Tuple[str, ...] = ARCHIVE_COMPRESSED_EXTENSIONS,
+        compressed_level: Optional[int] = ARCHIVE_COMPRESSED_ENTRIES_LEVEL,
+    ) -> None:
+        """
+        Constructor of the CompressionPolicy class.
+
+        :param compressed_extensions: the extensions of the entries that are already compressed
+        :param compressed_level: the deflate level of those entries, None to store them
+        """
+        self.compressed_extensions = tuple(extension.lower() for extension in compressed_extensions)
+        self.compressed_level = compressed_level
+
+    def compression(self, archive: ZipFile, arcname: str | Path) -> Tuple[int, Optional[int]]:
+        """
+        Get the compression of an entry.
+
+        :param archive: the archive the entry goes in
+        :param arcname: the name of the entry
+        :return: the compression type and level of the entry
+        """
+        if str(arcname).lower().endswith(self.compressed_extensions):
+            if self.compressed_level is None:
+                return ZIP_STORED, None
+            return ZIP_DEFLATED, self.compressed_level
+        return archive.compression, archive.compresslevel
+
+    def write(self, archive: ZipFile, filename: Path, arcname: str | Path) -> None:
+        """
+        Add a file to an archive, with the compression of its entry.
+
+        :param archive: the archive
+        :param filename: the file to add
+        :param arcname: the name of the entry
+        :return: None
+        """
+        compress_type, compresslevel = self.compression(archive, arcname)
+        archive.write(filename, arcname=arcname, compress_type=compress_type, compresslevel=compresslevel)
+
+    def open(self, archive: ZipFile, arcname: str) -> IO[bytes]:
+        """
+        Open an entry of an archive for writing, with the compression of the entry.
+
+        :param archive: the archive
+        :param arcname: the name of the entry
+        :return: the writable entry
+        """
+        compress_type, compresslevel = self.compression(archive, arcname)
+        if (compress_type, compresslevel) == (archive.compression, archive.compresslevel):
+            return archive.open(arcname, "w")
+
+        zinfo = ZipInfo(arcname, date_time=time.localtime(time.time())[:6])
+        zinfo.compress_type = compress_type
+        # ZipFile.open has no compresslevel parameter, it's read from the ZipInfo
+        zinfo._compresslevel = compresslevel  # type: ignore
+        return archive.open(zinfo, "w")
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+import hashlib
+import os
+import shutil
+from pathlib import Path
+
+from gtnh.defs import CONTENT_STORE_DIR
+from gtnh.gtnh_logger import get_logger
+
+log = get_logger(__name__)
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path: Path) -> str:
+    """
+    Hash a file.
+
+    :param path: the file to hash
+    :return: the hex sha256 of the file
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def object_location(sha256: str) -> Path:
+    return CONTENT_STORE_DIR / sha256[:2] / sha256
+
+
+def is_valid_file(path: Path, size: int | None, sha256: str | None) -> bool:
+    """
+    Check a file against its expected size and sha256; the checks for which nothing is expected are skipped.
+
+    :param path: the file to check
+    :param size: the expected size
+    :param sha256: the expected sha256
+    :return: True if the file exists and matches
+    """
+    if not path.is_file():
+        return False
+    if size is not None and path.stat().st_size != size:
+        return False
+    return sha256 is None or file_sha256(path) == sha256
+
+
+def _link_or_copy(source: Path, destination: Path) -> None:
+    os.makedirs(destination.parent, exist_ok=True)
+    temp_path = destination.with_name(f".{destination.name}.{os.getpid()}.tmp")
+    try:
+        os.link(source, temp_path)
+    except OSError:
+        # Other file system, or no hard link support
+        shutil.copyfile(source, temp_path)
+    os.replace(temp_path, destination)
+
+
+def add_to_store(path: Path, sha256: str) -> None:
+    """
+    Add a file to the content store. If the store already holds the same content, the file is replaced by a link to
+    it, so identical files shared between versions or mods only take space once.
+
+    :param path: the file to add
+    :param sha256: the sha256 of the file
+    :return: None
+    """
+    stored = object_location(sha256)
+    if stored.exists():
+        if not os.path.samefile(stored, path):
+            _link_or_copy(stored, path)
+        return
+
+    _link_or_copy(path, stored)
+
+
+def restore_from_store(sha256: str, size: int | None, destination: Path) -> bool:
+    """
+    Put a file from the content store at the given location, after verifying it.
+
+    :param sha256: the sha256 of the wanted file
+    :param size: the expected size of the file, if known
+    :param destination: where the file should be
+    :return: True if the file was restored, False if the store doesn't have it
+    """
+    stored = object_location(sha256)
+    if not stored.exists():
+        return False
+
+    if not is_valid_file(stored, size, sha256):
+        log.warn(f"Removing corrupt object `{stored}` from the content store")
+        stored.unlink()
+        return False
+
+    _link_or_copy(stored, destination)
+    return True
@@ -1,7 +1,8 @@
-import shutil
-from json import dump
+import asyncio
+import json
+from contextlib import AbstractAsyncContextManager
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import quote as urlquote
 from zipfile import ZIP_DEFLATED, ZipFile
 
@@ -10,8 +11,10 @@ from colorama import Fore
 
 from gtnh.assembler.downloader import get_asset_version_cache_location
 from gtnh.assembler.generic_assembler import GenericAssembler
-from gtnh.defs import CACHE_DIR, MAVEN_BASE_URL, RELEASE_CURSE_DIR, ROOT_DIR, ModSource, Side
+from gtnh.defs import MAVEN_BASE_URL, RELEASE_CURSE_DIR, ROOT_DIR, ModSource, Side
+from gtnh.exceptions import MavenUnreachableException
 from gtnh.gtnh_logger import get_logger
+from gtnh.maven_cache import MavenCache
 from gtnh.models.gtnh_config import GTNHConfig
 from gtnh.models.gtnh_release import GTNHRelease
 from gtnh.models.gtnh_version import GTNHVersion
@@ -85,21 +88,32 @@ def get_maven_url(mod: GTNHModInfo, version: GTNHVersion) -> str | None:
     return url
 
 
-async def resolve_github_url(client: httpx.AsyncClient, mod: GTNHModInfo, version: GTNHVersion) -> str:
+async def resolve_github_url(
+    client: httpx.AsyncClient,
+    mod: GTNHModInfo,
+    version: GTNHVersion,
+    maven_cache: MavenCache,
+    slot: Optional[Callable[[], AbstractAsyncContextManager[Any]]] = None,
+) -> str:
     """
     Method to check if maven download url is availiable. If not, falling back to github. For now, it is reasonable, but
     we may hit the anonymous request quota limit if we have too much missing maven urls. Better not to rely too much on
     this.
 
+    :param client: the http client
     :param mod: the github mod
     :param version: it's associated version
+    :param maven_cache: the cache of the maven existence checks
+    :param slot: gives the permission to make the request, like `RequestScheduler.slot`
     """
 
     url = get_maven_url(mod, version)
     if url:
-        response: httpx.Response = await client.head(url)
-        if response.status_code in {200, 204}:
-            return url
+        try:
+            if await maven_cache.exists(client, url, slot):
+                return url
+        except MavenUnreachableException as e:
+            log.warn(f"{e} for {url}")
     log.warn(f"Using fallback url, couldn't find {url}")
     assert version.browser_download_url
     return version.browser_download_url
@@ -138,7 +152,6 @@ class CurseAssembler(GenericAssembler):
         self.overrides_folder = Path("overrides")
         self.manifest_json = Path("manifest.json")
         self.dependencies_json = self.overrides_folder / "config" / "dependencies.json"
-        self.tempfile = CACHE_DIR / "temp"
         self.overrides = ROOT_DIR / "overrides.png"
         self.overrideslash = ROOT_DIR / "overrideslash.png"
 
@@ -164,18 +177,31 @@ class CurseAssembler(GenericAssembler):
 
         log.info(f"Constructing {Fore.YELLOW}{side}{Fore.RESET} archive at {Fore.YELLOW}'{archive_name}'{Fore.RESET}")
 
-        with ZipFile(self.get_archive_path(side), "w", compression=ZIP_DEFLATED) as archive:
-            log.info("Adding config to the archive")
-            self.add_config(side, self.get_config(), archive, verbose=verbose)
-            log.info("Adding manifest.json to the archive")
-            self.generate_meta_data(side, archive)
-            log.info("Adding dependencies.json to the archive")
-            await self.generate_json_dep(side, archive)
-            log.info("Adding overrides to the archive")
-            self.add_overrides(side, archive)
-            log.info("Adding locales to the archive")
-            self.add_localisation_files(archive, str(self.overrides_folder))
-            log.info("Archive created successfully!")
+        mod_list: List[Tuple[GTNHModInfo, GTNHVersion]] = self.get_mods(side)
+        # resolved before the archives are opened, so writing them isn't stalled by the maven checks
+        resolved_urls = await self.resolve_download_urls(mod_list)
+        dependencies, downloads = self.get_dependencies(mod_list, resolved_urls)
+
+        # downloads.zip only holds jars, it's built in a thread while the main archive is written
+        log.info(f"Constructing {Fore.YELLOW}'{self.get_downloads_archive_path()}'{Fore.RESET} in the background")
+        downloads_archive = asyncio.create_task(asyncio.to_thread(self.build_downloads_archive, downloads))
+        try:
+            with ZipFile(self.get_archive_path(side), "w", compression=ZIP_DEFLATED) as archive:
+                log.info("Adding config to the archive")
+                self.add_config(side, self.get_config(), archive, verbose=verbose)
+                log.info("Adding manifest.json to the archive")
+                self.generate_meta_data(side, archive)
+                log.info("Adding dependencies.json to the archive")
+                self.generate_json_dep(dependencies, archive)
+                log.info("Adding overrides to the archive")
+                self.add_overrides(side, archive)
+                log.info("Adding locales to the archive")
+                self.add_localisation_files(archive, str(self.overrides_folder))
+                log.info("Archive created successfully!")
+
+            self.finalize_archive(self.get_archive_path(side))
+        finally:
+            await downloads_archive
 
     def add_overrides(self, side: Side, archive: ZipFile) -> None:
         """
@@ -185,90 +211,129 @@ class CurseAssembler(GenericAssembler):
         :param archive: curse archive
         :return: None
         """
-        archive.write(self.overrides, arcname=self.overrides_folder / "overrides.png")
-        archive.write(self.overrideslash, arcname=self.overrides_folder / "overrideslash.png")
+        self.compression.write(archive, self.overrides, self.overrides_folder / "overrides.png")
+        self.compression.write(archive, self.overrideslash, self.overrides_folder / "overrideslash.png")
         coremod, coremod_version = [
             (mod, version) for mod, version in self.get_mods(side) if mod.name == "NewHorizonsCoreMod"
         ][0]
         source_file: Path = get_asset_version_cache_location(coremod, coremod_version)
         archive_path: Path = self.overrides_folder / "mods" / source_file.name
-        archive.write(source_file, arcname=archive_path)
+        self.compression.write(archive, source_file, archive_path)
 
     def add_config(
         self, side: Side, config: Tuple[GTNHConfig, GTNHVersion], archive: ZipFile, verbose: bool = False
     ) -> None:
-        modpack_config: GTNHConfig
-        config_version: Optional[GTNHVersion]
-        modpack_config, config_version = config
-
-        config_file: Path = get_asset_version_cache_location(modpack_config, config_version)
-
-        with ZipFile(config_file, "r", compression=ZIP_DEFLATED) as config_zip:
-
-            for item in config_zip.namelist():
-                if item in self.exclusions[side]:
-                    continue
-                with config_zip.open(item) as config_item:
-                    with archive.open(
-                        str(self.overrides_folder) + "/" + item, "w"
-                    ) as target:  # can't use Path for the whole
-                        # path here as it strips leading / but those are used by
-                        # zipfile to know if it's a file or a folder. If used here,
-                        # Path objects will lead to the creation of empty files for
-                        # every folder.
-                        shutil.copyfileobj(config_item, target)
-                        if self.task_progress_callback is not None:
-                            self.task_progress_callback(self.get_progress(), f"adding {item} to the archive")
+        # can't use Path for the whole path here as it strips leading / but those are used by zipfile to know if it's a
+        # file or a folder. If used here, Path objects will lead to the creation of empty files for every folder.
+        self.add_prepared_config(side, config, archive, prefix=str(self.overrides_folder) + "/")
 
         assert self.changelog_path
         self.add_changelog(archive, arcname=self.overrides_folder / self.changelog_path.name)
 
-    async def generate_json_dep(self, side: Side, archive: ZipFile) -> None:
+    async def resolve_download_urls(self, mod_list: List[Tuple[GTNHModInfo, GTNHVersion]]) -> Dict[str, str]:
         """
-        Generates the dependencies.json and puts it in the archive.
+        Resolves the download urls of the github mods without a maven url, all at once: the maven checks are cached
+        and run concurrently, bounded by the maven slots of the modpack manager.
 
-        :param side: the side of the archive
-        :param archive: the zipfile object
-        :return: None
+        :param mod_list: the mods of the archive
+        :return: the download urls, by mod name
+        """
+        to_resolve = [
+            (mod, version)
+            for mod, version in mod_list
+            if mod.source == ModSource.github and not version.maven_url and not self.is_in_overrides(mod, version)
+        ]
+        if not to_resolve:
+            return {}
+
+        maven_cache = self.modpack_manager.maven_cache
+        slot = self.modpack_manager.maven_slot
+        async with httpx.AsyncClient(http2=True) as client:
+            urls = await asyncio.gather(
+                *(resolve_github_url(client, mod, version, maven_cache, slot) for mod, version in to_resolve)
+            )
+        maven_cache.save()
+
+        return {mod.name: url for (mod, _), url in zip(to_resolve, urls)}
+
+    @staticmethod
+    def is_in_overrides(mod: GTNHModInfo, version: GTNHVersion) -> bool:
+        """
+        Whether a mod is shipped in the overrides rather than downloaded by the launcher.
+
+        :param mod: the mod
+        :param version: its version
+        :return: true if the mod is in the overrides
+        """
+        return mod.name == "NewHorizonsCoreMod" or is_valid_curse_mod(mod, version)
+
+    def get_dependencies(
+        self, mod_list: List[Tuple[GTNHModInfo, GTNHVersion]], resolved_urls: Dict[str, str]
+    ) -> Tuple[List[Dict[str, str]], List[Path]]:
+        """
+        Lists the mods downloaded by the launcher rather than shipped in the overrides.
+
+        :param mod_list: the mods of the archive
+        :param resolved_urls: the download urls of the github mods without a maven url, by mod name
+        :return: the entries of the dependencies.json, and the mod files going in downloads.zip
         """
-        mod_list: List[Tuple[GTNHModInfo, GTNHVersion]] = self.get_mods(side)
         mod: GTNHModInfo
         version: GTNHVersion
         dep_json: List[Dict[str, str]] = []
-        with ZipFile(RELEASE_CURSE_DIR / "downloads.zip", "w", compression=ZIP_DEFLATED) as file:
-            async with httpx.AsyncClient(http2=True) as client:
-                for mod, version in mod_list:
-                    if mod.name == "NewHorizonsCoreMod" or is_valid_curse_mod(mod, version):
-                        continue  # skipping it as it's in the overrides
-
-                    url: Optional[str]
-                    if mod.source == ModSource.github:
-                        if not version.maven_url:
-                            url = await resolve_github_url(client, mod, version)
-                        else:
-                            url = version.maven_url
-
-                        # Hacky detection
-                        if url and "nexus.gtnewhorizons.com" in url:
-                            version.maven_url = url
-                    else:
-                        url = version.download_url
-
-                    path: Path = get_asset_version_cache_location(mod, version)
-                    file.write(path, arcname=path.name)
-                    assert url
-                    url = f"https://downloads.gtnewhorizons.com/Mods_for_Twitch/{urlquote(path.name)}"  # temporary override until maven is fixed
-                    mod_obj: Dict[str, str] = {"path": f"mods/{version.filename}", "url": url}
-
-                    dep_json.append(mod_obj)
-
-        with open(self.tempfile, "w") as temp:
-            dump(dep_json, temp, indent=2)
-
-        archive.write(self.tempfile, arcname=str(self.dependencies_json))
+        downloads: List[Path] = []
+        for mod, version in mod_list:
+            if self.is_in_overrides(mod, version):
+                continue  # skipping it as it's in the overrides
+
+            url: Optional[str]
+            if mod.source == ModSource.github:
+                url = version.maven_url or resolved_urls[mod.name]
+
+                # Hacky detection
+                if url and "nexus.gtnewhorizons.com" in url and version.maven_url != url:
+                    version.maven_url = url
+                    mod.mark_dirty()
+            else:
+                url = version.download_url
+
+            path: Path = get_asset_version_cache_location(mod, version)
+            downloads.append(path)
+            assert url
+            url = f"https://downloads.gtnewhorizons.com/Mods_for_Twitch/{urlquote(path.name)}"  # temporary override until maven is fixed
+            mod_obj: Dict[str, str] = {"path": f"mods/{version.filename}", "url": url}
+
+            dep_json.append(mod_obj)
+
+        return dep_json, downloads
+
+    def get_downloads_archive_path(self) -> Path:
+        return RELEASE_CURSE_DIR / "downloads.zip"
+
+    def build_downloads_archive(self, downloads: List[Path]) -> None:
+        """
+        Builds downloads.zip, holding the mods downloaded by the launcher. It doesn't report any progress, so it can run
+        in a thread.
+
+        :param downloads: the mod files
+        :return: None
+        """
+        with ZipFile(self.get_downloads_archive_path(), "w", compression=ZIP_DEFLATED) as file:
+            for path in downloads:
+                self.compression.write(file, path, path.name)
+
+        self.finalize_archive(self.get_downloads_archive_path())
+
+    def generate_json_dep(self, dependencies: List[Dict[str, str]], archive: ZipFile) -> None:
+        """
+        Generates the dependencies.json and puts it in the archive.
+
+        :param dependencies: the entries of the dependencies.json, from `get_dependencies`
+        :param archive: the zipfile object
+        :return: None
+        """
+        archive.writestr(str(self.dependencies_json), json.dumps(dependencies, indent=2))
         if self.task_progress_callback is not None:
             self.task_progress_callback(self.get_progress(), f"adding {self.dependencies_json} to the archive")
-        self.tempfile.unlink()
 
     def generate_meta_data(self, side: Side, archive: ZipFile) -> None:
         """
@@ -306,12 +371,7 @@ class CurseAssembler(GenericAssembler):
 
         metadata["files"] = files
 
-        with open(self.tempfile, "w") as temp:
-            dump(metadata, temp, indent=2)
-
-        archive.write(self.tempfile, arcname=str(self.manifest_json))
+        archive.writestr(str(self.manifest_json), json.dumps(metadata, indent=2))
 
         if self.task_progress_callback is not None:
             self.task_progress_callback(self.get_progress(), f"adding {self.manifest_json} to the archive")
-
-        self.tempfile.unlink()
@@ -1,12 +1,21 @@
 #!/usr/bin/env python3
+import asyncio
 import os
 import re
+from contextlib import nullcontext
 from pathlib import Path
+from typing import Mapping, Optional
 
-from gtnh.defs import CACHE_DIR
+import httpx
+import orjson
+from colorama import Fore
+
+from gtnh.defs import CACHE_DIR, DOWNLOAD_CHUNK_SIZE
+from gtnh.github.scheduler import RequestScheduler
 from gtnh.gtnh_logger import get_logger
 from gtnh.models.gtnh_version import ExtraAsset, GTNHVersion
 from gtnh.models.versionable import Versionable
+from gtnh.utils import atomic_write
 
 log = get_logger(__name__)
 
@@ -16,6 +25,8 @@ log = get_logger(__name__)
 
 forbidden_chars = re.compile(r'[<>:"\/|\?\*]')
 
+CONTENT_RANGE = re.compile(r"^bytes (\d+)-\d+/(?:\d+|\*)$")
+
 
 def sanitize(to_sanitize: str) -> str:
     return re.sub(forbidden_chars, "_", to_sanitize)
@@ -45,3 +56,155 @@ def get_asset_version_cache_location(
         if subasset is version:
             raise FileNotFoundError(f"Could not find an asset with suffix {extra_asset_suffix} for {version.filename}")
     return cache_dir / sanitize(asset.type.value) / sanitize(asset.name) / sanitize(str(subasset.filename))
+
+
+def partial_download_location(destination: Path) -> Path:
+    return destination.with_name(destination.name + ".part")
+
+
+def partial_validator_location(destination: Path) -> Path:
+    return destination.with_name(destination.name + ".part.json")
+
+
+def discard_partial_download(destination: Path) -> None:
+    """
+    Remove the partial download of a file, and what's known about the remote file it was downloaded from.
+
+    :param destination: where the file ends up
+    :return: None
+    """
+    for path in (partial_download_location(destination), partial_validator_location(destination)):
+        if path.exists():
+            path.unlink()
+
+
+def _load_validator(destination: Path, url: str) -> Optional[str]:
+    # The ETag or Last-Modified of the remote file the partial download comes from
+    try:
+        stored = orjson.loads(partial_validator_location(destination).read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if stored.get("url") != url:
+        return None
+    validator: Optional[str] = stored.get("validator")
+    return validator
+
+
+def _content_range_start(content_range: Optional[str]) -> Optional[int]:
+    matches = CONTENT_RANGE.match(content_range or "")
+    return int(matches.group(1)) if matches else None
+
+
+async def download_file(
+    client: httpx.AsyncClient,
+    url: str,
+    destination: Path,
+    headers: Optional[Mapping[str, str]] = None,
+    scheduler: Optional[RequestScheduler] = None,
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    tries: int = 5,
+    delay: float = 2,
+) -> None:
+    """
+    Download a file into a `.part` file next to its destination, and move it in place once it is complete, so an
+    interrupted download never leaves a truncated file behind. Connection errors resume the download where it stopped
+    with a Range request.
+
+    A download is only resumed from a partial file whose ETag or Last-Modified is known: it's sent as If-Range, so a
+    remote file that changed since is sent whole, and the partial file is thrown away. So is a partial answer that
+    doesn't start where the partial file ends.
+
+    :param client: the http client
+    :param url: the url to download
+    :param destination: where the file ends up
+    :param headers: extra request headers
+    :param scheduler: if given, the request is sent from one of its slots, released once the headers are received
+    :param chunk_size: the size of the chunks written to disk
+    :param tries: how many times the download is attempted before giving up
+    :param delay: seconds to wait before resuming after a connection error
+    :return: None
+    :raises httpx.HTTPStatusError: if the server answered with an error
+    :raises httpx.TransportError: if the download still failed after all the tries
+    """
+    part = partial_download_location(destination)
+    attempt = 0
+    while True:
+        attempt += 1
+        # the offset is counted in bytes of the file as sent, which is why the download asks for no content encoding
+        request_headers = dict(headers or {}) | {"Accept-Encoding": "identity"}
+        offset = part.stat().st_size if part.exists() else 0
+        validator = _load_validator(destination, url) if offset else None
+        if offset and validator is None:
+            log.debug(f"Discarding partial download `{part.name}` of an unknown version")
+            discard_partial_download(destination)
+            offset = 0
+        if offset:
+            assert validator is not None
+            request_headers["Range"] = f"bytes={offset}-"
+            request_headers["If-Range"] = validator
+
+        try:
+            await _stream_to_file(client, url, destination, offset, request_headers, scheduler, chunk_size)
+            break
+        except httpx.TransportError as e:
+            if attempt >= tries:
+                raise
+            log.warn(
+                f"{Fore.YELLOW}Download of `{destination.name}` interrupted ({e!r}), resuming in {delay}s "
+                f"[{attempt}/{tries}]{Fore.RESET}"
+            )
+            await asyncio.sleep(delay)
+
+    os.replace(part, destination)
+    discard_partial_download(destination)
+
+
+async def _stream_to_file(
+    client: httpx.AsyncClient,
+    url: str,
+    destination: Path,
+    offset: int,
+    headers: Mapping[str, str],
+    scheduler: Optional[RequestScheduler],
+    chunk_size: int,
+) -> None:
+    part = partial_download_location(destination)
+    # the slot only covers the request: the body of a large file can stream for a while without holding it
+    async with scheduler.slot() if scheduler is not None else nullcontext():
+        r = await client.send(client.build_request("GET", url, headers=headers), stream=True, follow_redirects=True)
+    try:
+        if scheduler is not None:
+            scheduler.observe(r.status_code, r.headers)
+
+        if r.status_code == httpx.codes.REQUESTED_RANGE_NOT_SATISFIABLE:
+            # The partial file doesn't match the remote one anymore, start over
+            log.debug(f"Discarding partial download `{part.name}`")
+            discard_partial_download(destination)
+            raise httpx.RemoteProtocolError("Requested range not satisfiable", request=r.request)
+
+        r.raise_for_status()
+
+        encoded = r.headers.get("content-encoding", "identity").lower() != "identity"
+        if r.status_code == httpx.codes.PARTIAL_CONTENT:
+            if not offset or encoded or _content_range_start(r.headers.get("content-range")) != offset:
+                log.debug(f"Discarding partial download `{part.name}`, the partial answer doesn't continue it")
+                discard_partial_download(destination)
+                raise httpx.RemoteProtocolError("Partial answer doesn't continue the partial file", request=r.request)
+            mode = "ab"
+        else:
+            # The whole file: the remote file changed since the partial download, or the Range header was ignored
+            discard_partial_download(destination)
+            mode = "wb"
+            # weak ETags can't be used in If-Range, and an encoded body can't be resumed byte for byte
+            etag = r.headers.get("etag")
+            validator = etag if etag and not etag.startswith("W/") else r.headers.get("last-modified")
+            if validator and not encoded:
+                atomic_write(
+                    partial_validator_location(destination), orjson.dumps({"url": url, "validator": validator})
+                )
+
+        with open(part, mode) as f:
+            async for chunk in r.aiter_bytes(chunk_size=chunk_size):
+                f.write(chunk)
+    finally:
+        await r.aclose()
@@ -1,28 +1,63 @@
 from pathlib import Path
-from typing import Iterable, List
+from typing import Any, Dict, Iterable, List, Set
+
+# Marks the trie nodes at which an excluded folder ends
+EXCLUDED_FOLDER = ""
 
 
 class Exclusions:
+    """
+    Files and folders left out of an archive. A file is excluded if it's listed as is, or if it's in a listed folder;
+    a trailing `*` is ignored, so `config/foo*` excludes what's in the `config/foo` folder.
+
+    The exclusions are compiled into a set of the listed names and a trie of the folders, split in path components,
+    so a lookup only walks the components of the path it's given.
+    """
+
     exclusions: List[str]
 
     def __init__(self, exclusions: List[str]) -> None:
         self.exclusions = exclusions
+        self._names: Set[str] = set()
+        self._folders: Dict[str, Any] = {}
+        self._compile(exclusions)
+
+    def _compile(self, exclusions: Iterable[str]) -> None:
+        for exclu in exclusions:
+            self._names.add(exclu)
+            self._add_folder(exclu)
+            if exclu.endswith("*"):
+                self._add_folder(exclu[:-1])
+
+    def _add_folder(self, folder: str) -> None:
+        node = self._folders
+        for part in Path(folder).parts:
+            node = node.setdefault(part, {})
+        node[EXCLUDED_FOLDER] = True
 
     def __contains__(self, item: str) -> bool:
-        obj = Path(item)
-        for exclu in self.exclusions:
-            if item == exclu:  # if the file is explicitely listed as excluded
-                return True
-            if Path(exclu) in obj.parents:  # if a file is in an excluded folder
-                return True
-
-            if exclu.endswith("*") and Path(exclu[:-1]) in obj.parents:
+        if item in self._names:  # if the file is explicitely listed as excluded
+            return True
+
+        # if a file is in an excluded folder: walk the parents of the file, from the root. An anchored path doesn't
+        # have the empty path as a parent, unlike a relative one.
+        path = Path(item)
+        parts = path.parts
+        node: Any = self._folders
+        for depth in range(len(parts)):
+            if EXCLUDED_FOLDER in node and (depth > 0 or not path.anchor):
                 return True
+            node = node.get(parts[depth])
+            if node is None:
+                return False
 
         return False
 
     def append(self, exclusion: str) -> None:
         self.exclusions.append(exclusion)
+        self._compile([exclusion])
 
     def extend(self, exclusions: Iterable[str]) -> None:
+        exclusions = list(exclusions)
         self.exclusions.extend(exclusions)
+        self._compile(exclusions)
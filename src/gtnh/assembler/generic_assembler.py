@@ -1,13 +1,16 @@
 import os
-import shutil
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Callable, Collection, Dict, List, Optional, Set, Tuple, Union
 from zipfile import ZIP_DEFLATED, ZipFile
 
+import orjson
 from colorama import Fore
 
+from gtnh.assembler.compression import CompressionPolicy
 from gtnh.assembler.downloader import get_asset_version_cache_location
 from gtnh.assembler.exclusions import Exclusions
+from gtnh.assembler.prepared_config import PreparedConfig, prepare_config
+from gtnh.assembler.zip_utils import copy_zip_entry, deterministic_date_time, normalize_archive
 from gtnh.defs import README_TEMPLATE, RELEASE_README_DIR, ModSource, Side
 from gtnh.gtnh_logger import get_logger
 from gtnh.models.gtnh_config import GTNHConfig
@@ -16,6 +19,7 @@ from gtnh.models.gtnh_version import GTNHVersion
 from gtnh.models.mod_info import GTNHModInfo
 from gtnh.models.mod_version_info import ModVersionInfo
 from gtnh.modpack_manager import GTNHModpackManager
+from gtnh.utils import atomic_write
 
 log = get_logger(__name__)
 
@@ -46,6 +50,11 @@ class GenericAssembler:
         self.global_progress_callback: Optional[Callable[[float, str], None]] = global_progress_callback
         self.task_progress_callback: Optional[Callable[[float, str], None]] = task_progress_callback
         self.changelog_path: Optional[Path] = changelog_path
+        self.compression: CompressionPolicy = CompressionPolicy()
+        # set by build_from_previous
+        self.previous_release: Optional[GTNHRelease] = None
+        # sort the entries of the archives and fix their timestamps and permissions, see finalize_archive
+        self.deterministic: bool = False
 
         mod_pack = self.modpack_manager.mod_pack
         self.exclusions: Dict[str, Exclusions] = {
@@ -80,14 +89,44 @@ class GenericAssembler:
         :param side: targetted side for the release
         :return: the amount of files
         """
-        modpack_config: GTNHConfig
-        config_version: GTNHVersion
+        return len(self.get_prepared_config(side, self.get_config()))
 
-        modpack_config, config_version = self.get_config()
+    def get_prepared_config(self, side: Side, config: Tuple[GTNHConfig, GTNHVersion]) -> PreparedConfig:
+        """
+        Method to get the entries of the config zip kept for a side, shared with the other assemblers.
+
+        :param side: targetted side for the release
+        :param config: a tuple giving the config object and the version object of the config
+        :return: the prepared config
+        """
+        modpack_config, config_version = config
         config_file: Path = get_asset_version_cache_location(modpack_config, config_version)
+        return prepare_config(config_file, self.exclusions[side])
 
-        with ZipFile(config_file, "r", compression=ZIP_DEFLATED) as config_zip:
-            return len([item for item in config_zip.namelist() if item not in self.exclusions[side]])
+    def add_prepared_config(
+        self,
+        side: Side,
+        config: Tuple[GTNHConfig, GTNHVersion],
+        archive: ZipFile,
+        prefix: str = "",
+        skip: Collection[str] = (),
+    ) -> None:
+        """
+        Method to write the entries of the config zip kept for a side in an archive.
+
+        :param side: target side
+        :param config: a tuple giving the config object and the version object of the config
+        :param archive: archive being built
+        :param prefix: the folder the config goes in, in the archive, ending with a `/`
+        :param skip: names of config entries not to write
+        :return: None
+        """
+
+        def report(item: str) -> None:
+            if self.task_progress_callback is not None:
+                self.task_progress_callback(self.get_progress(), f"adding {item} to the archive")
+
+        self.get_prepared_config(side, config).write(archive, prefix=prefix, skip=skip, callback=report)
 
     def get_amount_of_files_in_locales(self) -> int:
         """
@@ -206,6 +245,89 @@ class GenericAssembler:
         """
         raise NotImplementedError
 
+    def build_from_previous(self, previous_release: GTNHRelease) -> None:
+        """
+        Method to build the archives from the ones of the previous release, found at the same path: the entries of the
+        mods that didn't change since the previous release are copied as they are from the previous archive, and
+        only the new and updated mods are added from the cache.
+
+        :param previous_release: the release the existing archives were built for
+        :return: None
+        """
+        self.previous_release = previous_release
+
+    def get_mods_manifest_path(self, side: Side) -> Path:
+        """
+        Method to get the path to the list of the archive entries added by each mod, kept next to the archive when
+        building from the previous archives.
+
+        :param side: target side
+        :return: the path to the list
+        """
+        archive_path: Path = self.get_archive_path(side)
+        return archive_path.with_name(f"{archive_path.name}.mods.json")
+
+    def add_mods_from_previous(
+        self,
+        side: Side,
+        mods: list[tuple[GTNHModInfo, GTNHVersion]],
+        archive: ZipFile,
+        previous_archive: Optional[ZipFile],
+        verbose: bool = False,
+    ) -> None:
+        """
+        Method to add mods in the zip archive, copying the entries of the unchanged mods from the previous archive,
+        and to record the entries added by each mod for the next build.
+
+        :param side: target side
+        :param mods: target mods
+        :param archive: archive being built
+        :param previous_archive: the archive of the previous release, None to add all the mods from the cache
+        :param verbose: flag to turn on verbose mode
+        :return: None
+        """
+        assert self.previous_release is not None
+        previous_manifest: Dict[str, Any] = {}
+        changed_mods: Set[str] = set()
+        if previous_archive is not None:
+            previous_manifest = orjson.loads(self.get_mods_manifest_path(side).read_bytes())
+            changed_mods = self.modpack_manager.get_changed_mods(
+                self.release, self.previous_release
+            ) | self.modpack_manager.get_new_mods(self.release, self.previous_release)
+
+        manifest: Dict[str, Any] = {}
+        reused = 0
+        for mod, version in mods:
+            previous = previous_manifest.get(mod.name)
+            if (
+                previous_archive is not None
+                and previous is not None
+                and mod.name not in changed_mods
+                and previous["version"] == version.version_tag
+                and all(entry in previous_archive.NameToInfo for entry in previous["entries"])
+            ):
+                for entry in previous["entries"]:
+                    info = previous_archive.getinfo(entry)
+                    copy_zip_entry(previous_archive, info, archive)
+                reused += 1
+                if self.task_progress_callback is not None:
+                    self.task_progress_callback(
+                        self.get_progress(), f"reusing mod {mod.name} : version {version.version_tag}"
+                    )
+                entries = previous["entries"]
+            else:
+                added_from = len(archive.filelist)
+                self.add_mods(side, [(mod, version)], archive, verbose=verbose)
+                entries = [info.filename for info in archive.filelist[added_from:]]
+            manifest[mod.name] = {"version": version.version_tag, "entries": entries}
+
+        if previous_archive is not None:
+            log.info(
+                f"Reused {Fore.GREEN}{reused}{Fore.RESET} unchanged mod(s) from the previous archive, added "
+                f"{Fore.YELLOW}{len(mods) - reused}{Fore.RESET}"
+            )
+        atomic_write(self.get_mods_manifest_path(side), orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+
     def add_config(
         self, side: Side, config: Tuple[GTNHConfig, GTNHVersion], archive: ZipFile, verbose: bool = False
     ) -> None:
@@ -232,6 +354,14 @@ class GenericAssembler:
             raise Exception(f"Can only assemble release for CLIENT or SERVER, not {side}")
 
         archive_name: Path = self.get_archive_path(side)
+        previous_archive_name: Path = archive_name.with_name(f"{archive_name.name}.previous")
+
+        if self.previous_release is not None:
+            if os.path.exists(archive_name) and os.path.exists(self.get_mods_manifest_path(side)):
+                os.replace(archive_name, previous_archive_name)
+                log.info(f"Building {Fore.YELLOW}'{archive_name}'{Fore.RESET} from the previous archive")
+            else:
+                log.warn(f"No previous archive with its list of mods for {side}, building it from scratch")
 
         # deleting any existing archive
         if os.path.exists(archive_name):
@@ -240,14 +370,29 @@ class GenericAssembler:
 
         log.info(f"Constructing {Fore.YELLOW}{side}{Fore.RESET} archive at {Fore.YELLOW}'{archive_name}'{Fore.RESET}")
 
-        with ZipFile(self.get_archive_path(side), "w", compression=ZIP_DEFLATED) as archive:
-            log.info("Adding mods to the archive")
-            self.add_mods(side, self.get_mods(side), archive, verbose=verbose)
-            log.info("Adding config to the archive")
-            self.add_config(side, self.get_config(), archive, verbose=verbose)
-            log.info("Generating the readme for the modpack repo")
-            self.generate_readme()
-            log.info("Archive created successfully!")
+        try:
+            with ZipFile(self.get_archive_path(side), "w", compression=ZIP_DEFLATED) as archive:
+                log.info("Adding mods to the archive")
+                if self.previous_release is None:
+                    self.add_mods(side, self.get_mods(side), archive, verbose=verbose)
+                elif os.path.exists(previous_archive_name):
+                    with ZipFile(previous_archive_name, "r") as previous_archive:
+                        self.add_mods_from_previous(side, self.get_mods(side), archive, previous_archive, verbose)
+                else:
+                    self.add_mods_from_previous(side, self.get_mods(side), archive, None, verbose)
+                log.info("Adding config to the archive")
+                self.add_config(side, self.get_config(), archive, verbose=verbose)
+                log.info("Generating the readme for the modpack repo")
+                self.generate_readme()
+                log.info("Archive created successfully!")
+        except BaseException:
+            # the list of mods doesn't describe a complete archive, the next build starts from scratch
+            if os.path.exists(self.get_mods_manifest_path(side)):
+                os.remove(self.get_mods_manifest_path(side))
+            raise
+        finally:
+            if os.path.exists(previous_archive_name):
+                os.remove(previous_archive_name)
 
     def get_archive_path(self, side: Side) -> Path:
         """
@@ -257,6 +402,19 @@ class GenericAssembler:
         """
         raise NotImplementedError
 
+    def finalize_archive(self, archive_path: Path) -> None:
+        """
+        Method called on each archive once it's complete. In deterministic mode, the archive is rewritten with its
+        entries sorted and their timestamps and permissions fixed, so that building the same release twice gives the
+        same bytes.
+
+        :param archive_path: the path to the archive
+        :return: None
+        """
+        if self.deterministic:
+            log.info(f"Normalizing {Fore.YELLOW}'{archive_path}'{Fore.RESET}")
+            normalize_archive(archive_path, deterministic_date_time())
+
     def add_changelog(self, archive: ZipFile, arcname: Optional[Path] = None) -> None:
         """
         Method to add the changelog to the archive.
@@ -289,8 +447,8 @@ class GenericAssembler:
             mod_list: str = self.generate_modlist()
 
             data = data.format(version, release_date, mod_list)
-            with open(RELEASE_README_DIR / f"README_{self.release.version}.MD", "w") as readme:
-                readme.write(data)
+            # every archive writes the same readme, possibly at the same time when they're assembled in parallel
+            atomic_write(RELEASE_README_DIR / f"README_{self.release.version}.MD", data.encode())
 
     def generate_modlist(self) -> str:
         """
@@ -338,19 +496,17 @@ class GenericAssembler:
             list_of_files = archive.namelist()
             with ZipFile(locale_zip_path, "r", compression=ZIP_DEFLATED) as locale_zip:
                 for item in locale_zip.namelist():
-                    with locale_zip.open(item) as config_item:
-                        item_path = item if root_path is None else f"{root_path}/{item}"
-                        if item_path in list_of_files:
-                            if item_path[-1] != "/":  # not reporting folders as collisions
-                                log.error(
-                                    f"{item_path} from locale {language.filename.split('-')[1]}"  # type: ignore
-                                    " would overwrite the same file in the archive, skipping it."
-                                )
-                            continue
-                        with archive.open(item_path, "w") as target:
-                            shutil.copyfileobj(config_item, target)
-                            if self.task_progress_callback is not None:
-                                self.task_progress_callback(
-                                    self.get_progress(),
-                                    f"locale {locale_zip_path.name.split('-')[1]}: adding {item} to the archive",
-                                )
+                    item_path = item if root_path is None else f"{root_path}/{item}"
+                    if item_path in list_of_files:
+                        if item_path[-1] != "/":  # not reporting folders as collisions
+                            log.error(
+                                f"{item_path} from locale {language.filename.split('-')[1]}"  # type: ignore
+                                " would overwrite the same file in the archive, skipping it."
+                            )
+                        continue
+                    copy_zip_entry(locale_zip, item, archive, item_path)
+                    if self.task_progress_callback is not None:
+                        self.task_progress_callback(
+                            self.get_progress(),
+                            f"locale {locale_zip_path.name.split('-')[1]}: adding {item} to the archive",
+                        )
@@ -5,6 +5,7 @@ from zipfile import ZIP_DEFLATED, ZipFile
 
 from gtnh.assembler.downloader import get_asset_version_cache_location
 from gtnh.assembler.generic_assembler import GenericAssembler
+from gtnh.assembler.zip_utils import copy_zip_entry
 from gtnh.defs import JAVA_9_ARCHIVE_SUFFIX, MMC_ASSETS_DIR, MMC_PACK_INSTANCE, MMC_PACK_JSON, RELEASE_MMC_DIR, Side
 from gtnh.models.gtnh_config import GTNHConfig
 from gtnh.models.gtnh_release import GTNHRelease
@@ -57,15 +58,13 @@ class MMCAssembler(GenericAssembler):
         for mod, version in mods:
             source_file: Path = get_asset_version_cache_location(mod, version)
             archive_path: Path = self.mmc_modpack_mods / source_file.name
-            archive.write(source_file, arcname=archive_path)
+            self.compression.write(archive, source_file, archive_path)
             for extra_asset in version.extra_assets:
                 if extra_asset.filename is not None and extra_asset.filename.endswith("multimc.zip"):
                     extra_asset_path: Path = get_asset_version_cache_location(mod, version, extra_asset.filename)
                     with ZipFile(extra_asset_path, "r", compression=ZIP_DEFLATED) as mmc_patches_zip:
                         for item in mmc_patches_zip.namelist():
-                            with mmc_patches_zip.open(item, "r") as mmc_patch:
-                                with archive.open(str(self.mmc_archive_root) + "/" + item, "w") as target:
-                                    shutil.copyfileobj(mmc_patch, target)
+                            copy_zip_entry(mmc_patches_zip, item, archive, str(self.mmc_archive_root) + "/" + item)
             if self.task_progress_callback is not None:
                 self.task_progress_callback(
                     self.get_progress(), f"adding mod {mod.name} : version {version.version_tag} to the archive"
@@ -74,28 +73,9 @@ class MMCAssembler(GenericAssembler):
     def add_config(
         self, side: Side, config: Tuple[GTNHConfig, GTNHVersion], archive: ZipFile, verbose: bool = False
     ) -> None:
-        modpack_config: GTNHConfig
-        config_version: Optional[GTNHVersion]
-        modpack_config, config_version = config
-
-        config_file: Path = get_asset_version_cache_location(modpack_config, config_version)
-
-        with ZipFile(config_file, "r", compression=ZIP_DEFLATED) as config_zip:
-
-            for item in config_zip.namelist():
-                if item in self.exclusions[side]:
-                    continue
-                with config_zip.open(item) as config_item:
-                    with archive.open(
-                        str(self.mmc_modpack_files) + "/" + item, "w"
-                    ) as target:  # can't use Path for the whole
-                        # path here as it strips leading / but those are used by
-                        # zipfile to know if it's a file or a folder. If used here,
-                        # Path objects will lead to the creation of empty files for
-                        # every folder.
-                        shutil.copyfileobj(config_item, target)
-                        if self.task_progress_callback is not None:
-                            self.task_progress_callback(self.get_progress(), f"adding {item} to the archive")
+        # can't use Path for the whole path here as it strips leading / but those are used by zipfile to know if it's a
+        # file or a folder. If used here, Path objects will lead to the creation of empty files for every folder.
+        self.add_prepared_config(side, config, archive, prefix=str(self.mmc_modpack_files) + "/")
         assert self.changelog_path
         self.add_changelog(archive, arcname=self.mmc_modpack_files / self.changelog_path.name)
 
@@ -126,6 +106,7 @@ class MMCAssembler(GenericAssembler):
             # on windows
 
         self.add_mmc_meta_data(side)
+        self.finalize_archive(self.get_archive_path(side))
 
     def add_mmc_meta_data(self, side: Side) -> None:
         """
@@ -143,6 +124,6 @@ class MMCAssembler(GenericAssembler):
             archive.writestr(
                 str(self.mmc_archive_root) + "/instance.cfg", MMC_PACK_INSTANCE.format(f"GTNH {self.release.version}")
             )
-            with archive.open(str(self.mmc_archive_root) + "/gtnh_icon.png", "w") as target:
+            with self.compression.open(archive, str(self.mmc_archive_root) + "/gtnh_icon.png") as target:
                 with open(MMC_ASSETS_DIR / "gtnh_icon.png", "rb") as icon:
                     shutil.copyfileobj(icon, target)
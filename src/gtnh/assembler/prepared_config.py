@@ -0,0 +1,79 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Collection, List, Optional, Tuple
+from zipfile import ZipFile, ZipInfo
+
+from gtnh.assembler.exclusions import Exclusions
+from gtnh.assembler.zip_utils import read_raw_entry, write_raw_entry
+from gtnh.gtnh_logger import get_logger
+
+log = get_logger(__name__)
+
+
+class PreparedConfig:
+    """
+    The entries of a config zip kept for a side, with their compressed data: the config zip is read once, filtered
+    once per side, and its entries are then written as they are in every archive of the side.
+    """
+
+    def __init__(self, entries: List[Tuple[ZipInfo, bytes]]) -> None:
+        """
+        Constructor of the PreparedConfig class.
+
+        :param entries: the entries, with their compressed data
+        """
+        self.entries = entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def write(
+        self,
+        archive: ZipFile,
+        prefix: str = "",
+        skip: Collection[str] = (),
+        callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Write the entries in an archive.
+
+        :param archive: the archive, opened for writing
+        :param prefix: the folder the entries go in, in the archive, ending with a `/`
+        :param skip: names of entries not to write
+        :param callback: called with the name of each entry written
+        :return: None
+        """
+        for info, data in self.entries:
+            if info.filename in skip:
+                continue
+            write_raw_entry(archive, info, [data], prefix + info.filename)
+            if callback is not None:
+                callback(info.filename)
+
+
+@lru_cache(maxsize=2)
+def _read_config(config_file: Path, mtime_ns: int, size: int) -> List[Tuple[ZipInfo, bytes]]:
+    log.debug(f"Reading config zip {config_file}")
+    with ZipFile(config_file, "r") as config_zip:
+        return [(info, read_raw_entry(config_zip, info)) for info in config_zip.infolist()]
+
+
+@lru_cache(maxsize=8)
+def _filter_config(config_file: Path, mtime_ns: int, size: int, exclusions: Tuple[str, ...]) -> PreparedConfig:
+    excluded = Exclusions(list(exclusions))
+    # the data of the entries is shared between the sides
+    entries = _read_config(config_file, mtime_ns, size)
+    return PreparedConfig([(info, data) for info, data in entries if info.filename not in excluded])
+
+
+def prepare_config(config_file: Path, exclusions: Exclusions) -> PreparedConfig:
+    """
+    Get the entries of a config zip that aren't excluded. The result is cached as long as the config zip doesn't change,
+    for all the assemblers of the process.
+
+    :param config_file: the config zip
+    :param exclusions: the exclusions of the side
+    :return: the prepared config
+    """
+    stat = config_file.stat()
+    return _filter_config(config_file, stat.st_mtime_ns, stat.st_size, tuple(exclusions.exclusions))
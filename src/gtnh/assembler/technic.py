@@ -1,6 +1,5 @@
 import os
 import re
-import shutil
 from enum import Enum
 from pathlib import Path
 from typing import Callable, List, Optional, Set, Tuple
@@ -114,6 +113,7 @@ class TechnicAssembler(GenericAssembler):
             log.info("Generating the readme for the modpack repo")
             self.generate_readme()
             log.info("Archive created successfully!")
+        self.finalize_archive(updated_mods_archive_name)
 
         log.info(
             f"Constructing {Fore.YELLOW}{side}{Fore.RESET} archive at {Fore.YELLOW}'{new_mods_archive_name}'{Fore.RESET}"
@@ -125,6 +125,7 @@ class TechnicAssembler(GenericAssembler):
                 side, self.differential_update(side, DifferentialUpdateMode.NEW_MODS), archive, verbose=verbose
             )
             log.info("Archive created successfully!")
+        self.finalize_archive(new_mods_archive_name)
 
         with open(removed_modlist_name, "w") as file:
             log.info("generating removed modlist")
@@ -194,9 +195,11 @@ class TechnicAssembler(GenericAssembler):
 
             # set up temp zip
             with ZipFile(temp_zip_path, "w", compression=ZIP_DEFLATED) as temp_zip:
-                temp_zip.write(source_file, arcname=archive_path)
+                self.compression.write(temp_zip, source_file, archive_path)
+            self.finalize_archive(temp_zip_path)
 
-            archive.write(
+            self.compression.write(
+                archive,
                 temp_zip_path,
                 arcname=(f"mods/{technify(mod.name)}/{technify(mod.name)}" f"-{technify(version.version_tag)}.zip"),
             )
@@ -218,40 +221,23 @@ class TechnicAssembler(GenericAssembler):
         config_version: Optional[GTNHVersion]
         modpack_config, config_version = config
 
-        config_file: Path = get_asset_version_cache_location(modpack_config, config_version)
-
         temp_zip_path: Path = Path("./temp.zip")
 
         # set up a temp zip
         with ZipFile(Path("./temp.zip"), "w", compression=ZIP_DEFLATED) as temp_zip:
 
-            # reading the config files
-            with ZipFile(config_file, "r", compression=ZIP_DEFLATED) as config_zip:
-
-                for item in config_zip.namelist():
-                    # excluding files
-                    if item in self.exclusions[side]:
-                        continue
-
-                    # reading the file
-                    with config_zip.open(item) as config_item:
-
-                        # creating a new file in the temp zip
-                        with temp_zip.open(item, "w") as target:
-
-                            # copying the file
-                            shutil.copyfileobj(config_item, target)
-
-                            if self.task_progress_callback is not None:
-                                self.task_progress_callback(self.get_progress(), f"adding {item} to the archive")
+            # copying the config files kept for the side
+            self.add_prepared_config(side, config, temp_zip)
 
             # adding the locales
             self.add_localisation_files(temp_zip)
 
             self.add_changelog(temp_zip)
+        self.finalize_archive(temp_zip_path)
 
         # writing the config zip in the technic archive
-        archive.write(
+        self.compression.write(
+            archive,
             temp_zip_path,
             arcname=(
                 f"mods/{technify(modpack_config.name)}/{technify(modpack_config.name)}"
@@ -288,6 +274,7 @@ class TechnicAssembler(GenericAssembler):
             )
         )
         await GenericAssembler.assemble(self, side, verbose)
+        self.finalize_archive(self.get_archive_path(side))
 
         log.info(f"packing partial technic launcher release for {self.release.version}")
         await self.partial_assemble(side, verbose)
@@ -1,4 +1,3 @@
-import shutil
 from pathlib import Path
 from typing import Callable, List, Optional, Tuple
 from zipfile import ZIP_DEFLATED, ZipFile
@@ -57,7 +56,7 @@ class ZipAssembler(GenericAssembler):
         for mod, version in mods:
             source_file: Path = get_asset_version_cache_location(mod, version)
             archive_path: Path = Path("mods") / source_file.name
-            archive.write(source_file, arcname=archive_path)
+            self.compression.write(archive, source_file, archive_path)
             if side.is_server():
                 for extra_asset in version.extra_assets:
                     if extra_asset.filename is not None:
@@ -65,7 +64,7 @@ class ZipAssembler(GenericAssembler):
                             extra_asset_path: Path = get_asset_version_cache_location(
                                 mod, version, extra_asset.filename
                             )
-                            archive.write(extra_asset_path, arcname=f"{mod.name}-forgePatches.jar")
+                            self.compression.write(archive, extra_asset_path, f"{mod.name}-forgePatches.jar")
             if self.task_progress_callback is not None:
                 self.task_progress_callback(
                     self.get_progress(), f"adding mod {mod.name} : version {version.version_tag} to the archive"
@@ -75,7 +74,7 @@ class ZipAssembler(GenericAssembler):
         assets = self.get_server_assets(server_brand, side)
 
         for asset in assets:
-            archive.write(asset, arcname=asset.relative_to(SERVER_ASSETS_DIR / server_brand.value))
+            self.compression.write(archive, asset, asset.relative_to(SERVER_ASSETS_DIR / server_brand.value))
             if self.task_progress_callback is not None:
                 self.task_progress_callback(self.get_progress(), f"adding server asset {asset.name} to the archive")
 
@@ -85,23 +84,8 @@ class ZipAssembler(GenericAssembler):
     def add_config(
         self, side: Side, config: Tuple[GTNHConfig, GTNHVersion], archive: ZipFile, verbose: bool = False
     ) -> None:
-        modpack_config: GTNHConfig
-        config_version: Optional[GTNHVersion]
-        modpack_config, config_version = config
-
-        config_file: Path = get_asset_version_cache_location(modpack_config, config_version)
-
-        with ZipFile(config_file, "r", compression=ZIP_DEFLATED) as config_zip:
-
-            for item in [x for x in config_zip.namelist() if x != "server.properties"]:  # little hack to remove the
-                # server.properties file from old releases
-                if item in self.exclusions[side]:
-                    continue
-                with config_zip.open(item) as config_item:
-                    with archive.open(item, "w") as target:
-                        shutil.copyfileobj(config_item, target)
-                        if self.task_progress_callback is not None:
-                            self.task_progress_callback(self.get_progress(), f"adding {item} to the archive")
+        # little hack to remove the server.properties file from old releases
+        self.add_prepared_config(side, config, archive, skip={"server.properties"})
 
         self.add_changelog(archive)
 
@@ -139,6 +123,8 @@ class ZipAssembler(GenericAssembler):
             with ZipFile(self.get_archive_path(side), "a", compression=ZIP_DEFLATED) as archive:
                 self.add_localisation_files(archive)
 
+        self.finalize_archive(self.get_archive_path(side))
+
     def get_server_assets(self, server_brand: ServerBrand, side: Side) -> List[Path]:
         """
         return the list of Path objects corresponding to the server brand's assets.
@@ -0,0 +1,170 @@
+import os
+import shutil
+import struct
+import time
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator, Tuple
+from zipfile import ZIP64_LIMIT, LargeZipFile, ZipFile, ZipInfo
+
+from gtnh.defs import DOWNLOAD_CHUNK_SIZE
+
+LOCAL_FILE_HEADER_SIGNATURE = b"PK\x03\x04"
+LOCAL_FILE_HEADER_SIZE = 30
+
+FLAG_ENCRYPTED = 0x01
+FLAG_DATA_DESCRIPTOR = 0x08
+
+# Zip timestamps can't go before 1980
+ZIP_EPOCH = 315532800
+CREATE_SYSTEM_UNIX = 3
+DETERMINISTIC_FILE_ATTR = 0o100644 << 16
+DETERMINISTIC_DIR_ATTR = 0o40755 << 16 | 0x10  # 0x10: MS-DOS directory flag
+
+
+def _raw_data(source: ZipFile, info: ZipInfo) -> IO[bytes]:
+    """
+    Position the file of an archive at the compressed data of an entry.
+
+    :param source: the archive
+    :param info: the entry
+    :return: the file of the archive, ready to read the info.compress_size bytes of the entry
+    """
+    assert source.fp is not None
+    source.fp.seek(info.header_offset)
+    header = source.fp.read(LOCAL_FILE_HEADER_SIZE)
+    if len(header) != LOCAL_FILE_HEADER_SIZE or header[:4] != LOCAL_FILE_HEADER_SIGNATURE:
+        raise ValueError(f"Bad local file header for {info.filename} in {source.filename}")
+    # the local header's name and extra field can differ from the central directory's ones, so they're skipped
+    # using the lengths of the local header
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    source.fp.seek(name_length + extra_length, 1)
+    return source.fp
+
+
+def _raw_chunks(source: ZipFile, info: ZipInfo) -> Iterator[bytes]:
+    data = _raw_data(source, info)
+    remaining = info.compress_size
+    while remaining > 0:
+        chunk = data.read(min(remaining, DOWNLOAD_CHUNK_SIZE))
+        if not chunk:
+            raise EOFError(f"Truncated data for {info.filename} in {source.filename}")
+        yield chunk
+        remaining -= len(chunk)
+
+
+def read_raw_entry(source: ZipFile, info: ZipInfo) -> bytes:
+    """
+    Read the compressed data of an entry, to be written later with `write_raw_entry`.
+
+    :param source: the archive
+    :param info: the entry, which must not be encrypted
+    :return: the compressed data
+    """
+    if info.flag_bits & FLAG_ENCRYPTED:
+        raise ValueError(f"Can't read the raw data of the encrypted entry {info.filename} in {source.filename}")
+    return b"".join(_raw_chunks(source, info))
+
+
+def write_raw_entry(target: ZipFile, info: ZipInfo, data: Iterable[bytes], arcname: str | None = None) -> None:
+    """
+    Write an entry whose data is already compressed, behind a new local header carrying its new name.
+
+    :param target: the archive to write the entry to, opened for writing
+    :param info: the entry, as read from its source archive
+    :param data: the compressed data of the entry, in chunks
+    :param arcname: the name of the entry in the target archive, defaults to its name in the source archive
+    :return: None
+    """
+    copied = ZipInfo(info.filename if arcname is None else arcname, date_time=info.date_time)
+    copied.compress_type = info.compress_type
+    copied.create_system = info.create_system
+    copied.external_attr = info.external_attr
+    copied.internal_attr = info.internal_attr
+    # CRC and sizes are known up front, they go in the local header instead of a data descriptor
+    copied.flag_bits = info.flag_bits & ~FLAG_DATA_DESCRIPTOR
+    copied.CRC = info.CRC
+    copied.compress_size = info.compress_size
+    copied.file_size = info.file_size
+
+    # the writing state of ZipFile is private, and not in its stubs
+    writer: Any = target
+    zip64 = copied.file_size > ZIP64_LIMIT or copied.compress_size > ZIP64_LIMIT
+    if zip64 and not writer._allowZip64:
+        raise LargeZipFile("Filesize would require ZIP64 extensions")
+
+    # Mirrors what ZipFile does when an entry is opened for writing and closed
+    with writer._lock:
+        if writer._writing:
+            raise ValueError("Can't write to the ZIP file while there is another write handle open on it.")
+        assert target.fp is not None
+        if writer._seekable:
+            target.fp.seek(target.start_dir)
+        copied.header_offset = target.fp.tell()
+        writer._writecheck(copied)
+        writer._didModify = True
+        target.fp.write(copied.FileHeader(zip64))
+        for chunk in data:
+            target.fp.write(chunk)
+        target.start_dir = target.fp.tell()
+        target.filelist.append(copied)
+        target.NameToInfo[copied.filename] = copied
+
+
+def copy_zip_entry(source: ZipFile, entry: str | ZipInfo, target: ZipFile, arcname: str | None = None) -> None:
+    """
+    Copy an entry from an archive to another without decompressing it: the compressed data is transferred byte for
+    byte, behind a new local header carrying the new name. Encrypted entries are decompressed and compressed again.
+
+    :param source: the archive to read the entry from
+    :param entry: the entry, or its name
+    :param target: the archive to write the entry to, opened for writing
+    :param arcname: the name of the entry in the target archive, defaults to its name in the source archive
+    :return: None
+    """
+    info = entry if isinstance(entry, ZipInfo) else source.getinfo(entry)
+    arcname = info.filename if arcname is None else arcname
+
+    if info.flag_bits & FLAG_ENCRYPTED:
+        with source.open(info) as source_item, target.open(arcname, "w") as target_item:
+            shutil.copyfileobj(source_item, target_item)
+        return
+
+    write_raw_entry(target, info, _raw_chunks(source, info), arcname)
+
+
+def deterministic_date_time() -> Tuple[int, int, int, int, int, int]:
+    """
+    Get the timestamp given to all the entries of the deterministic archives: the one of SOURCE_DATE_EPOCH if it's set,
+    following the reproducible builds convention, the earliest zip timestamp otherwise.
+
+    :return: the timestamp, as a ZipInfo date_time
+    """
+    epoch = max(int(os.environ.get("SOURCE_DATE_EPOCH", ZIP_EPOCH)), ZIP_EPOCH)
+    year, month, day, hour, minute, second = time.gmtime(epoch)[:6]
+    return year, month, day, hour, minute, second
+
+
+def normalize_archive(path: Path, date_time: Tuple[int, int, int, int, int, int]) -> None:
+    """
+    Rewrite an archive so that its bytes only depend on the content of its entries: the entries are sorted by name,
+    and their timestamps, permissions and extra fields are fixed. The compressed data is copied as is.
+
+    :param path: the archive
+    :param date_time: the timestamp of all the entries
+    :return: None
+    """
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with ZipFile(path, "r") as source, ZipFile(temp_path, "w") as target:
+        for info in sorted(source.infolist(), key=lambda entry: entry.filename):
+            if info.flag_bits & FLAG_ENCRYPTED:
+                raise ValueError(f"Can't normalize the encrypted entry {info.filename} of {path}")
+            normalized = ZipInfo(info.filename, date_time=date_time)
+            normalized.compress_type = info.compress_type
+            normalized.create_system = CREATE_SYSTEM_UNIX
+            normalized.external_attr = DETERMINISTIC_DIR_ATTR if info.is_dir() else DETERMINISTIC_FILE_ATTR
+            normalized.flag_bits = info.flag_bits
+            normalized.CRC = info.CRC
+            normalized.compress_size = info.compress_size
+            normalized.file_size = info.file_size
+            write_raw_entry(target, normalized, _raw_chunks(source, info))
+    os.replace(temp_path, path)
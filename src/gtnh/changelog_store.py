@@ -0,0 +1,76 @@
+import gzip
+from pathlib import Path
+from typing import Dict, Set
+
+import orjson
+
+from gtnh.assembler.downloader import sanitize
+from gtnh.gtnh_logger import get_logger
+from gtnh.utils import atomic_write
+
+log = get_logger(__name__)
+
+
+class ChangelogStore:
+    """
+    Release notes of the assets, kept out of the assets manifest: one gzipped json file per asset mapping each version
+    tag to its changelog, only read when a changelog is generated.
+    """
+
+    def __init__(self, root: Path) -> None:
+        """
+        Constructor of the ChangelogStore class.
+
+        :param root: the folder holding the changelog files
+        """
+        self.root = root
+        self._changelogs: Dict[str, Dict[str, str]] = {}
+        self._dirty: Set[str] = set()
+
+    def _path(self, asset_name: str) -> Path:
+        return self.root / f"{sanitize(asset_name)}.json.gz"
+
+    def _load(self, asset_name: str) -> Dict[str, str]:
+        if asset_name not in self._changelogs:
+            path = self._path(asset_name)
+            self._changelogs[asset_name] = orjson.loads(gzip.decompress(path.read_bytes())) if path.exists() else {}
+        return self._changelogs[asset_name]
+
+    def get(self, asset_name: str, version_tag: str) -> str:
+        """
+        Get the changelog of a version.
+
+        :param asset_name: the name of the asset
+        :param version_tag: the version
+        :return: the changelog, empty if there is none
+        """
+        return self._load(asset_name).get(version_tag, "")
+
+    def set(self, asset_name: str, version_tag: str, changelog: str) -> None:
+        """
+        Set the changelog of a version; it's written on the next `save`.
+
+        :param asset_name: the name of the asset
+        :param version_tag: the version
+        :param changelog: the changelog
+        :return: None
+        """
+        changelogs = self._load(asset_name)
+        if changelogs.get(version_tag) != changelog:
+            changelogs[version_tag] = changelog
+            self._dirty.add(asset_name)
+
+    def save(self) -> None:
+        """
+        Write the changelogs of the assets that changed since the last save.
+
+        :return: None
+        """
+        for asset_name in sorted(self._dirty):
+            log.debug(f"Saving changelogs of {asset_name}")
+            # mtime=0 keeps the files identical as long as their content is, so they don't churn under version control
+            data = gzip.compress(
+                orjson.dumps(self._changelogs[asset_name], option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2), mtime=0
+            )
+            atomic_write(self._path(asset_name), data)
+        self._dirty.clear()
@@ -3,7 +3,7 @@ from colorama import Fore
 from httpx import AsyncClient
 
 from gtnh.assembler.assembler import ReleaseAssembler
-from gtnh.defs import Side
+from gtnh.defs import Archive, Side
 from gtnh.gtnh_logger import get_logger
 from gtnh.modpack_manager import GTNHModpackManager
 
@@ -12,7 +12,22 @@ log = get_logger(__name__)
 
 @click.command()
 @click.option("--verbose", default=False, is_flag=True)
-async def assemble_nightly(verbose: bool) -> None:
+@click.option(
+    "--delta",
+    default=False,
+    is_flag=True,
+    help="Build the archives from the previous nightly ones, only adding the mods that changed since then",
+)
+@click.option(
+    "--parallel", default=False, is_flag=True, help="Assemble the archives concurrently in separate processes"
+)
+@click.option(
+    "--deterministic",
+    default=False,
+    is_flag=True,
+    help="Sort the archive entries and fix their timestamps (SOURCE_DATE_EPOCH if set) and permissions",
+)
+async def assemble_nightly(verbose: bool, delta: bool, parallel: bool, deterministic: bool) -> None:
     release_name = "nightly"
     modpack_manager = GTNHModpackManager(AsyncClient(http2=True))
     release = modpack_manager.get_release(release_name)
@@ -25,12 +40,31 @@ async def assemble_nightly(verbose: bool) -> None:
     await modpack_manager.download_release(
         release,
     )
+    # Keep the size/sha256 recorded for the downloaded files, so unchanged translations are reused by the next nightly
+    modpack_manager.save_assets()
 
-    assembler = ReleaseAssembler(modpack_manager, release)
-    await assembler.assemble_zip(Side.SERVER_JAVA9, verbose=verbose)
-    await assembler.assemble_zip(Side.SERVER, verbose=verbose)
-    await assembler.assemble_mmc(Side.CLIENT, verbose=verbose)
-    await assembler.assemble_mmc(Side.CLIENT_JAVA9, verbose=verbose)
+    assembler = ReleaseAssembler(modpack_manager, release, deterministic=deterministic)
+    if delta:
+        previous_release = modpack_manager.get_release(release.last_version) if release.last_version else None
+        if previous_release is None:
+            log.warn(f"Previous nightly `{release.last_version}` not found, building the archives from scratch")
+        else:
+            assembler.build_from_previous(previous_release)
+    if parallel:
+        await assembler.assemble_parallel(
+            [
+                (Side.SERVER_JAVA9, Archive.ZIP),
+                (Side.SERVER, Archive.ZIP),
+                (Side.CLIENT, Archive.MMC),
+                (Side.CLIENT_JAVA9, Archive.MMC),
+            ],
+            verbose=verbose,
+        )
+    else:
+        await assembler.assemble_zip(Side.SERVER_JAVA9, verbose=verbose)
+        await assembler.assemble_zip(Side.SERVER, verbose=verbose)
+        await assembler.assemble_mmc(Side.CLIENT, verbose=verbose)
+        await assembler.assemble_mmc(Side.CLIENT_JAVA9, verbose=verbose)
 
     modpack_manager.set_last_successful_nightly_id(modpack_manager.get_nightly_count())
 
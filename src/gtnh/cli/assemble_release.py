@@ -14,7 +14,16 @@ log = get_logger(__name__)
 @click.argument("side", type=click.Choice([Side.CLIENT, Side.CLIENT_JAVA9, Side.SERVER, Side.SERVER_JAVA9]))
 @click.argument("release_name")
 @click.option("--verbose", default=False, is_flag=True)
-async def assemble_release(side: Side, release_name: str, verbose: bool) -> None:
+@click.option(
+    "--parallel", default=False, is_flag=True, help="Assemble the archives concurrently in separate processes"
+)
+@click.option(
+    "--deterministic",
+    default=False,
+    is_flag=True,
+    help="Sort the archive entries and fix their timestamps (SOURCE_DATE_EPOCH if set) and permissions",
+)
+async def assemble_release(side: Side, release_name: str, verbose: bool, parallel: bool, deterministic: bool) -> None:
     modpack_manager = GTNHModpackManager(AsyncClient(http2=True))
     release = modpack_manager.get_release(release_name)
     if not release:
@@ -24,7 +33,9 @@ async def assemble_release(side: Side, release_name: str, verbose: bool) -> None
         )
         return
 
-    await ReleaseAssembler(modpack_manager, release).assemble(side, verbose=verbose)
+    await ReleaseAssembler(modpack_manager, release, deterministic=deterministic).assemble(
+        side, verbose=verbose, parallel=parallel
+    )
 
 
 if __name__ == "__main__":
@@ -13,14 +13,16 @@ log = get_logger(__name__)
 @click.argument("version", required=False)
 async def download_mod(mod_name: str, version: str | None = None) -> None:
     async with httpx.AsyncClient(http2=True) as client:
-        m = GTNHModpackManager(client)
+        m = GTNHModpackManager(client, lazy_assets=True)
         log.info(
             f"Trying to Download mod `{Fore.CYAN}{mod_name}{Fore.RESET}:{Fore.YELLOW}{version or '<latest>'}"
             f"{Fore.RESET}`"
         )
         mod = m.assets.get_mod(mod_name)
         if mod is not None:
-            await m.download_asset(mod, version)
+            if await m.download_asset(mod, version):
+                # Keep the size/sha256 recorded for the downloaded files
+                m.save_assets()
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@ import asyncclick as click
 import httpx
 from colorama import Fore
 
+from gtnh.github.scheduler import DEFAULT_CONCURRENCY
 from gtnh.gtnh_logger import get_logger
 from gtnh.modpack_manager import GTNHModpackManager
 
@@ -10,15 +11,24 @@ log = get_logger(__name__)
 
 @click.command()
 @click.argument("release-name")
-async def do_download_release(release_name: str) -> None:
+@click.option(
+    "--concurrency",
+    type=int,
+    default=DEFAULT_CONCURRENCY,
+    show_default=True,
+    help="Maximum amount of concurrent requests to GitHub and maven",
+)
+async def do_download_release(release_name: str, concurrency: int = DEFAULT_CONCURRENCY) -> None:
     async with httpx.AsyncClient(http2=True) as client:
-        m = GTNHModpackManager(client)
+        m = GTNHModpackManager(client, max_concurrency=concurrency)
         release = m.get_release(release_name)
         if release is None:
             log.error(f"Release `{Fore.LIGHTRED_EX}{release_name}{Fore.RESET}` not found!")
             return
 
         await m.download_release(release=release)
+        # Keep the size/sha256 recorded for the downloaded files
+        m.save_assets()
 
 
 if __name__ == "__main__":
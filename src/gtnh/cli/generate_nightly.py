@@ -2,6 +2,7 @@ import asyncclick as click
 import httpx
 
 from gtnh.exceptions import ReleaseNotFoundException
+from gtnh.github.scheduler import DEFAULT_CONCURRENCY
 from gtnh.gtnh_logger import get_logger
 from gtnh.modpack_manager import GTNHModpackManager
 
@@ -11,9 +12,16 @@ log = get_logger(__name__)
 @click.command()
 @click.option("--update-available", default=False, is_flag=True)
 @click.option("--id", "new_id", type=int, help="Set numeric ID for new nightly release")
-async def generate_nightly(update_available: bool, new_id: int) -> None:
+@click.option(
+    "--concurrency",
+    type=int,
+    default=DEFAULT_CONCURRENCY,
+    show_default=True,
+    help="Maximum amount of concurrent requests to GitHub and maven",
+)
+async def generate_nightly(update_available: bool, new_id: int, concurrency: int = DEFAULT_CONCURRENCY) -> None:
     async with httpx.AsyncClient(http2=True) as client:
-        m = GTNHModpackManager(client)
+        m = GTNHModpackManager(client, max_concurrency=concurrency)
         existing_release = m.get_release("nightly")
         if new_id:
             m.set_nightly_id(new_id)
@@ -18,15 +18,16 @@ async def generate_old_changelogs() -> None:
         gh = GitHubAPI(client, "DreamAssemblerXXL", oauth_token=get_github_token())
         log.info("Generating Old Changelogs")
         m = GTNHModpackManager(client)
-        for mod in m.assets.mods:
+        for mod in m.assets.get_mods():
             if mod.source != ModSource.github:
                 continue
             last_version = None
             for version in mod.versions:
-                if "-dev" in version.version_tag or "-pre" in version.version_tag:
+                if ("-dev" in version.version_tag or "-pre" in version.version_tag) and not version.prerelease:
                     version.prerelease = True
+                    mod.mark_dirty()
 
-                if version.changelog:
+                if version.changelog or m.changelogs.get(mod.name, version.version_tag):
                     last_version = version.version_tag
                     continue
                 release_uri = repo_releases_uri(m.org, mod.name)
@@ -52,7 +53,7 @@ async def generate_old_changelogs() -> None:
 
                 if changelog:
                     # Update the local version
-                    version.changelog = changelog
+                    m.changelogs.set(mod.name, version.version_tag, changelog)
 
                     # Update GH
                     if not existing_release.get("body"):
@@ -60,7 +61,7 @@ async def generate_old_changelogs() -> None:
                         await gh.patch(
                             f"{release_uri}/{release_id}",
                             data={
-                                "body": version.changelog,
+                                "body": changelog,
                                 "prerelease": version.prerelease,
                             },
                         )
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+import asyncclick as click
+import httpx
+from colorama import Fore, init
+
+from gtnh.defs import GREEN_CHECK
+from gtnh.gtnh_logger import get_logger
+from gtnh.models.versionable import Versionable
+from gtnh.modpack_manager import GTNHModpackManager
+
+log = get_logger(__name__)
+
+init(autoreset=True)
+
+
+@click.command()
+async def migrate_changelogs() -> None:
+    """
+    Move the changelogs still stored inline in the assets manifest to the changelog store.
+    """
+    async with httpx.AsyncClient(http2=True) as client:
+        m = GTNHModpackManager(client)
+
+        migrated = 0
+        versionables: list[Versionable] = [*m.assets.get_mods(), m.assets.config]
+        for asset in versionables:
+            for version in asset.versions:
+                if "changelog" not in version.__fields_set__:
+                    continue
+                if version.changelog:
+                    m.changelogs.set(asset.name, version.version_tag, version.changelog)
+                    migrated += 1
+                version.changelog = ""
+                # Leave it out of the manifest, as if it was never set
+                version.__fields_set__.discard("changelog")
+                asset.mark_dirty()
+
+        m.save_assets()
+        log.info(f"{GREEN_CHECK} Moved {Fore.GREEN}{migrated}{Fore.RESET} changelog(s) to the changelog store")
+
+
+if __name__ == "__main__":
+    migrate_changelogs()
@@ -22,7 +22,7 @@ async def remove_version(mod_name: str, version_tag: str) -> None:
     async with httpx.AsyncClient(http2=True) as client:
         log.info(f"Attemting to remove {version_tag} from {mod_name}")
 
-        m = GTNHModpackManager(client)
+        m = GTNHModpackManager(client, lazy_assets=True)
 
         mod = m.assets.get_mod(mod_name)
         if not mod:
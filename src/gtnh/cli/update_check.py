@@ -3,6 +3,7 @@ import asyncclick as click
 import httpx
 from colorama import Fore, Style, init
 
+from gtnh.github.scheduler import DEFAULT_CONCURRENCY
 from gtnh.gtnh_logger import get_logger
 from gtnh.modpack_manager import GTNHModpackManager
 
@@ -16,20 +17,32 @@ class NoReleasesException(Exception):
 
 
 @click.option("--mods", is_flag=False, metavar="<mods>", type=click.types.STRING)
+@click.option(
+    "--graphql", "use_graphql", is_flag=True, help="Fetch latest releases in batched GraphQL queries instead of REST"
+)
+@click.option(
+    "--concurrency",
+    type=int,
+    default=DEFAULT_CONCURRENCY,
+    show_default=True,
+    help="Maximum amount of concurrent requests to GitHub and maven",
+)
 @click.command()
-async def update_check(mods: str | None = None) -> None:
+async def update_check(
+    mods: str | None = None, use_graphql: bool = False, concurrency: int = DEFAULT_CONCURRENCY
+) -> None:
     async with httpx.AsyncClient(http2=True) as client:
         mods_to_update = [m.strip() for m in mods.split(",")] if mods else None
         if mods_to_update:
             log.info(f"Attemting to update mod(s): `{mods_to_update}`")
 
-        m = GTNHModpackManager(client)
+        m = GTNHModpackManager(client, max_concurrency=concurrency)
 
         log.info("Grabbing all repository information...")
         # Things get cached here
         await m.get_all_repos()
         log.info("Updating things...")
-        await m.update_all(mods_to_update)
+        await m.update_all(mods_to_update, use_graphql=use_graphql)
 
         missing_repos = await m.get_missing_repos()
         if len(missing_repos):
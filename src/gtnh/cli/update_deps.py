@@ -45,7 +45,7 @@ async def find_and_update_deps() -> None:
         log.error(f"ERROR: Unable to locate {DEP_FILE} in the current directory")
         return
     async with httpx.AsyncClient(http2=True) as client:
-        m = GTNHModpackManager(client)
+        m = GTNHModpackManager(client, lazy_assets=True)
 
     with InPlace(DEP_FILE) as fp:
         for line in fp:
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+import os
+from pathlib import Path
+from typing import Iterator, Tuple
+
+import asyncclick as click
+import httpx
+from colorama import Fore, init
+
+from gtnh.assembler.content_store import add_to_store, file_sha256
+from gtnh.assembler.downloader import get_asset_version_cache_location
+from gtnh.defs import GREEN_CHECK, RED_CROSS
+from gtnh.gtnh_logger import get_logger
+from gtnh.models.available_assets import AvailableAssets
+from gtnh.models.gtnh_version import ExtraAsset, GTNHVersion
+from gtnh.models.versionable import Versionable
+from gtnh.modpack_manager import GTNHModpackManager
+
+log = get_logger(__name__)
+
+init(autoreset=True)
+
+
+def cached_files(assets: AvailableAssets) -> Iterator[Tuple[Versionable, Path, GTNHVersion | ExtraAsset]]:
+    """
+    List the files of the cache that are downloaded from the assets.
+
+    :param assets: the available assets
+    :return: an iterator of (asset, cache location, version or extra asset the file was downloaded from)
+    """
+    versionables: list[Versionable] = [*assets.get_mods(), assets.config, assets.translations]
+    for asset in versionables:
+        for version in asset.versions:
+            if not version.filename:
+                continue
+            yield asset, get_asset_version_cache_location(asset, version), version
+            for extra_asset in version.extra_assets:
+                if extra_asset.filename:
+                    yield asset, get_asset_version_cache_location(asset, version, extra_asset.filename), extra_asset
+
+
+@click.command()
+@click.option("--delete", is_flag=True, help="Delete the cached files that don't match their recorded size/sha256")
+@click.option("--record", is_flag=True, help="Record the size and sha256 of the cached files that have none yet")
+async def verify_cache(delete: bool, record: bool) -> None:
+    async with httpx.AsyncClient(http2=True) as client:
+        m = GTNHModpackManager(client)
+
+        verified = corrupt = unrecorded = 0
+        for asset, path, downloaded in cached_files(m.assets):
+            if not path.is_file():
+                continue
+
+            if downloaded.sha256 is None:
+                unrecorded += 1
+                if record:
+                    downloaded.sha256 = file_sha256(path)
+                    downloaded.size = path.stat().st_size
+                    add_to_store(path, downloaded.sha256)
+                    asset.mark_dirty()
+                continue
+
+            size = path.stat().st_size
+            if (downloaded.size is not None and size != downloaded.size) or file_sha256(path) != downloaded.sha256:
+                corrupt += 1
+                log.error(
+                    f"{RED_CROSS} {Fore.RED}`{Fore.CYAN}{asset.name}{Fore.RED}` cached file `{path}` doesn't match "
+                    f"its recorded size/sha256{Fore.RESET}"
+                )
+                if delete:
+                    os.remove(path)
+                continue
+
+            verified += 1
+            add_to_store(path, downloaded.sha256)
+
+        log.info(
+            f"{GREEN_CHECK} {Fore.GREEN}{verified}{Fore.RESET} file(s) verified, {Fore.RED}{corrupt}{Fore.RESET} "
+            f"corrupt{' (deleted)' if delete and corrupt else ''}, {Fore.YELLOW}{unrecorded}{Fore.RESET} without a "
+            f"recorded sha256{' (recorded)' if record and unrecorded else ''}"
+        )
+
+        if record and unrecorded:
+            m.save_assets()
+
+
+if __name__ == "__main__":
+    verify_cache()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from enum import Enum
 from pathlib import Path
 
@@ -10,6 +11,31 @@ ROOT_DIR = Path(__file__).parent.parent.parent
 CACHE_DIR = ROOT_DIR / "cache"
 TECHNIC_CACHE_DIR = CACHE_DIR / "technic"
 CONFIG_CACHE_DIR = CACHE_DIR / "config"
+GITHUB_CACHE_DIR = CACHE_DIR / "github"
+# Snapshot of the repo listing of the GitHub org, shared by the CLIs and the GUI
+GITHUB_REPOS_SNAPSHOT = CACHE_DIR / "github_org_repos.json"
+# Under this age, in seconds, the snapshot is used as is; over it, the recently pushed repos are fetched again
+GITHUB_REPOS_SNAPSHOT_TTL = 15 * 60
+# Over this age the whole listing is fetched again, to catch the deleted repos and the changes made without a push
+GITHUB_REPOS_SNAPSHOT_FULL_TTL = 24 * 60 * 60
+# Results of the existence checks of maven URLs, so assembling and updating don't HEAD the nexus for every mod again
+MAVEN_EXISTENCE_CACHE = CACHE_DIR / "maven_existence.json"
+# Published artifacts don't go away, so a URL found on the maven is trusted for a week
+MAVEN_EXISTENCE_TTL = 7 * 24 * 60 * 60
+# A missing URL is checked again sooner, as the maven publication of a release can lag behind the GitHub one
+MAVEN_EXISTENCE_NEGATIVE_TTL = 60 * 60
+# Maximum amount of concurrent existence checks against the nexus, which isn't paced by the GitHub request scheduler
+MAVEN_CONCURRENCY = 8
+# Content addressed store of the downloaded files, can be pointed at a folder shared between several machines
+CONTENT_STORE_DIR = Path(os.environ.get("GTNH_CONTENT_STORE_DIR", CACHE_DIR / "objects"))
+# Entries of the release archives that are already compressed: deflating them again costs a lot of CPU for next to
+# no size gain, so they're stored as is, unless a deflate level (0-9) is given for them
+ARCHIVE_COMPRESSED_EXTENSIONS = (".jar", ".zip", ".png")
+ARCHIVE_COMPRESSED_ENTRIES_LEVEL = (
+    int(os.environ["GTNH_ARCHIVE_COMPRESSED_ENTRIES_LEVEL"])
+    if "GTNH_ARCHIVE_COMPRESSED_ENTRIES_LEVEL" in os.environ
+    else None
+)
 WORKING_DIR = ROOT_DIR / "working"
 CLIENT_WORKING_DIR = WORKING_DIR / "client"
 SERVER_WORKING_DIR = WORKING_DIR / "server"
@@ -25,6 +51,9 @@ RELEASE_CHANGELOG_DIR = RELEASE_DIR / "changelogs"
 RELEASE_CHANGELOG_NIGHTLY_BUILDS_DIR = RELEASE_CHANGELOG_DIR / "nightly builds"
 RELEASE_README_DIR = RELEASE_DIR / "readmes"
 
+# Release notes of the assets, one gzipped file per asset
+ASSET_CHANGELOG_DIR = ROOT_DIR / "asset_changelogs"
+
 SERVER_ASSETS_DIR = ROOT_DIR / "server_assets"
 CLIENT_ASSETS_DIR = ROOT_DIR / "client_assets"
 
@@ -50,6 +79,10 @@ LOCAL_EXCLUDES_FILE = ".inplace_mod_exclusions"
 INPLACE_PINNED_FILE = ".inplace_pinned_mods"
 UNKNOWN = "Unknown"
 OTHER = "Other"
+# Downloads are streamed to disk in chunks of this size
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Maximum page size GitHub accepts when listing releases
+GITHUB_RELEASES_PER_PAGE = 100
 MAVEN_BASE_URL = "https://nexus.gtnewhorizons.com/repository/releases/com/github/GTNewHorizons/"
 
 GREEN_CHECK = "\N{white heavy check mark}"
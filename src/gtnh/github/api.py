@@ -0,0 +1,32 @@
+from typing import Any, Mapping, Tuple
+
+import httpx
+from gidgethub.httpx import GitHubAPI
+
+from gtnh.github.scheduler import RequestScheduler
+
+# How many times a rate limited request is retried once the scheduler allows requests again
+MAX_RATE_LIMIT_RETRIES = 3
+
+
+class ScheduledGitHubAPI(GitHubAPI):
+    """
+    GitHubAPI whose requests go through a RequestScheduler, retrying the ones that were rejected by a rate limit.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, scheduler: RequestScheduler, *args: Any, **kwargs: Any) -> None:
+        self.scheduler = scheduler
+        super().__init__(client, *args, **kwargs)
+
+    async def _request(
+        self, method: str, url: str, headers: Mapping[str, str], body: bytes = b""
+    ) -> Tuple[int, Mapping[str, str], bytes]:
+        attempt = 0
+        while True:
+            async with self.scheduler.slot():
+                status_code, response_headers, content = await super()._request(method, url, headers, body)
+
+            waited = self.scheduler.observe(status_code, response_headers)
+            if status_code not in {403, 429} or not waited or attempt >= MAX_RATE_LIMIT_RETRIES:
+                return status_code, response_headers, content
+            attempt += 1
@@ -0,0 +1,92 @@
+import hashlib
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, MutableMapping, Optional, Tuple
+
+import orjson
+
+from gtnh.gtnh_logger import get_logger
+from gtnh.utils import atomic_write
+
+log = get_logger(__name__)
+
+# etag, last-modified, data, next page - the entry layout gidgethub expects from its cache
+CacheEntry = Tuple[Optional[str], Optional[str], Any, Optional[str]]
+
+
+class GithubResponseCache(MutableMapping[str, CacheEntry]):
+    """
+    Persistent cache of GitHub API responses, keyed by URL.
+
+    gidgethub sends the stored ETag/Last-Modified back as conditional request headers and replays the stored data when
+    GitHub answers with a 304, which doesn't count against the rate limit. Each URL is stored in its own file so a
+    crashed run never corrupts the other entries.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        """
+        Constructor of the GithubResponseCache class.
+
+        :param cache_dir: the folder holding the cached responses
+        """
+        self.cache_dir: Path = cache_dir
+        self._memory: Dict[str, CacheEntry] = {}
+
+    def _entry_path(self, url: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+
+    def __getitem__(self, url: str) -> CacheEntry:
+        if url in self._memory:
+            return self._memory[url]
+
+        path = self._entry_path(url)
+        if not path.exists():
+            raise KeyError(url)
+
+        try:
+            with open(path, "rb") as f:
+                stored = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            log.warn(f"Discarding unreadable github cache entry for {url}")
+            raise KeyError(url)
+
+        if stored.get("url") != url:
+            raise KeyError(url)
+
+        entry: CacheEntry = (stored.get("etag"), stored.get("last_modified"), stored.get("data"), stored.get("more"))
+        self._memory[url] = entry
+        return entry
+
+    def __setitem__(self, url: str, entry: CacheEntry) -> None:
+        etag, last_modified, data, more = entry
+        self._memory[url] = entry
+        stored = {"url": url, "etag": etag, "last_modified": last_modified, "data": data, "more": more}
+        atomic_write(self._entry_path(url), orjson.dumps(stored))
+
+    def __delitem__(self, url: str) -> None:
+        self._memory.pop(url, None)
+        path = self._entry_path(url)
+        if not path.exists():
+            raise KeyError(url)
+        path.unlink()
+
+    def __iter__(self) -> Iterator[str]:
+        if not self.cache_dir.exists():
+            return
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                with open(path, "rb") as f:
+                    url = orjson.loads(f.read()).get("url")
+            except (OSError, orjson.JSONDecodeError):
+                continue
+            if url:
+                yield url
+
+    def __len__(self) -> int:
+        return len(list(self.cache_dir.glob("*.json"))) if self.cache_dir.exists() else 0
+
+    def clear(self) -> None:
+        self._memory.clear()
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob("*.json"):
+                os.remove(path)
@@ -0,0 +1,148 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from gidgethub import QueryError
+from gidgethub.abc import GitHubAPI
+
+from gtnh.github.uri import graphql_uri
+from gtnh.gtnh_logger import get_logger
+from gtnh.utils import AttributeDict, grouper
+
+log = get_logger(__name__)
+
+# GitHub caps the cost of a single query, 50 repositories with their latest release stays well below it
+REPOS_PER_QUERY = 50
+ASSETS_PER_RELEASE = 50
+
+REPOSITORY_FIELDS = f"""
+    name
+    url
+    isPrivate
+    licenseInfo {{ name }}
+    latestRelease {{
+      tagName
+      isPrerelease
+      description
+      releaseAssets(first: {ASSETS_PER_RELEASE}) {{
+        nodes {{ name downloadUrl createdAt updatedAt size }}
+      }}
+    }}
+"""
+
+
+def build_latest_releases_query(count: int) -> str:
+    """
+    Build a query fetching `count` repositories of an organisation at once, each one aliased as `r<index>`.
+
+    :param count: the amount of repositories in the query
+    :return: the GraphQL query
+    """
+    variables = ", ".join(f"$r{i}: String!" for i in range(count))
+    repositories = "\n".join(
+        f"  r{i}: repository(owner: $owner, name: $r{i}) {{{REPOSITORY_FIELDS}  }}" for i in range(count)
+    )
+    return f"query($owner: String!, {variables}) {{\n{repositories}\n}}"
+
+
+def repo_from_graphql(node: Dict[str, Any]) -> AttributeDict:
+    """
+    Convert a GraphQL repository into the shape of the REST `/repos/{org}/{repo}` response.
+
+    :param node: the repository node
+    :return: the repository
+    """
+    license_info = node.get("licenseInfo")
+    return AttributeDict(
+        {
+            "name": node["name"],
+            "html_url": node.get("url"),
+            "private": node.get("isPrivate", False),
+            "license": {"name": license_info["name"]} if license_info else None,
+        }
+    )
+
+
+def asset_from_graphql(node: Dict[str, Any]) -> AttributeDict:
+    """
+    Convert a GraphQL release asset into the shape of the assets of a REST release.
+
+    :param node: the release asset node
+    :return: the release asset; its API `url` and `digest` aren't exposed by GraphQL and are left to None
+    """
+    return AttributeDict(
+        {
+            "name": node["name"],
+            "url": None,
+            "browser_download_url": node.get("downloadUrl"),
+            "created_at": node.get("createdAt"),
+            "updated_at": node.get("updatedAt"),
+            "size": node.get("size"),
+            "digest": None,
+        }
+    )
+
+
+def release_from_graphql(node: Optional[Dict[str, Any]]) -> AttributeDict | None:
+    """
+    Convert a GraphQL release into the shape of the REST `/releases/latest` response.
+
+    GraphQL doesn't expose the API url of the assets (needed to download from private repos), so the versions
+    themselves are still built from the REST release listing.
+
+    :param node: the release node, if any
+    :return: the release
+    """
+    if node is None:
+        return None
+
+    return AttributeDict(
+        {
+            "tag_name": node["tagName"],
+            "prerelease": node.get("isPrerelease", False),
+            "body": node.get("description"),
+            "assets": [asset_from_graphql(asset) for asset in (node.get("releaseAssets") or {}).get("nodes", [])],
+        }
+    )
+
+
+async def _query_latest_releases(
+    gh: GitHubAPI, org: str, names: List[str], endpoint: str
+) -> Dict[str, Tuple[AttributeDict, AttributeDict | None]]:
+    variables = {f"r{i}": name for i, name in enumerate(names)}
+    try:
+        data = await gh.graphql(build_latest_releases_query(len(names)), endpoint=endpoint, owner=org, **variables)
+    except QueryError as e:
+        # Missing repositories are reported as errors, but the rest of the batch is still answered
+        log.warn(f"GraphQL batch reported errors: {e}")
+        data = e.response.get("data") or {}
+
+    result: Dict[str, Tuple[AttributeDict, AttributeDict | None]] = {}
+    for i, name in enumerate(names):
+        node = data.get(f"r{i}")
+        if node is None:
+            continue
+        result[name] = (repo_from_graphql(node), release_from_graphql(node.get("latestRelease")))
+    return result
+
+
+async def get_latest_releases(
+    gh: GitHubAPI, org: str, names: List[str], endpoint: Optional[str] = None
+) -> Dict[str, Tuple[AttributeDict, AttributeDict | None]]:
+    """
+    Fetch repository metadata and latest release for many repositories in a handful of GraphQL queries.
+
+    :param gh: the GitHub API
+    :param org: the organisation owning the repositories
+    :param names: the repository names
+    :param endpoint: the GraphQL endpoint, defaults to GitHub's
+    :return: dict[repo_name, (repository, latest release or None)]; repositories that weren't found are left out
+    """
+    endpoint = endpoint or graphql_uri()
+    batches = await asyncio.gather(
+        *[_query_latest_releases(gh, org, batch, endpoint) for batch in grouper(REPOS_PER_QUERY, names)]
+    )
+
+    result: Dict[str, Tuple[AttributeDict, AttributeDict | None]] = {}
+    for batch_result in batches:
+        result |= batch_result
+    return result
@@ -0,0 +1,91 @@
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import orjson
+from colorama import Fore
+from gidgethub.abc import GitHubAPI
+
+from gtnh.defs import GITHUB_REPOS_SNAPSHOT_FULL_TTL, GITHUB_REPOS_SNAPSHOT_TTL
+from gtnh.github.uri import org_repos_by_push_uri, org_repos_uri
+from gtnh.gtnh_logger import get_logger
+from gtnh.utils import atomic_write
+
+log = get_logger(__name__)
+
+REPOS_PER_PAGE = 100
+
+
+class RepoSnapshot:
+    """
+    On disk snapshot of the repo listing of a GitHub org, so that getting the repos doesn't crawl the whole org every
+    time a command starts.
+
+    A fresh snapshot is used as is. Past its TTL, only the repos pushed since the most recent push it knows of are
+    fetched again: the listing is sorted by push date, so the crawl stops at the first page holding a known push.
+    Past the full TTL, the whole listing is fetched again, which also catches the deleted repos.
+    """
+
+    def __init__(
+        self, path: Path, ttl: float = GITHUB_REPOS_SNAPSHOT_TTL, full_ttl: float = GITHUB_REPOS_SNAPSHOT_FULL_TTL
+    ) -> None:
+        """
+        Constructor of the RepoSnapshot class.
+
+        :param path: the snapshot file
+        :param ttl: the age, in seconds, under which the snapshot is used without any request
+        :param full_ttl: the age, in seconds, over which the whole listing is fetched again
+        """
+        self.path = path
+        self.ttl = ttl
+        self.full_ttl = full_ttl
+
+    def _load(self, org: str) -> Optional[Dict[str, Any]]:
+        if not self.path.exists():
+            return None
+        try:
+            stored: Dict[str, Any] = orjson.loads(self.path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            log.warn(f"Discarding unreadable repo snapshot `{self.path}`")
+            return None
+        return stored if stored.get("org") == org else None
+
+    def _save(self, org: str, repos: Dict[str, Any], refreshed_at: float, full_refreshed_at: float) -> None:
+        stored = {"org": org, "refreshed_at": refreshed_at, "full_refreshed_at": full_refreshed_at, "repos": repos}
+        atomic_write(self.path, orjson.dumps(stored))
+
+    async def get_all_repos(self, gh: GitHubAPI, org: str) -> Dict[str, Any]:
+        """
+        Get the repos of an org, refreshing the snapshot if needed.
+
+        :param gh: the github api
+        :param org: the org
+        :return: the repos, by name
+        """
+        now = time.time()
+        stored = self._load(org)
+
+        if stored is None or now - stored["full_refreshed_at"] > self.full_ttl:
+            log.info(f"Fetching the whole repo listing of {Fore.CYAN}{org}{Fore.RESET}")
+            repos = {repo["name"]: repo async for repo in gh.getiter(org_repos_uri(org))}
+            self._save(org, repos, now, now)
+            return repos
+
+        repos = stored["repos"]
+        if now - stored["refreshed_at"] <= self.ttl:
+            return repos
+
+        latest_push = max((repo.get("pushed_at") or "" for repo in repos.values()), default="")
+        refreshed = 0
+        async for repo in gh.getiter(org_repos_by_push_uri(org, REPOS_PER_PAGE)):
+            # ISO 8601 timestamps in UTC compare like strings
+            if (repo.get("pushed_at") or "") <= latest_push and repo["name"] in repos:
+                break
+            repos[repo["name"]] = repo
+            refreshed += 1
+
+        log.info(
+            f"Refreshed {Fore.GREEN}{refreshed}{Fore.RESET} recently pushed repo(s) of {Fore.CYAN}{org}{Fore.RESET}"
+        )
+        self._save(org, repos, now, stored["full_refreshed_at"])
+        return repos
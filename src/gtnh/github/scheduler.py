@@ -0,0 +1,101 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Mapping, Optional
+
+from colorama import Fore
+
+from gtnh.gtnh_logger import get_logger
+
+log = get_logger(__name__)
+
+DEFAULT_CONCURRENCY = 16
+DEFAULT_REQUESTS_PER_SECOND = 15.0
+
+
+class RequestScheduler:
+    """
+    Paces outgoing requests: a semaphore bounds how many are in flight, a token bucket bounds how many start per second
+    and rate limit headers from the responses pause everything until GitHub accepts requests again.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+        burst: Optional[int] = None,
+    ) -> None:
+        """
+        Constructor of the RequestScheduler class.
+
+        :param max_concurrency: the maximum amount of requests in flight
+        :param requests_per_second: the sustained rate at which requests can start
+        :param burst: how many requests can start at once after an idle period, defaults to max_concurrency
+        """
+        self.max_concurrency: int = max_concurrency
+        self.requests_per_second: float = requests_per_second
+        self.capacity: float = float(burst if burst is not None else max_concurrency)
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._bucket_lock = asyncio.Lock()
+        self._tokens: float = self.capacity
+        self._last_refill: float = time.monotonic()
+        self._resume_at: float = 0.0
+
+    async def _take_token(self) -> None:
+        # the wait is computed under the lock but slept outside of it, so a pause doesn't block the other waiters
+        while True:
+            async with self._bucket_lock:
+                now = time.monotonic()
+                if now < self._resume_at:
+                    wait = self._resume_at - now
+                else:
+                    self._tokens = min(
+                        self.capacity, self._tokens + (now - self._last_refill) * self.requests_per_second
+                    )
+                    self._last_refill = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.requests_per_second
+
+            await asyncio.sleep(wait)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        Wait for the permission to make a request, and hold it for the duration of the context.
+        """
+        async with self._semaphore:
+            await self._take_token()
+            yield
+
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> float:
+        """
+        Look at the rate limit headers of a response, and pause the scheduler if GitHub asked us to back off.
+
+        :param status_code: the response status code
+        :param headers: the response headers
+        :return: the amount of seconds requests are paused for, 0 if the response wasn't rate limited
+        """
+        wait: float = 0.0
+
+        retry_after = headers.get("retry-after")
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")
+
+        if retry_after is not None and retry_after.isdigit():
+            wait = float(retry_after)
+        elif remaining == "0" and reset is not None and reset.isdigit():
+            wait = max(0.0, float(reset) - time.time()) + 1
+        elif status_code == 429:
+            # secondary rate limit without any hint; GitHub asks for at least a minute
+            wait = 60.0
+
+        if wait > 0:
+            resume_at = time.monotonic() + wait
+            if resume_at > self._resume_at:
+                log.warn(f"{Fore.YELLOW}Rate limited by GitHub, pausing requests for {wait:.0f}s{Fore.RESET}")
+                self._resume_at = resume_at
+
+        return wait
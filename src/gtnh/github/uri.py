@@ -5,6 +5,10 @@ def org_repos_uri(org: str) -> str:
     return f"{API_BASE_URI}/orgs/{org}/repos"
 
 
+def org_repos_by_push_uri(org: str, per_page: int) -> str:
+    return f"{org_repos_uri(org)}?sort=pushed&direction=desc&per_page={per_page}"
+
+
 def repo_uri(org: str, repo: str) -> str:
     return f"{API_BASE_URI}/repos/{org}/{repo}"
 
@@ -17,9 +21,17 @@ def repo_releases_uri(org: str, repo: str) -> str:
     return f"{API_BASE_URI}/repos/{org}/{repo}/releases"
 
 
+def repo_releases_page_uri(org: str, repo: str, page: int, per_page: int) -> str:
+    return f"{repo_releases_uri(org, repo)}?per_page={per_page}&page={page}"
+
+
 def repo_license_uri(org: str, repo: str) -> str:
     return f"{API_BASE_URI}/repos/{org}/{repo}/license"
 
 
 def repo_issues_uri(org: str, repo: str, issue_num: int | None = None) -> str:
     return f"{API_BASE_URI}/repos/{org}/{repo}/issues" + (f"/{issue_num}" if issue_num is not None else "")
+
+
+def graphql_uri() -> str:
+    return f"{API_BASE_URI}/graphql"
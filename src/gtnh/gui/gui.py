@@ -119,6 +119,7 @@ class Window(ThemedTk, Tk):
             client_modrinth=lambda: asyncio.ensure_future(self.assemble_release(Side.CLIENT, Archive.MODRINTH)),
             client_technic=lambda: asyncio.ensure_future(self.assemble_release(Side.CLIENT, Archive.TECHNIC)),
             update_all=lambda: asyncio.ensure_future(self.assemble_all()),
+            update_all_parallel=lambda: asyncio.ensure_future(self.assemble_all(parallel=True)),
             update_beta=lambda: asyncio.ensure_future(self.assemble_beta()),
             generate_changelog=lambda: asyncio.ensure_future(self.generate_changelog()),
             load=lambda release_name: asyncio.ensure_future(self.load_gtnh_version(release_name)),
@@ -393,10 +394,12 @@ class Window(ThemedTk, Tk):
         """
         self.download_error_list.append(error_message)
 
-    async def assemble_all(self) -> None:
+    async def assemble_all(self, parallel: bool = False) -> None:
         """
         Assemble all the archives for a full update.
 
+        :param parallel: assemble the client archives concurrently, each one in its own process; their progress is
+                         still reported to the current task progress bar
         :return: None
         """
         global_callback: Callable[
@@ -410,7 +413,7 @@ class Window(ThemedTk, Tk):
 
             release_assembler.set_progress(self.get_progress())
 
-            await release_assembler.assemble(Side.CLIENT, verbose=True)
+            await release_assembler.assemble(Side.CLIENT, verbose=True, parallel=parallel)
 
             await self.assemble_release(Side.CLIENT_JAVA9, Archive.MMC)
             await self.assemble_release(Side.SERVER_JAVA9, Archive.ZIP)
@@ -656,7 +659,7 @@ class Window(ThemedTk, Tk):
         :return: a list of github mod names
         """
         gtnh: GTNHModpackManager = await self._get_modpack_manager()
-        return [x.name for x in gtnh.assets.mods if x.source == ModSource.github]
+        return [x.name for x in gtnh.assets.get_mods() if x.source == ModSource.github]
 
     def get_github_mods(self) -> Dict[str, ModVersionInfo]:
         """
@@ -716,7 +719,7 @@ class Window(ThemedTk, Tk):
             errored_mods = []
 
             # checking for errored mods
-            for mod in gtnh.assets.mods:
+            for mod in gtnh.assets.get_mods():
                 if mod.needs_attention:
                     errored_mods.append(mod)
 
@@ -787,7 +790,7 @@ class Window(ThemedTk, Tk):
             errored_mods = []
 
             # checking for errored mods
-            for mod in gtnh.assets.mods:
+            for mod in gtnh.assets.get_mods():
                 if mod.needs_attention:
                     errored_mods.append(mod)
 
@@ -1032,7 +1035,7 @@ class Window(ThemedTk, Tk):
         :return: a list of string with update_all the external mods availiable
         """
         gtnh: GTNHModpackManager = await self._get_modpack_manager()
-        return [mod.name for mod in gtnh.assets.mods if mod.source != ModSource.github]
+        return [mod.name for mod in gtnh.assets.get_mods() if mod.source != ModSource.github]
 
     async def get_modpack_versions(self) -> List[str]:
         """
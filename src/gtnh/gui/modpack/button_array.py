@@ -22,6 +22,7 @@ class ButtonArrayCallback:
         client_modrinth: Callable[[], Task[None]],
         client_technic: Callable[[], Task[None]],
         update_all: Callable[[], Task[None]],
+        update_all_parallel: Callable[[], Task[None]],
         update_beta: Callable[[], Task[None]],
         generate_changelog: Callable[[], Task[None]],
     ) -> None:
@@ -36,6 +37,7 @@ class ButtonArrayCallback:
         self.client_modrinth: Callable[[], Task[None]] = client_modrinth
         self.client_technic: Callable[[], Task[None]] = client_technic
         self.all: Callable[[], Task[None]] = update_all
+        self.all_parallel: Callable[[], Task[None]] = update_all_parallel
         self.beta: Callable[[], Task[None]] = update_beta
         self.generate_changelog: Callable[[], Task[None]] = generate_changelog
 
@@ -100,6 +102,12 @@ class ButtonArray(LabelFrame, TtkLabelFrame):  # type: ignore
         self.btn_generate_all: CustomButton = CustomButton(
             self.frame_btn, text="Generate stable release", command=callbacks.all, themed=self.themed
         )
+        self.btn_generate_all_parallel: CustomButton = CustomButton(
+            self.frame_btn,
+            text="Parallel stable release",
+            command=callbacks.all_parallel,
+            themed=self.themed,
+        )
         self.btn_generate_beta: CustomButton = CustomButton(
             self.frame_btn, text="Generate beta/RC release", command=callbacks.beta, themed=self.themed
         )
@@ -142,6 +150,7 @@ class ButtonArray(LabelFrame, TtkLabelFrame):  # type: ignore
             self.btn_update_nightly,
             self.btn_generate_beta,
             self.btn_generate_all,
+            self.btn_generate_all_parallel,
             self.btn_generate_changelog,
             self.btn_client_zip,
             self.btn_server_zip,
@@ -198,6 +207,7 @@ class ButtonArray(LabelFrame, TtkLabelFrame):  # type: ignore
         self.btn_update_nightly.grid(row=2, column=0)
         self.btn_update_assets.grid(row=3, column=0)
         self.btn_generate_changelog.grid(row=4, column=0)
+        self.btn_generate_all_parallel.grid(row=5, column=0)
 
         # column 1: client we control
         self.btn_client_zip.grid(row=0, column=1)
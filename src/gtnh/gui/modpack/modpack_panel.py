@@ -22,6 +22,7 @@ class ModpackPanelCallback(ButtonArrayCallback, ReleaseListCallback):
         client_modrinth: Callable[[], Task[None]],
         client_technic: Callable[[], Task[None]],
         update_all: Callable[[], Task[None]],
+        update_all_parallel: Callable[[], Task[None]],
         update_beta: Callable[[], Task[None]],
         generate_changelog: Callable[[], Task[None]],
         load: Callable[[str], Task[None]],
@@ -41,6 +42,7 @@ class ModpackPanelCallback(ButtonArrayCallback, ReleaseListCallback):
             client_modrinth=client_modrinth,
             client_technic=client_technic,
             update_all=update_all,
+            update_all_parallel=update_all_parallel,
             update_beta=update_beta,
             generate_changelog=generate_changelog,
         )
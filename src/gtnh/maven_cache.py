@@ -0,0 +1,116 @@
+import time
+from contextlib import AbstractAsyncContextManager, nullcontext
+from pathlib import Path
+from typing import AbstractSet, Any, Callable, Dict, Optional
+
+import httpx
+import orjson
+
+from gtnh.defs import MAVEN_EXISTENCE_NEGATIVE_TTL, MAVEN_EXISTENCE_TTL
+from gtnh.exceptions import MavenUnreachableException
+from gtnh.gtnh_logger import get_logger
+from gtnh.utils import atomic_write
+
+log = get_logger(__name__)
+
+
+class MavenCache:
+    """
+    On disk cache of the existence checks of maven URLs: both the URLs found and the ones missing are remembered, each
+    for its own duration, so that the nexus is only asked about a URL again once its result has expired.
+    """
+
+    def __init__(
+        self, path: Path, ttl: float = MAVEN_EXISTENCE_TTL, negative_ttl: float = MAVEN_EXISTENCE_NEGATIVE_TTL
+    ) -> None:
+        """
+        Constructor of the MavenCache class.
+
+        :param path: the cache file
+        :param ttl: the duration, in seconds, a URL found on the maven is trusted for
+        :param negative_ttl: the duration, in seconds, a URL missing from the maven is trusted for
+        """
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries: Optional[Dict[str, Any]] = None
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Any]:
+        if self._entries is None:
+            entries: Dict[str, Any] = {}
+            if self.path.exists():
+                try:
+                    entries = orjson.loads(self.path.read_bytes())
+                except (OSError, orjson.JSONDecodeError):
+                    log.warn(f"Discarding unreadable maven cache `{self.path}`")
+            self._entries = entries
+        return self._entries
+
+    def get(self, url: str) -> Optional[bool]:
+        """
+        Get the cached existence of a URL.
+
+        :param url: the URL
+        :return: whether the URL exists, None if it isn't cached or its result expired
+        """
+        entry = self._load().get(url)
+        if entry is None:
+            return None
+        ttl = self.ttl if entry["exists"] else self.negative_ttl
+        if time.time() - entry["checked_at"] > ttl:
+            return None
+        return bool(entry["exists"])
+
+    def set(self, url: str, exists: bool) -> None:
+        """
+        Record the existence of a URL; it's written on the next `save`.
+
+        :param url: the URL
+        :param exists: whether the URL exists
+        :return: None
+        """
+        self._load()[url] = {"exists": exists, "checked_at": time.time()}
+        self._dirty = True
+
+    async def exists(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        slot: Optional[Callable[[], AbstractAsyncContextManager[Any]]] = None,
+        found_statuses: AbstractSet[int] = frozenset({200, 204}),
+    ) -> bool:
+        """
+        Check if a URL exists on the maven, with a HEAD request if its result isn't cached.
+
+        :param client: the http client
+        :param url: the URL
+        :param slot: gives the permission to make the request, like `RequestScheduler.slot`
+        :param found_statuses: the response statuses telling the URL exists
+        :return: whether the URL exists
+        :raises MavenUnreachableException: if the maven answered with a server error, which isn't cached
+        """
+        cached = self.get(url)
+        if cached is not None:
+            return cached
+
+        async with slot() if slot is not None else nullcontext():
+            response = await client.head(url, follow_redirects=True)
+
+        if response.status_code >= 500:
+            raise MavenUnreachableException(f"Maven unreachable status: {response.status_code}")
+
+        exists = response.status_code in found_statuses
+        self.set(url, exists)
+        return exists
+
+    def save(self) -> None:
+        """
+        Write the cache to disk, if it changed.
+
+        :return: None
+        """
+        if not self._dirty or self._entries is None:
+            return
+        atomic_write(self.path, orjson.dumps(self._entries))
+        self._dirty = False
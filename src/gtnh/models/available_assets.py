@@ -1,8 +1,9 @@
 import bisect
 from functools import cached_property
-from typing import Dict, List
+from typing import Any, Dict, List
 
-from pydantic import Field
+import orjson
+from pydantic import Field, PrivateAttr
 
 from gtnh.defs import ModSource, Side
 from gtnh.exceptions import NoModAssetFound
@@ -20,15 +21,160 @@ log = get_logger(__name__)
 class AvailableAssets(GTNHBaseModel):
     config: GTNHConfig
     translations: GTNHTranslations
+    # Empty until built when loaded lazily: read the mods through `get_mods` and `get_mod`
     mods: List[GTNHModInfo] = Field(default_factory=list)
     latest_nightly: int
     latest_successful_nightly: int
 
+    # Whether the mods are still raw manifest entries, see parse_raw_indexed
+    _lazy: bool = PrivateAttr(default=False)
+    # Raw manifest entries of the mods as last loaded/saved when loading lazily: the mods not validated yet are dumped
+    # again from them
+    _raw_mods: Dict[str, Dict[str, Any]] = PrivateAttr(default_factory=dict)
+    # Mods validated through get_mod while `mods` isn't built yet
+    _loaded_mods: Dict[str, GTNHModInfo] = PrivateAttr(default_factory=dict)
+    _dirty: bool = PrivateAttr(default=False)
+
+    @classmethod
+    def parse_raw_indexed(cls, raw: str | bytes, lazy: bool = False) -> "AvailableAssets":
+        """
+        Parse the assets manifest. When loading lazily, the raw entries of the mods are kept around so the ones never
+        accessed can be saved without validating them.
+
+        :param raw: the content of the assets manifest
+        :param lazy: defer the validation of each mod to the first time it is accessed through `get_mod`; the `mods`
+                     list itself is only built by `get_mods`
+        :return: the assets
+        """
+        data = orjson.loads(raw)
+        if not lazy:
+            return cls.parse_obj(data)
+
+        assets = cls.parse_obj({**data, "mods": []})
+        assets._lazy = True
+        assets._raw_mods = {mod["name"]: mod for mod in data.get("mods", [])}
+        return assets
+
+    def get_mods(self) -> List[GTNHModInfo]:
+        """
+        Get all the mods, building the list first if the assets were loaded lazily. The mods already validated through
+        `get_mod` are reused, and the manifest order is kept.
+
+        :return: the mods
+        """
+        if self._lazy:
+            # filled in place: the list was never handed out while lazy, and the assets didn't change
+            self.mods.extend(self._load_mod(mod_name) for mod_name in self._raw_mods)
+            self._lazy = False
+            self._loaded_mods = {}
+            self._raw_mods = {}
+        return self.mods
+
+    def dict(self, **kwargs: Any) -> Dict[str, Any]:
+        self.get_mods()
+        return super().dict(**kwargs)
+
+    def json(self, **kwargs: Any) -> str:
+        self.get_mods()
+        return super().json(**kwargs)
+
+    def copy(self, **kwargs: Any) -> "AvailableAssets":
+        self.get_mods()
+        return super().copy(**kwargs)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in self.__fields__:
+            self._dirty = True
+            if name == "mods":
+                # replaces the mods not built yet too
+                self._lazy = False
+                self._loaded_mods = {}
+                self._raw_mods = {}
+
+    def is_lazy(self) -> bool:
+        """
+        :return: True if the `mods` list hasn't been built yet
+        """
+        return self._lazy
+
+    def _load_mod(self, mod_name: str) -> GTNHModInfo:
+        mod = self._loaded_mods.get(mod_name)
+        if mod is None:
+            mod = self._loaded_mods[mod_name] = GTNHModInfo.parse_obj(self._raw_mods[mod_name])
+        return mod
+
+    def _current_mods(self) -> List[GTNHModInfo]:
+        return list(self._loaded_mods.values()) if self.is_lazy() else self.mods
+
+    def is_dirty(self) -> bool:
+        """
+        :return: True if anything changed since the assets were loaded or last saved
+        """
+        return (
+            self._dirty
+            or self.config.is_dirty()
+            or self.translations.is_dirty()
+            or any(mod.is_dirty() for mod in self._current_mods())
+        )
+
+    def dumps(self) -> str:
+        """
+        Serialize the assets the same way as `.json(exclude_unset=True, exclude_none=True)`, reusing the raw entries of
+        the mods never accessed when loaded lazily; then mark everything as clean.
+
+        :return: the json manifest
+        """
+        if self.is_lazy():
+            # a mod that was accessed is always serialized again, whether or not it knows it changed
+            dumped_mods = [
+                self._dump_mod(self._loaded_mods[mod_name]) if mod_name in self._loaded_mods else raw_mod
+                for mod_name, raw_mod in self._raw_mods.items()
+            ]
+            self._raw_mods = {mod["name"]: mod for mod in dumped_mods}
+            data = super().dict(exclude={"_modmap", "mods"}, exclude_unset=True, exclude_none=True)
+            data["mods"] = dumped_mods
+            dumped = self.__config__.json_dumps({field: data[field] for field in self.__fields__ if field in data})
+        else:
+            dumped = self.json(exclude={"_modmap"}, exclude_unset=True, exclude_none=True)
+
+        self._dirty = False
+        self.config.mark_clean()
+        self.translations.mark_clean()
+        for mod in self._current_mods():
+            mod.mark_clean()
+        return dumped
+
+    def _dump_mod(self, mod: GTNHModInfo) -> Dict[str, Any]:
+        # orjson serializes the datetimes and enums left by `.dict()` the same way `.json()` does
+        dumped: Dict[str, Any] = orjson.loads(
+            self.__config__.json_dumps(mod.dict(exclude_unset=True, exclude_none=True))
+        )
+        return dumped
+
     def add_mod(self, mod: GTNHModInfo) -> None:
         log.info(f"Adding {mod.name}")
-        bisect.insort_right(self.mods, mod, key=self._mod_sort_key)  # type: ignore
+        bisect.insort_right(self.get_mods(), mod, key=self._mod_sort_key)  # type: ignore
+        mod.mark_dirty()
+        self._dirty = True
         self.refresh_modmap()
 
+    def remove_mod(self, mod_name: str) -> bool:
+        """
+        Remove a mod.
+
+        :param mod_name: the name of the mod
+        :return: True if the mod was removed, False if there is no such mod
+        """
+        for i, mod in enumerate(self.get_mods()):
+            if mod.name == mod_name:
+                del self.mods[i]
+                self._raw_mods.pop(mod_name, None)
+                self._dirty = True
+                self.refresh_modmap()
+                return True
+        return False
+
     @staticmethod
     def _mod_sort_key(mod: GTNHModInfo) -> str:
         return mod.name.lower()
@@ -41,9 +187,11 @@ class AvailableAssets(GTNHBaseModel):
 
     @cached_property
     def _modmap(self) -> Dict[str, GTNHModInfo]:
-        return {mod.name: mod for mod in self.mods}
+        return {mod.name: mod for mod in self.get_mods()}
 
     def has_mod(self, mod_name: str) -> bool:
+        if self.is_lazy():
+            return mod_name in self._raw_mods
         return mod_name in self._modmap
 
     def get_mod(self, mod_name: str) -> GTNHModInfo:
@@ -51,7 +199,7 @@ class AvailableAssets(GTNHBaseModel):
         Get a mod, preferring github mods over external mods
         """
         if self.has_mod(mod_name):
-            mod = self._modmap[mod_name]
+            mod = self._load_mod(mod_name) if self.is_lazy() else self._modmap[mod_name]
             if mod.latest_version and mod.latest_version != "<unknown>":
                 return mod
 
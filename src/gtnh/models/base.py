@@ -1,7 +1,7 @@
 from typing import Any, Callable
 
 import orjson
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 
 def orjson_default(obj: Any) -> Any:
@@ -20,3 +20,23 @@ class GTNHBaseModel(BaseModel):
     class Config:
         json_loads = orjson.loads
         json_dumps = orjson_dumps
+
+
+class DirtyTrackingModel(GTNHBaseModel):
+    """
+    Model flagging itself as changed whenever one of its fields is set, so that a save can tell whether it has to
+    write it again.
+    """
+
+    _dirty: bool = PrivateAttr(default=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in self.__fields__:
+            self._dirty = True
+
+    def is_dirty(self) -> bool:
+        return self._dirty
+
+    def mark_clean(self) -> None:
+        self._dirty = False
@@ -7,7 +7,7 @@ from pydantic import Field
 
 from gtnh.defs import VersionableType
 from gtnh.gtnh_logger import get_logger
-from gtnh.models.base import GTNHBaseModel
+from gtnh.models.base import DirtyTrackingModel, GTNHBaseModel
 from gtnh.utils import AttributeDict
 
 log = get_logger(__name__)
@@ -23,14 +23,19 @@ class ModrinthFile(GTNHBaseModel):
     sha512: str
 
 
-class ExtraAsset(GTNHBaseModel):
+class ExtraAsset(DirtyTrackingModel):
     filename: str | None = Field(default=None)
     download_url: str | None = Field(default=None)
     browser_download_url: str | None = Field(default=None)
     maven_url: str | None = Field(default=None)
 
+    # Content of the downloaded file, used to verify and dedupe the cache
+    size: int | None = Field(default=None)
+    sha256: str | None = Field(default=None)
+    updated_at: Optional[datetime] = Field(default=None)
 
-class GTNHVersion(GTNHBaseModel):
+
+class GTNHVersion(DirtyTrackingModel):
     version_tag: str
     changelog: str = Field(default="")
     prerelease: bool = Field(default=False)
@@ -41,16 +46,27 @@ class GTNHVersion(GTNHBaseModel):
     download_url: str | None = Field(default=None)
     browser_download_url: str | None = Field(default=None)
     maven_url: str | None = Field(default=None)
+    size: int | None = Field(default=None)
+    sha256: str | None = Field(default=None)
+    updated_at: Optional[datetime] = Field(default=None)
 
     # Secondary Download info
     curse_file: CurseFile | None = Field(default=None)
     modrinth_file: ModrinthFile | None = Field(default=None)
     extra_assets: List[ExtraAsset] = Field(default=[])
 
+    def is_dirty(self) -> bool:
+        return self._dirty or any(extra_asset.is_dirty() for extra_asset in self.extra_assets)
+
+    def mark_clean(self) -> None:
+        self._dirty = False
+        for extra_asset in self.extra_assets:
+            extra_asset.mark_clean()
+
 
 def version_from_release(release: AttributeDict, type: VersionableType) -> GTNHVersion | None:
     """
-    Get ModVersion and assets from a GitRelease
+    Get ModVersion and assets from a GitRelease; the release notes are kept in the changelog store, not the version
     :param release: GithubRelease
     :return: ModVersion
     """
@@ -62,23 +78,40 @@ def version_from_release(release: AttributeDict, type: VersionableType) -> GTNHV
 
     return GTNHVersion(
         version_tag=version,
-        changelog=release.body or "",
         prerelease=release.prerelease,
         tagged_at=asset.created_at,
         filename=asset.name,
         download_url=asset.url,
         browser_download_url=asset.browser_download_url,
+        size=asset.get("size"),
+        sha256=sha256_from_digest(asset.get("digest")),
+        updated_at=asset.get("updated_at"),
         extra_assets=[
             ExtraAsset(
                 filename=extra_asset.name,
                 download_url=extra_asset.url,
                 browser_download_url=extra_asset.browser_download_url,
+                size=extra_asset.get("size"),
+                sha256=sha256_from_digest(extra_asset.get("digest")),
+                updated_at=extra_asset.get("updated_at"),
             )
             for extra_asset in extra_assets
         ],
     )
 
 
+def sha256_from_digest(digest: str | None) -> str | None:
+    """
+    Extract the sha256 from the `digest` GitHub reports for release assets (`sha256:<hex>`).
+
+    :param digest: the digest of the asset, if any
+    :return: the hex sha256, or None if the digest is missing or uses another algorithm
+    """
+    if digest is None or not digest.startswith("sha256:"):
+        return None
+    return digest.removeprefix("sha256:")
+
+
 def get_asset(release: AttributeDict, type: VersionableType) -> Tuple[AttributeDict | None, List[AttributeDict]]:
     """
     Get mod assets from a release; excludes dev, source, and api jars
@@ -1,11 +1,14 @@
 import bisect
+from functools import cache
+from itertools import pairwise
+from typing import Any
 
 try:
     from packaging.version import LegacyVersion  # type: ignore
 except ImportError:
     from packaging_legacy.version import LegacyVersion
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from gtnh.defs import VersionableType
 from gtnh.gtnh_logger import get_logger
@@ -23,12 +26,58 @@ class Versionable(BaseModel):
     versions: list[GTNHVersion] = Field(default_factory=list)
     type: VersionableType = Field(default=VersionableType.mod)
 
+    # Whether anything changed since the asset was loaded or last saved
+    _dirty: bool = PrivateAttr(default=False)
+    # Parsed version of each entry of `versions`, so lookups and inserts bisect without parsing any tag again
+    _version_keys: list[LegacyVersion] | None = PrivateAttr(default=None)
+    # Versions by tag, for exact lookups that don't depend on how the tags are ordered
+    _version_index: dict[str, GTNHVersion] = PrivateAttr(default_factory=dict)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in self.__fields__:
+            self._dirty = True
+            if name == "versions":
+                self._version_keys = None
+
+    def _keys(self) -> list[LegacyVersion]:
+        # Built along with the index on first use, and again after `versions` was reassigned. The methods changing
+        # `versions` in place keep both up to date.
+        if self._version_keys is None:
+            self._version_keys = [version_sort_key(version) for version in self.versions]
+            self._version_index = {version.version_tag: version for version in self.versions}
+        return self._version_keys
+
+    def _index(self) -> dict[str, GTNHVersion]:
+        self._keys()
+        return self._version_index
+
+    def is_dirty(self) -> bool:
+        return self._dirty or any(version.is_dirty() for version in self.versions)
+
+    def mark_dirty(self) -> None:
+        """
+        Flag the asset as changed, for changes the asset can't see itself (e.g. an item added to a list in place).
+        """
+        self._dirty = True
+
+    def mark_clean(self) -> None:
+        self._dirty = False
+        for version in self.versions:
+            version.mark_clean()
+
     def add_version(self, version: GTNHVersion) -> None:
         idx = self.get_version_idx(version.version_tag)
         if idx is not None:
             self.versions[idx] = version
         else:
-            bisect.insort_right(self.versions, version, key=version_sort_key)  # type: ignore
+            keys = self._keys()
+            key = parse_version(version.version_tag)
+            idx = bisect.bisect_right(keys, key)
+            self.versions.insert(idx, version)
+            keys.insert(idx, key)
+        self._index()[version.version_tag] = version
+        self._dirty = True
         self.reset_latest()
 
     def remove_version(self, version: GTNHVersion) -> bool:
@@ -38,7 +87,12 @@ class Versionable(BaseModel):
         idx = self.get_version_idx(version_tag)
 
         if idx is not None:
+            keys = self._keys()
+            index = self._index()
+            del keys[idx]
+            del index[version_tag]
             del self.versions[idx]
+            self._dirty = True
             self.reset_latest()
             return True
 
@@ -52,40 +106,59 @@ class Versionable(BaseModel):
             return True
         return False
 
+    def sort_versions(self) -> None:
+        """
+        Sort the versions, if they aren't already (e.g. after an edit of the manifest by hand).
+        """
+        if any(left > right for left, right in pairwise(self._keys())):
+            self.versions = sorted(self.versions, key=version_sort_key)
+
     def get_latest_version(self) -> GTNHVersion | None:
         return self.versions[-1] if self.versions else None
 
     def get_version(self, version: str) -> GTNHVersion | None:
-        idx = self.get_version_idx(version)
-        if idx is not None:
-            return self.versions[idx]
-        return None
+        return self._index().get(version)
 
     def get_version_idx(self, version: str) -> int | None:
-        i = bisect.bisect_left(self.versions, LegacyVersion(version), key=version_sort_key)  # type: ignore
-        if i != len(self.versions) and self.versions[i] and self.versions[i].version_tag == version:
-            return i
+        if version not in self._index():
+            return None
+
+        # Different tags can have the same legacy ordering (e.g. `-pre` variants), look through all of them
+        keys = self._keys()
+        key = parse_version(version)
+        i = bisect.bisect_left(keys, key)
+        while i < len(keys) and keys[i] == key:
+            if self.versions[i].version_tag == version:
+                return i
+            i += 1
         return None
 
     def has_version(self, version: str) -> bool:
-        return self.get_version_idx(version) is not None
+        return version in self._index()
 
     def get_versions(self, left: str | None, right: str) -> list[GTNHVersion]:
-        right_idx = bisect.bisect_right(self.versions, LegacyVersion(right), key=version_sort_key)  # type: ignore
+        keys = self._keys()
+        right_idx = bisect.bisect_right(keys, parse_version(right))
         if not left:
             return self.versions[:right_idx]
 
-        left_idx = bisect.bisect_left(self.versions, LegacyVersion(left), key=version_sort_key)  # type: ignore
+        left_idx = bisect.bisect_left(keys, parse_version(left))
         return self.versions[left_idx:right_idx]
 
 
+@cache
+def parse_version(version: str) -> LegacyVersion:
+    # Tags are compared over and over, and LegacyVersion instances are immutable
+    return LegacyVersion(version)
+
+
 def version_sort_key(version: GTNHVersion) -> LegacyVersion:
-    return LegacyVersion(version.version_tag)
+    return parse_version(version.version_tag)
 
 
 def version_is_newer(test_version: str, existing_version: str) -> bool:
-    return bool(LegacyVersion(test_version) > LegacyVersion(existing_version))
+    return bool(parse_version(test_version) > parse_version(existing_version))
 
 
 def version_is_older(test_version: str, existing_version: str) -> bool:
-    return bool(LegacyVersion(test_version) < LegacyVersion(existing_version))
+    return bool(parse_version(test_version) < parse_version(existing_version))
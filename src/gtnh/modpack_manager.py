@@ -5,55 +5,99 @@ import os
 import re
 import shutil
 from collections import defaultdict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Callable, List, Optional, Set, Tuple
+from typing import Callable, Iterator, List, Optional, Set, Tuple
 
 from cache import AsyncLRU
 from colorama import Fore, Style
 from gidgethub import BadRequest
-from gidgethub.httpx import GitHubAPI
 from httpx import AsyncClient, HTTPStatusError
 
-try:
-    from packaging.version import LegacyVersion  # type: ignore
-except ImportError:
-    from packaging_legacy.version import LegacyVersion
-
-from retry import retry
-
-from gtnh.assembler.downloader import get_asset_version_cache_location
+from gtnh.assembler.content_store import add_to_store, file_sha256, is_valid_file, restore_from_store
+from gtnh.assembler.downloader import discard_partial_download, download_file, get_asset_version_cache_location
 from gtnh.assembler.exclusions import Exclusions
+from gtnh.changelog_store import ChangelogStore
 from gtnh.defs import (
+    ASSET_CHANGELOG_DIR,
     AVAILABLE_ASSETS_FILE,
     BLACKLISTED_REPOS_FILE,
+    DOWNLOAD_CHUNK_SIZE,
+    GITHUB_CACHE_DIR,
+    GITHUB_RELEASES_PER_PAGE,
+    GITHUB_REPOS_SNAPSHOT,
     GREEN_CHECK,
     GTNH_MODPACK_FILE,
     INPLACE_PINNED_FILE,
     LOCAL_EXCLUDES_FILE,
     MAVEN_BASE_URL,
+    MAVEN_CONCURRENCY,
+    MAVEN_EXISTENCE_CACHE,
     OTHER,
     RED_CROSS,
     RELEASE_MANIFEST_DIR,
     ROOT_DIR,
     UNKNOWN,
+    ModEntry,
     ModSource,
     Side,
 )
 from gtnh.exceptions import InvalidNightlyIdException, InvalidReleaseException, RepoNotFoundException
-from gtnh.github.uri import latest_release_uri, org_repos_uri, repo_releases_uri, repo_uri
+from gtnh.github.api import ScheduledGitHubAPI
+from gtnh.github.cache import GithubResponseCache
+from gtnh.github.graphql import get_latest_releases
+from gtnh.github.repo_snapshot import RepoSnapshot
+from gtnh.github.scheduler import DEFAULT_CONCURRENCY, RequestScheduler
+from gtnh.github.uri import latest_release_uri, repo_releases_page_uri, repo_releases_uri, repo_uri
 from gtnh.gtnh_logger import get_logger
+from gtnh.maven_cache import MavenCache
 from gtnh.models.available_assets import AvailableAssets
 from gtnh.models.gtnh_config import CONFIG_REPO_NAME
 from gtnh.models.gtnh_modpack import GTNHModpack
 from gtnh.models.gtnh_release import GTNHRelease, load_release, save_release
-from gtnh.models.gtnh_version import version_from_release
+from gtnh.models.gtnh_version import ExtraAsset, GTNHVersion, version_from_release
 from gtnh.models.mod_info import GTNHModInfo
 from gtnh.models.mod_version_info import ModVersionInfo
-from gtnh.models.versionable import Versionable, version_is_newer, version_is_older, version_sort_key
-from gtnh.utils import AttributeDict, blockquote, get_github_token, index
+from gtnh.models.versionable import Versionable, parse_version, version_is_newer, version_is_older
+from gtnh.utils import AttributeDict, ModEntryParser, atomic_write, blockquote, get_github_token, index
 
 log = get_logger(__name__)
 
+
+def get_pretty_side_string(side: Optional[Side]) -> str:
+    if side == Side.CLIENT:
+        return "client-side only"
+    if side == Side.CLIENT_JAVA9:
+        return "client-side Java 9+ only"
+    elif side == Side.SERVER:
+        return "server-side only"
+    elif side == Side.SERVER_JAVA9:
+        return "server-side Java 9+ only"
+    elif side == Side.BOTH:
+        return "on both sides"
+    elif side == Side.BOTH_JAVA9:
+        return "on both sides, Java 9+ only"
+    elif side is None:
+        return "unknown"
+    else:
+        return str(side)
+
+
+def get_side_info(old_version: Optional[ModVersionInfo], new_version: ModVersionInfo) -> str:
+    """
+    Get the line of a changelog telling on which side a mod goes, if it's worth telling.
+
+    :param old_version: the version of the mod in the previous release, if any
+    :param new_version: the version of the mod in the release
+    :return: the line, empty if the mod still goes on both sides
+    """
+    if old_version is not None and old_version.side != new_version.side:
+        return f"Mod side changed from {get_pretty_side_string(old_version.side)} to {get_pretty_side_string(new_version.side)}."
+    elif new_version.side not in [Side.BOTH, Side.BOTH_JAVA9]:
+        return f"Mod is {get_pretty_side_string(new_version.side)}."
+    return ""
+
+
 # Up Next - GT-New-Horizons-Modpack config/scripts handling
 
 
@@ -62,17 +106,50 @@ class GTNHModpackManager:
     The GTNH ModPack Manager - Manages the GTNH Modpack
     """
 
-    def __init__(self, client: AsyncClient) -> None:
-        self.assets: AvailableAssets = self.load_assets()
+    def __init__(
+        self,
+        client: AsyncClient,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        download_chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        lazy_assets: bool = False,
+    ) -> None:
+        """
+        Constructor of the GTNHModpackManager class.
+
+        :param client: the http client
+        :param max_concurrency: the maximum amount of concurrent requests to GitHub
+        :param download_chunk_size: the size of the chunks downloads are written to disk with
+        :param lazy_assets: only validate the mods of the assets manifest when they're accessed, which makes commands
+                            touching a handful of mods start a lot faster
+        """
+        self.assets: AvailableAssets = self.load_assets(lazy=lazy_assets)
+        self.changelogs = ChangelogStore(ASSET_CHANGELOG_DIR)
+        self._deferred_saves = 0
         self.mod_pack: GTNHModpack = self.load_modpack()
         self.blacklisted_repos = self.load_blacklisted_repos()
         self.org = "GTNewHorizons"
         self.client = client
-        self.gh = GitHubAPI(self.client, "DreamAssemblerXXL", oauth_token=get_github_token())
+        self.download_chunk_size = download_chunk_size
+        # Shared by every request made by the manager, so fanning out over all the mods doesn't trip rate limits
+        self.scheduler = RequestScheduler(max_concurrency)
+        # Conditional requests against the persistent cache are answered with a 304 when nothing changed upstream,
+        # and those don't count against the rate limit
+        self.gh = ScheduledGitHubAPI(
+            self.client,
+            self.scheduler,
+            "DreamAssemblerXXL",
+            oauth_token=get_github_token(),
+            cache=GithubResponseCache(GITHUB_CACHE_DIR),
+        )
+        self.repo_snapshot = RepoSnapshot(GITHUB_REPOS_SNAPSHOT)
+        self.maven_cache = MavenCache(MAVEN_EXISTENCE_CACHE)
+        # The nexus has its own bound: its checks don't take the slots, nor the rate limit budget, of GitHub requests
+        self.maven_slots = asyncio.Semaphore(MAVEN_CONCURRENCY)
 
     @AsyncLRU(maxsize=None)  # type: ignore
     async def get_all_repos(self) -> dict[str, AttributeDict]:
-        return {r["name"]: AttributeDict(r) async for r in self.gh.getiter(org_repos_uri(self.org))}
+        repos = await self.repo_snapshot.get_all_repos(self.gh, self.org)
+        return {name: AttributeDict(repo) for name, repo in repos.items()}
 
     @AsyncLRU(maxsize=None)  # type: ignore
     async def get_repo(self, name: str) -> AttributeDict:
@@ -100,9 +177,13 @@ class GTNHModpackManager:
         mods_to_update: list[str] | None = None,
         progress_callback: Optional[Callable[[float, str], None]] = None,
         global_progress_callback: Optional[Callable[[str], None]] = None,
+        use_graphql: bool = False,
     ) -> None:
         if await self.update_available_assets(
-            mods_to_update, progress_callback=progress_callback, global_progress_callback=global_progress_callback
+            mods_to_update,
+            progress_callback=progress_callback,
+            global_progress_callback=global_progress_callback,
+            use_graphql=use_graphql,
         ):
             self.save_assets()
 
@@ -111,17 +192,41 @@ class GTNHModpackManager:
         assets_to_update: list[str] | None = None,
         progress_callback: Optional[Callable[[float, str], None]] = None,
         global_progress_callback: Optional[Callable[[str], None]] = None,
+        use_graphql: bool = False,
     ) -> bool:
+        """
+        Check all the github assets for new releases.
+
+        :param assets_to_update: if specified, only these assets are checked
+        :param progress_callback: Optional callback to update the progress bar for the current task in the gui
+        :param global_progress_callback: Optional callback to update the global progress bar in the gui
+        :param use_graphql: fetch the repositories and their latest release in batched GraphQL queries instead of one
+                            REST call per repository
+        :return: True if any asset was updated
+        """
 
         if global_progress_callback is not None:
             global_progress_callback("Downloading data from Github")
 
-        all_repos = await self.get_all_repos()
-
         tasks = []
-        to_update_from_repos: list[Versionable] = [mod for mod in self.assets.mods if mod.source == ModSource.github]
+        to_update_from_repos: list[Versionable] = [
+            mod for mod in self.assets.get_mods() if mod.source == ModSource.github
+        ]
         to_update_from_repos.append(self.assets.config)
 
+        all_repos: dict[str, AttributeDict]
+        latest_releases: dict[str, AttributeDict | None] = {}
+        if use_graphql:
+            names = [
+                asset.name for asset in to_update_from_repos if not assets_to_update or asset.name in assets_to_update
+            ]
+            names.append(self.assets.translations.name)
+            prefetched = await get_latest_releases(self.gh, self.org, names)
+            all_repos = {name: repo for name, (repo, _) in prefetched.items()}
+            latest_releases = {name: release for name, (_, release) in prefetched.items()}
+        else:
+            all_repos = await self.get_all_repos()
+
         delta_progress: float = 100 / len(to_update_from_repos)
         if global_progress_callback is not None:
             global_progress_callback("Updating assets")
@@ -144,16 +249,22 @@ class GTNHModpackManager:
                     f"{Fore.RED}Missing repo for {Fore.CYAN}{asset.name}{Fore.RED}, skipping update check.{Fore.RESET}"
                 )
                 continue
-            tasks.append(self.update_versionable_from_repo(asset, repo))
+            tasks.append(
+                self.update_versionable_from_repo(
+                    asset, repo, latest_releases.get(asset.name), release_fetched=asset.name in latest_releases
+                )
+            )
 
         # update translation manually because version check cannot work on this repo given the nature of the releases
-        self.assets.translations.versions = []
-        self.assets.translations.latest_version = ""
-        tasks.append(
-            self.update_translations_from_repo(self.assets.translations, all_repos.get(self.assets.translations.name))
-        )
+        translations_repo = all_repos.get(self.assets.translations.name)
+        if translations_repo is None:
+            log.error(f"{Fore.RED}Missing repo for {Fore.CYAN}{self.assets.translations.name}{Fore.RESET}")
+        else:
+            tasks.append(self.update_translations_from_repo(self.assets.translations, translations_repo))
 
         gathered = await asyncio.gather(*tasks, return_exceptions=True)
+        # saved once for the whole batch of maven checks, as the assets may not need to be saved
+        self.maven_cache.save()
         return any([r for r in gathered])
 
     async def update_curse_assets(self, assets_to_update: list[str] | None = None) -> bool:
@@ -173,11 +284,20 @@ class GTNHModpackManager:
         # return False
         raise NotImplementedError("Not currently implemented")
 
-    async def update_versionable_from_repo(self, versionable: Versionable, repo: AttributeDict) -> bool:
+    async def update_versionable_from_repo(
+        self,
+        versionable: Versionable,
+        repo: AttributeDict,
+        latest_release: AttributeDict | None = None,
+        release_fetched: bool = False,
+    ) -> bool:
         """
         Attempt to update a versionable asset from a github repository.
         :param versionable: The asset to check for update
         :param repo: The repo corresponding to the asset
+        :param latest_release: The latest release of the repo, if already known
+        :param release_fetched: True if `latest_release` was already fetched, None then meaning the repo has no
+                                release; fetched otherwise
         :return: True if the asset, or any releases were updated; False otherwise
         """
         version_updated = False
@@ -186,7 +306,8 @@ class GTNHModpackManager:
         log.debug(
             f"Checking {Fore.CYAN}{versionable.name}:{Fore.YELLOW}{versionable.latest_version}{Fore.RESET} for updates"
         )
-        latest_release = await self.get_latest_github_release(repo)
+        if not release_fetched:
+            latest_release = await self.get_latest_github_release(repo)
 
         latest_version = latest_release.tag_name if latest_release else "<unknown>"
 
@@ -256,10 +377,34 @@ class GTNHModpackManager:
         return mod_updated
 
     async def update_translations_from_repo(self, versionable: Versionable, repo: AttributeDict) -> bool:
+        """
+        Rebuild the versions of the translations from their `-latest` releases, which are re-published under the same
+        tag. The size/sha256 recorded for a language is kept as long as its release asset wasn't updated, so
+        unchanged translations are not downloaded again.
+
+        :param versionable: the translations
+        :param repo: the translations repo
+        :return: True
+        """
         log.debug(f"Checking {Fore.CYAN}{versionable.name}{Fore.RESET} for updates")
 
+        previous_versions = {version.version_tag: version for version in versionable.versions}
+        versionable.versions = []
+        versionable.latest_version = ""
+
         await self.update_versions_from_repo(versionable, repo, for_translation=True)
 
+        for version in versionable.versions:
+            previous = previous_versions.get(version.version_tag)
+            if (
+                previous is not None
+                and version.sha256 is None
+                and previous.updated_at is not None
+                and previous.updated_at == version.updated_at
+                and previous.size == version.size
+            ):
+                version.sha256 = previous.sha256
+
         self.needs_attention = False
         log.debug(f"Updated {Fore.CYAN}{versionable.name}{Fore.RESET}!")
 
@@ -281,18 +426,65 @@ class GTNHModpackManager:
 
         return latest_release
 
+    async def get_new_releases(self, asset: Versionable, repo: AttributeDict) -> List[AttributeDict]:
+        """
+        List the releases of a repo, newest first, stopping the pagination at the first page holding only versions
+        the asset already knows about.
+
+        :param asset: the asset the releases are fetched for
+        :param repo: the repo of the asset
+        :return: the releases from every page fetched, known ones included
+        """
+        releases: List[AttributeDict] = []
+        page = 1
+        while True:
+            page_releases = [
+                AttributeDict(r)
+                for r in await self.gh.getitem(
+                    repo_releases_page_uri(self.org, repo.name, page, GITHUB_RELEASES_PER_PAGE)
+                )
+            ]
+            releases.extend(page_releases)
+
+            if len(page_releases) < GITHUB_RELEASES_PER_PAGE:
+                break
+            if all(asset.has_version(r.tag_name) for r in page_releases):
+                log.debug(
+                    f"Stopping release pagination for `{Fore.CYAN}{asset.name}{Fore.RESET}` at page {page}, "
+                    f"every release on it is already known"
+                )
+                break
+            page += 1
+
+        return releases
+
     async def update_versions_from_repo(
-        self, asset: Versionable, repo: AttributeDict, for_translation: bool = False
+        self, asset: Versionable, repo: AttributeDict, for_translation: bool = False, incremental: bool = True
     ) -> bool:
-        releases = [AttributeDict(r) async for r in self.gh.getiter(repo_releases_uri(self.org, repo.name))]
+        """
+        Add the versions released on a github repo to an asset.
+
+        :param asset: the asset to update
+        :param repo: the repo of the asset
+        :param for_translation: whether the asset is the translations, for which only the `-latest` releases matter
+        :param incremental: only fetch release pages until one holds nothing but known versions; the full history is
+                            fetched otherwise (always the case for the translations, as their tags are reused)
+        :return: True if any version was added
+        """
+        releases: List[AttributeDict]
+        if incremental and not for_translation:
+            releases = await self.get_new_releases(asset, repo)
+        else:
+            releases = [AttributeDict(r) async for r in self.gh.getiter(repo_releases_uri(self.org, repo.name))]
+
         if for_translation:
             releases = [r for r in releases if r.tag_name.endswith("-latest")]
 
         # Sorted releases, newest version first
-        sorted_releases: List[AttributeDict] = sorted(releases, key=lambda r: LegacyVersion(r.tag_name), reverse=True)  # type: ignore
+        sorted_releases: List[AttributeDict] = sorted(releases, key=lambda r: parse_version(r.tag_name), reverse=True)  # type: ignore
         version_updated = False
 
-        asset.versions = sorted(asset.versions, key=version_sort_key)
+        asset.sort_versions()
 
         for release in sorted_releases:
             if asset.has_version(release.tag_name):
@@ -312,6 +504,9 @@ class GTNHModpackManager:
                 )
                 continue
 
+            if release.body and not for_translation:
+                self.changelogs.set(asset.name, version.version_tag, release.body)
+
             if for_translation:
                 log.info(
                     f"Updating version for `{Fore.CYAN}{asset.name}{Fore.RESET}` -> "
@@ -364,20 +559,22 @@ class GTNHModpackManager:
 
         return mod_license
 
+    def maven_slot(self) -> asyncio.Semaphore:
+        """
+        Slot of a maven existence check, as `slot` of `MavenCache.exists`.
+        """
+        return self.maven_slots
+
     async def get_maven(self, mod_name: str) -> str | None:
         """
-        Get the maven URL for a `mod_name`, ensuring it exists
+        Get the maven URL for a `mod_name`, ensuring it exists. The maven cache is saved along with the assets.
         :param mod_name: Mod Name
         :return: Maven URL, if found
         """
         maven_url = MAVEN_BASE_URL + mod_name + "/"
-        response = await self.client.head(maven_url, follow_redirects=True)
-
-        if response.status_code == 200:
-            return maven_url
-        elif response.status_code >= 500:
-            raise Exception(f"Maven unreachable status: {response.status_code}")
-        return None
+        # the folder of a published mod is listed with a 200, any other answer means it is missing
+        exists = await self.maven_cache.exists(self.client, maven_url, self.maven_slot, found_statuses={200})
+        return maven_url if exists else None
 
     async def update_release(
         self,
@@ -547,34 +744,57 @@ class GTNHModpackManager:
             log.warn(f"Mod `{name}` is not present in the assets.")
             return False
 
-        mod_index: int = 0
-
-        for i, mod in enumerate(self.assets.mods):
-            if mod.name == name:
-                mod_index = i
-                break
-
-        del self.assets.mods[mod_index]
-        self.assets.refresh_modmap()
+        self.assets.remove_mod(name)
         self.save_assets()
 
         log.info(f"Successfully deleted {name}!")
         return True
 
-    async def regen_github_assets(self, callback: Optional[Callable[[float, str], None]] = None) -> None:
+    async def regen_github_assets(
+        self, callback: Optional[Callable[[float, str], None]] = None, max_workers: int | None = None
+    ) -> None:
+        """
+        Rebuild every github mod from its repo, several repos at a time, and save the assets once at the end.
+
+        :param callback: Optional callback to update the progress bar in the gui
+        :param max_workers: how many repos are regenerated at once, defaults to the request scheduler's concurrency
+        """
         log.debug("refreshing all the github mods")
-        repo_names = [mod.name for mod in self.assets.mods if mod.source == ModSource.github]
+        repo_names = [mod.name for mod in self.assets.get_mods() if mod.source == ModSource.github]
         delta_progress: float = 100 / len(repo_names)
-        for repo_name in repo_names:
-            await self.regen_github_repo_asset(repo_name, callback=callback, delta_progress=delta_progress)
+        all_repos = await self.get_all_repos()
+        workers = asyncio.Semaphore(max_workers or self.scheduler.max_concurrency)
+
+        async def regen(repo_name: str) -> None:
+            async with workers:
+                await self.regen_github_repo_asset(
+                    repo_name, callback=callback, delta_progress=delta_progress, repo=all_repos.get(repo_name)
+                )
+
+        with self.batch_saves():
+            results = await asyncio.gather(*[regen(repo_name) for repo_name in repo_names], return_exceptions=True)
+
+        for repo_name, result in zip(repo_names, results):
+            if isinstance(result, Exception):
+                log.error(
+                    f"{RED_CROSS} {Fore.RED}Failed to regenerate {Fore.CYAN}{repo_name}{Fore.RED}: {result}{Fore.RESET}"
+                )
 
     async def regen_github_repo_asset(
         self,
         repo_name: str,
         callback: Optional[Callable[[float, str], None]] = None,
         delta_progress: Optional[float] = None,
+        repo: AttributeDict | None = None,
     ) -> None:
+        """
+        Rebuild a github mod from its repo, keeping its side. The mod is only replaced once the new one is built.
 
+        :param repo_name: the name of the mod
+        :param callback: Optional callback to update the progress bar in the gui
+        :param delta_progress: the progress made by the regeneration of this mod
+        :param repo: the repo, if already known; fetched otherwise
+        """
         if callback is not None and delta_progress is not None:
             callback(delta_progress, f"regenerating assets for {repo_name}")
         side: Side
@@ -583,11 +803,14 @@ class GTNHModpackManager:
         except Exception:
             side = Side.BOTH
 
-        await self.delete_mod(repo_name)
-        await self.add_github_mod(repo_name)
-        if side != Side.BOTH:  # by default the side is set to BOTH
-            self.set_mod_side(repo_name, side)
-        self.save_assets()
+        if repo is None:
+            repo = await self.get_repo(repo_name)
+        new_mod = await self.mod_from_repo(repo, side=side)
+
+        with self.batch_saves():
+            await self.delete_mod(repo_name)
+            self.assets.add_mod(new_mod)
+            log.info(f"Successfully regenerated {repo_name}!")
 
     async def regen_config_assets(self) -> None:
         self.assets.config.versions = []
@@ -596,8 +819,6 @@ class GTNHModpackManager:
         self.save_assets()
 
     async def regen_translation_assets(self) -> None:
-        self.assets.translations.versions = []
-        self.assets.translations.latest_version = ""
         await self.update_translations_from_repo(
             self.assets.translations, await self.get_repo(self.assets.translations.name)
         )
@@ -626,13 +847,15 @@ class GTNHModpackManager:
 
         return mod
 
-    def load_assets(self) -> AvailableAssets:
+    def load_assets(self, lazy: bool = False) -> AvailableAssets:
         """
         Load the Available Mods manifest
+
+        :param lazy: defer the validation of each mod until it is accessed
         """
         log.debug(f"Loading mods from {self.gtnh_asset_manifest_path}")
         with open(self.gtnh_asset_manifest_path, encoding="utf-8") as f:
-            return AvailableAssets.parse_raw(f.read())
+            return AvailableAssets.parse_raw_indexed(f.read(), lazy=lazy)
 
     def get_nightly_count(self) -> int:
         """
@@ -721,16 +944,37 @@ class GTNHModpackManager:
 
     def save_assets(self) -> None:
         """
-        Saves the Available Mods Manifest
+        Saves the Available Mods Manifest, if anything changed. Within `batch_saves`, the save is deferred to the end
+        of the batch.
         """
+        if self._deferred_saves:
+            return
+
+        self.changelogs.save()
+        self.maven_cache.save()
+        if not self.assets.is_dirty():
+            log.debug("Assets unchanged, skipping save")
+            return
+
         log.debug(f"Saving assets to from {self.gtnh_asset_manifest_path}")
-        dumped = self.assets.json(exclude={"_modmap"}, exclude_unset=True, exclude_none=True)
+        dumped = self.assets.dumps()
         if dumped:
-            with open(self.gtnh_asset_manifest_path, "w", encoding="utf-8") as f:
-                f.write(dumped)
+            atomic_write(self.gtnh_asset_manifest_path, dumped.encode("utf-8"))
         else:
             log.error("Save aborted, empty save result")
 
+    @contextmanager
+    def batch_saves(self) -> Iterator[None]:
+        """
+        Defer the saves of the assets made within the context to a single one once it exits successfully.
+        """
+        self._deferred_saves += 1
+        try:
+            yield
+        finally:
+            self._deferred_saves -= 1
+        self.save_assets()
+
     def load_blacklisted_repos(self) -> set[str]:
         with open(self.repo_blacklist_path) as f:
             return set(json.loads(f.read()))
@@ -787,7 +1031,6 @@ class GTNHModpackManager:
         """
         return ROOT_DIR / INPLACE_PINNED_FILE
 
-    @retry(delay=5, tries=3)
     async def download_asset(
         self,
         asset: Versionable,
@@ -818,42 +1061,91 @@ class GTNHModpackManager:
             f"{version.browser_download_url}{private_repo}"
         )
 
-        files_to_download = [(get_asset_version_cache_location(asset, version), version.download_url)]
+        files_to_download: list[Tuple[Path, str, GTNHVersion | ExtraAsset]] = [
+            (get_asset_version_cache_location(asset, version), version.download_url, version)
+        ]
         for extra_asset in version.extra_assets:
             if extra_asset.download_url is not None:
                 files_to_download.append(
-                    (get_asset_version_cache_location(asset, version, extra_asset.filename), extra_asset.download_url)
+                    (
+                        get_asset_version_cache_location(asset, version, extra_asset.filename),
+                        extra_asset.download_url,
+                        extra_asset,
+                    )
                 )
 
-        for mod_filename, download_url in files_to_download:
-            if os.path.exists(mod_filename) and not force_redownload:
-                log.debug(f"{Fore.YELLOW}Skipping re-redownload of {mod_filename}{Fore.RESET}")
-                if download_callback:
-                    download_callback(str(mod_filename.name))
-                continue
+        for mod_filename, download_url, downloaded in files_to_download:
+            if not force_redownload:
+                if os.path.exists(mod_filename):
+                    if await asyncio.to_thread(is_valid_file, mod_filename, downloaded.size, downloaded.sha256):
+                        log.debug(f"{Fore.YELLOW}Skipping re-redownload of {mod_filename}{Fore.RESET}")
+                        if download_callback:
+                            download_callback(str(mod_filename.name))
+                        continue
+
+                    log.warn(f"{Fore.YELLOW}Cached `{mod_filename}` is corrupt, downloading it again{Fore.RESET}")
+                    os.remove(mod_filename)
+                elif downloaded.sha256 is not None and await asyncio.to_thread(
+                    restore_from_store, downloaded.sha256, downloaded.size, mod_filename
+                ):
+                    log.debug(f"{Fore.YELLOW}Restored {mod_filename} from the content store{Fore.RESET}")
+                    if download_callback:
+                        download_callback(str(mod_filename.name))
+                    continue
 
             headers = {"Accept": "application/octet-stream"}
             if is_github:
                 headers |= {"Authorization": f"token {get_github_token()}"}
 
-            async with self.client.stream(url=download_url, headers=headers, method="GET", follow_redirects=True) as r:
-                try:
-                    r.raise_for_status()
-                    with open(mod_filename, "wb") as f:
-                        async for chunk in r.aiter_bytes(chunk_size=8192):
-                            f.write(chunk)
-                    log.info(f"{GREEN_CHECK} Download successful `{mod_filename}`")
-                except HTTPStatusError as e:
-                    log.error(
-                        f"{RED_CROSS} {Fore.RED}The following HTTP error while downloading`{Fore.YELLOW}{asset_version}"
-                        f"{Fore.RED}` while downloading {Fore.CYAN}{mod_filename.name}{Fore.RED} ({type} asset): {e}{Fore.RESET}"
+            if force_redownload:
+                # Don't resume from an older copy of the file
+                discard_partial_download(mod_filename)
+
+            try:
+                await download_file(
+                    self.client,
+                    download_url,
+                    mod_filename,
+                    headers=headers,
+                    scheduler=self.scheduler,
+                    chunk_size=self.download_chunk_size,
+                )
+                log.info(f"{GREEN_CHECK} Download successful `{mod_filename}`")
+            except HTTPStatusError as e:
+                log.error(
+                    f"{RED_CROSS} {Fore.RED}The following HTTP error while downloading`{Fore.YELLOW}{asset_version}"
+                    f"{Fore.RED}` while downloading {Fore.CYAN}{mod_filename.name}{Fore.RED} ({type} asset): {e}{Fore.RESET}"
+                )
+                if error_callback:
+                    error_callback(
+                        f"The following HTTP error while downloading`{asset_version}` while downloading{mod_filename.name}"
+                        f"({type} asset): {e}"
                     )
-                    if error_callback:
-                        error_callback(
-                            f"The following HTTP error while downloading`{asset_version}` while downloading{mod_filename.name}"
-                            f"({type} asset): {e}"
-                        )
-                    return None
+                return None
+
+            sha256 = await asyncio.to_thread(file_sha256, mod_filename)
+            size = mod_filename.stat().st_size
+            # A forced redownload is expected to fetch a different file
+            if not force_redownload and (
+                (downloaded.sha256 is not None and sha256 != downloaded.sha256)
+                or (downloaded.size is not None and size != downloaded.size)
+            ):
+                log.error(
+                    f"{RED_CROSS} {Fore.RED}Downloaded {Fore.CYAN}{mod_filename.name}{Fore.RED} doesn't match the "
+                    f"recorded size/sha256 ({type} asset), discarding it{Fore.RESET}"
+                )
+                if error_callback:
+                    error_callback(
+                        f"Downloaded {mod_filename.name} doesn't match the recorded size/sha256 ({type} asset)"
+                    )
+                os.remove(mod_filename)
+                return None
+
+            if downloaded.sha256 != sha256 or downloaded.size != size:
+                downloaded.sha256 = sha256
+                downloaded.size = size
+                asset.mark_dirty()
+            await asyncio.to_thread(add_to_store, mod_filename, sha256)
 
             if download_callback:
                 download_callback(str(mod_filename.name))
@@ -941,7 +1233,8 @@ class GTNHModpackManager:
                         is_github=True,
                         download_callback=translation_callback,
                         error_callback=error_callback,
-                        force_redownload=True,
+                        # Without a recorded sha256 the cached zip may be from an older release under the same tag
+                        force_redownload=language.sha256 is None,
                     )
                 )
 
@@ -1039,38 +1332,20 @@ class GTNHModpackManager:
 
         return changed_github_mods | changed_external_mods
 
-    def generate_changelog(
-        self, release: GTNHRelease, previous_release: GTNHRelease | None = None, include_no_changelog: bool = False
-    ) -> dict[str, list[str]]:
-        """
-        Generate a changelog between two releases.  If the `previous_release` is None, generate it for all of history
-        :returns: dict[mod_name, list[version_changes]]
+    def get_changelog_changes(
+        self, release: GTNHRelease, previous_release: GTNHRelease | None = None
+    ) -> Tuple[set[str], set[str], dict[str, Tuple[Optional[ModVersionInfo], ModVersionInfo]]]:
         """
+        Get the mods that changed between two releases.  If the `previous_release` is None, every github mod changed
 
-        def get_pretty_side_string(side: Optional[Side]) -> str:
-            if side == Side.CLIENT:
-                return "client-side only"
-            if side == Side.CLIENT_JAVA9:
-                return "client-side Java 9+ only"
-            elif side == Side.SERVER:
-                return "server-side only"
-            elif side == Side.SERVER_JAVA9:
-                return "server-side Java 9+ only"
-            elif side == Side.BOTH:
-                return "on both sides"
-            elif side == Side.BOTH_JAVA9:
-                return "on both sides, Java 9+ only"
-            elif side is None:
-                return "unknown"
-            else:
-                return str(side)
-
+        :param release: the release
+        :param previous_release: the release it's compared to
+        :return: the new mods, the removed mods, and the old and new versions of the github mods, by mod name
+        """
         removed_mods = set()
         new_mods = set()
         version_changes: dict[str, Tuple[Optional[ModVersionInfo], ModVersionInfo]] = {}
 
-        changelog: dict[str, list[str]] = defaultdict(list)
-
         if previous_release is not None:
             removed_mods |= set(previous_release.github_mods.keys() - release.github_mods.keys())
             removed_mods |= set(previous_release.external_mods.keys() - release.external_mods.keys())
@@ -1094,6 +1369,43 @@ class GTNHModpackManager:
             for mod_name in changed_github_mods:
                 version_changes[mod_name] = (None, release.github_mods[mod_name])
 
+        return new_mods, removed_mods, version_changes
+
+    def get_changelog_versions(
+        self, mod_name: str, old_version: Optional[ModVersionInfo], new_version: ModVersionInfo
+    ) -> list[Tuple[GTNHVersion, str]]:
+        """
+        Get the versions of a mod going in a changelog, newest first, with their changelogs.
+
+        :param mod_name: the mod
+        :param old_version: the version of the mod in the previous release, if any
+        :param new_version: the version of the mod in the release
+        :return: the versions, with their changelogs, empty if they have none
+        """
+        mod = self.assets.get_mod(mod_name)
+        mod_versions = mod.get_versions(left=old_version.version if old_version else None, right=new_version.version)
+
+        versions = []
+        for i, version in enumerate(reversed(mod_versions)):
+            if i != 0 and version.prerelease:
+                # Only include prerelease changes if it's the latest release
+                continue
+            if old_version is not None and version.version_tag == old_version.version:
+                continue
+            versions.append((version, version.changelog or self.changelogs.get(mod_name, version.version_tag)))
+        return versions
+
+    def generate_changelog(
+        self, release: GTNHRelease, previous_release: GTNHRelease | None = None, include_no_changelog: bool = False
+    ) -> dict[str, list[str]]:
+        """
+        Generate a changelog between two releases.  If the `previous_release` is None, generate it for all of history
+        :returns: dict[mod_name, list[version_changes]]
+        """
+        new_mods, removed_mods, version_changes = self.get_changelog_changes(release, previous_release)
+
+        changelog: dict[str, list[str]] = defaultdict(list)
+
         if new_mods:
             changelog["new_mods"].append("# New Mods: ")
             changelog["new_mods"].extend([f"> * {mod_name}" for mod_name in sorted(new_mods)])
@@ -1108,11 +1420,6 @@ class GTNHModpackManager:
             if old_version == new_version:
                 continue
 
-            mod = self.assets.get_mod(mod_name)
-            mod_versions = mod.get_versions(
-                left=old_version.version if old_version else None, right=new_version.version
-            )
-
             changes = changelog[mod_name]
 
             if mod_name in new_mods:
@@ -1121,26 +1428,62 @@ class GTNHModpackManager:
                 old_version_str = f"{old_version.version} -->" if old_version else ""
                 changes.append(f"# Updated - {mod_name} - {old_version_str} {new_version.version}")
 
-            if old_version is not None and old_version.side != new_version.side:
-                changes.append(
-                    f"Mod side changed from {get_pretty_side_string(old_version.side)} to {get_pretty_side_string(new_version.side)}."
-                )
-            elif new_version.side not in [Side.BOTH, Side.BOTH_JAVA9]:
-                changes.append(f"Mod is {get_pretty_side_string(new_version.side)}.")
+            side_info = get_side_info(old_version, new_version)
+            if side_info:
+                changes.append(side_info)
 
-            for i, version in enumerate(reversed(mod_versions)):
-                if i != 0 and version.prerelease:
-                    # Only include prerelease changes if it's the latest release
-                    continue
-                if old_version is not None and version.version_tag == old_version.version:
-                    continue
-                if version.changelog:
-                    changes.append(f"## *{version.version_tag}*\n" + blockquote(version.changelog) + "\n")
+            for version, version_changelog in self.get_changelog_versions(mod_name, old_version, new_version):
+                if version_changelog:
+                    changes.append(f"## *{version.version_tag}*\n" + blockquote(version_changelog) + "\n")
                 elif include_no_changelog:
                     changes.append(f">## *{version.version_tag}*\n" + ">**No Changelog Found**" + "\n")
 
         return changelog
 
+    def generate_changelog_entries(
+        self, release: GTNHRelease, previous_release: GTNHRelease | None = None
+    ) -> list[str | ModEntry]:
+        """
+        Generate the entries of a compressed changelog between two releases, straight from the versions of the mods.
+        If the `previous_release` is None, generate it for all of history
+
+        :param release: the release
+        :param previous_release: the release it's compared to
+        :return: the lines listing the new and removed mods, then an entry per changed github mod, to be given to
+                 `render_changelog`
+        """
+        new_mods, removed_mods, version_changes = self.get_changelog_changes(release, previous_release)
+
+        items: list[str | ModEntry] = []
+
+        if new_mods:
+            items.append("# New Mods:")
+            items.extend(f"> * {mod_name}" for mod_name in sorted(new_mods))
+
+        if removed_mods:
+            items.append("# Mods Removed:")
+            items.extend(f"> * {mod_name}" for mod_name in sorted(removed_mods))
+
+        for mod_name in sorted(version_changes.keys()):
+            (old_version, new_version) = version_changes[mod_name]
+            if old_version == new_version:
+                continue
+
+            if mod_name in new_mods or old_version is None:
+                entry = ModEntry(mod_name, new_version.version, mod_name in new_mods)
+            else:
+                entry = ModEntry(mod_name, f"{old_version.version}...{new_version.version}", False)
+            entry.side_info = get_side_info(old_version, new_version)
+
+            parser = ModEntryParser(entry)
+            for version, version_changelog in self.get_changelog_versions(mod_name, old_version, new_version):
+                if version_changelog:
+                    parser.feed_version(version.version_tag, version_changelog)
+
+            items.append(entry)
+
+        return items
+
     def set_mod_side(self, mod_name: str, side: str) -> bool:
         if self.assets.has_mod(mod_name):
             mod: GTNHModInfo = self.assets.get_mod(mod_name)
@@ -1244,7 +1587,7 @@ class GTNHModpackManager:
         active_mods = glob.glob("*.jar", root_dir=mods_dir) + glob.glob("1.7.10/*.jar", root_dir=mods_dir)
         kept_mods = set()
 
-        side_none_mods = [mod for mod in self.assets.mods if mod.side == Side.NONE]
+        side_none_mods = [mod for mod in self.assets.get_mods() if mod.side == Side.NONE]
         for mod in side_none_mods:
             for old_version in mod.versions:
                 to_remove = os.path.basename(get_asset_version_cache_location(mod, old_version))
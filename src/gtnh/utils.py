@@ -1,3 +1,4 @@
+import io
 import itertools
 import os
 import re
@@ -5,7 +6,7 @@ from bisect import bisect_left
 from functools import cache
 from pathlib import Path
 from shutil import copy, rmtree
-from typing import Any, Iterable, Iterator, List, Match, Optional
+from typing import Any, Iterable, Iterator, List, Match, Optional, Set
 from urllib import parse
 
 from gtnh.defs import CLIENT_WORKING_DIR, SERVER_WORKING_DIR, ModEntry
@@ -103,6 +104,21 @@ def move_mods(client_paths: List[Path], server_paths: List[Path]) -> None:
     copy_file_to_folder(server_paths, source_root, server_folder)
 
 
+def atomic_write(path: Path, data: bytes) -> None:
+    """
+    Write data to a file by way of a temporary file in the same folder, so readers never see a partial file.
+
+    :param path: the destination file
+    :param data: the content to write
+    :return: None
+    """
+    os.makedirs(path.parent, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(temp_path, "wb") as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+
 def verify_url(url: str) -> bool:
     """
     Url validator.
@@ -132,155 +148,213 @@ def blockquote(input_str: str) -> str:
     return "\n".join(f">{s}" for s in input_str.split("\n"))
 
 
-def compress_changelog(file_path: Path) -> None:
+CHANGELOG_NEW_MOD = re.compile("^# New Mod - (.*?):(.*?)$")
+CHANGELOG_UPDATED_MOD = re.compile("^# Updated - (.*?) - (.*?) -->(.*?)$")
+CHANGELOG_CONTRIBUTOR = re.compile(r"by (@\S+) in http.*$")
+CHANGELOG_FULL_CHANGELOG = re.compile("(compare|commits)/(.*?)(\\.\\.\\.(.*))?$")
+CHANGELOG_VERSION_RANGE = re.compile("^(.*)\\.\\.\\.(.*)$")
+
+
+class ModEntryParser:
+    """
+    Fills a mod entry from the lines of its part of a changelog, blockquoted like in `generate_changelog`.
     """
-    Compress the changelog matching the given changelog path.
 
-    :param file_path: the path of the file
-    :return: none
+    def __init__(self, entry: ModEntry) -> None:
+        """
+        Constructor of the ModEntryParser class.
+
+        :param entry: the mod entry to fill
+        """
+        self.entry = entry
+        self.in_changes_mode: bool = False
+        self.current_version: str = ""
+
+    def feed(self, line: str) -> None:
+        """
+        Parse a line of the entry.
+
+        :param line: the line, stripped
+        :return: None
+        """
+        entry = self.entry
+        if line.startswith("Mod is ") or line.startswith("Mod side changed from "):
+            entry.side_info = line
+        elif line == ">## What's Changed":
+            self.in_changes_mode = True
+        elif line == ">## New Contributors":
+            self.in_changes_mode = False
+        elif line.startswith("## *"):
+            self.current_version = line[4:-1]
+        elif line.startswith(">* "):
+            if self.in_changes_mode:
+                matches = CHANGELOG_CONTRIBUTOR.search(line)
+                if matches:
+                    entry.contributors.add(matches.group(1))
+                entry.changes.append((line[3:], [self.current_version]))
+            else:
+                entry.new_contributors.append(f"{line[3:]} ({self.current_version})")
+        elif line.startswith(">**Full Changelog**: "):
+            matches = CHANGELOG_FULL_CHANGELOG.search(line)
+            if matches is None:
+                return
+            if matches.group(1) == "compare":
+                entry.oldest_link_version = matches.group(2)
+                if entry.newest_link_version == "":
+                    entry.newest_link_version = matches.group(4)
+            else:
+                entry.oldest_link_version = matches.group(2)
+
+    def feed_version(self, version_tag: str, changelog: str) -> None:
+        """
+        Parse the changelog of a version, as published on its release.
+
+        :param version_tag: the version
+        :param changelog: the changelog of the version
+        :return: None
+        """
+        self.feed(f"## *{version_tag}*")
+        # universal newlines, like when the changelog was read back from a file
+        for line in io.StringIO(changelog, newline=None):
+            self.feed((">" + line).strip())
+
+
+def parse_changelog(lines: Iterable[str]) -> Iterator[str | ModEntry]:
     """
-    current_entry: Optional[ModEntry] = None
-    in_changes_mode: bool = False
-    current_version: str = ""
-    entries: List[ModEntry] = []
-    initial_lines: List[str] = []
+    Parse a changelog laid out like the ones of `GTNHModpackManager.generate_changelog`, one line at a time. Only the
+    entry being parsed is held in memory: an entry is yielded as soon as the next one starts.
+
+    :param lines: the lines of the changelog
+    :return: the lines before the first mod entry, then the mod entries
+    """
+    parser: Optional[ModEntryParser] = None
 
     matches: Optional[Match[str]]
-    name: str
-    version: str
-    version_to: str
-    version_from: str
-
-    with open(file_path, "r") as file:
-        data = file.readlines()
-        for line in data:
-            line = line.strip()
-            if line.startswith("# New Mod - "):
-                matches = re.search("^# New Mod - (.*?):(.*?)$", line)
-                if matches is None:
-                    continue
-                name = matches.group(1)
-                version = matches.group(2)
-                current_entry = ModEntry(name, version, True)
-                in_changes_mode = False
-                entries.append(current_entry)
-            elif line.startswith("# Updated - "):
-                matches = re.search("^# Updated - (.*?) - (.*?) -->(.*?)$", line)
-                if matches is None:
-                    continue
-                name = matches.group(1)
-                version_from = matches.group(2)
-                version_to = matches.group(3)
-                version = version_from + "..." + version_to
-                current_entry = ModEntry(name, version, False)
-                in_changes_mode = False
-                entries.append(current_entry)
-            elif current_entry:
-                if line.startswith("Mod is ") or line.startswith("Mod side changed from "):
-                    current_entry.side_info = line
-                elif line == ">## What's Changed":
-                    in_changes_mode = True
-                elif line == ">## New Contributors":
-                    in_changes_mode = False
-                elif line.startswith("## *"):
-                    current_version = line[4:-1]
-                elif line.startswith(">* "):
-                    if in_changes_mode:
-                        match = re.search(r"by (@\S+) in http.*$", line)
-                        if match:
-                            current_entry.contributors.add(match.group(1))
-                        current_entry.changes.append((line[3:], [current_version]))
-                    else:
-                        current_entry.new_contributors.append(f"{line[3:]} ({current_version})")
-                elif line.startswith(">**Full Changelog**: "):
-                    matches = re.search("(compare|commits)/(.*?)(\\.\\.\\.(.*))?$", line)
-                    if matches is None:
-                        continue
-                    if matches.group(1) == "compare":
-                        current_entry.oldest_link_version = matches.group(2)
-                        if current_entry.newest_link_version == "":
-                            current_entry.newest_link_version = matches.group(4)
-                    else:
-                        current_entry.oldest_link_version = matches.group(2)
-            else:
-                initial_lines.append(line)
+    for line in lines:
+        line = line.strip()
+        if line.startswith("# New Mod - "):
+            matches = CHANGELOG_NEW_MOD.search(line)
+            if matches is None:
+                continue
+            if parser is not None:
+                yield parser.entry
+            parser = ModEntryParser(ModEntry(matches.group(1), matches.group(2), True))
+        elif line.startswith("# Updated - "):
+            matches = CHANGELOG_UPDATED_MOD.search(line)
+            if matches is None:
+                continue
+            if parser is not None:
+                yield parser.entry
+            parser = ModEntryParser(ModEntry(matches.group(1), matches.group(2) + "..." + matches.group(3), False))
+        elif parser is not None:
+            parser.feed(line)
+        else:
+            yield line
 
-    with open(file_path, "w") as file:
-        for line in initial_lines:
-            file.write(line + "\n")
-        contributors = set()
-        lines = []
-        for ent in entries:
+    if parser is not None:
+        yield parser.entry
 
-            if ent.is_new:
-                lines.append("# New Mod - " + ent.name + " (" + ent.version + ")\n")
-            else:
-                lines.append(
-                    "# Updated " + ent.name + " (" + re.sub("^(.*)\\.\\.\\.(.*)$", r"\1 --> \2", ent.version) + ")\n"
-                )
-
-            if ent.side_info != "":
-                lines.append(ent.side_info + "\n")
-
-            if ent.is_new or ent.newest_link_version == "":
-                lines.append(
-                    "**Full Changelog**: https://github.com/GTNewHorizons/"
-                    + ent.name
-                    + "/commits/"
-                    + (
-                        ent.newest_link_version
-                        if ent.newest_link_version != ""
-                        else (ent.oldest_link_version if ent.oldest_link_version != "" else ent.version)
-                    )
-                    + "\n"
-                )
-            else:
-                lines.append(
-                    "**Full Changelog**: https://github.com/GTNewHorizons/"
-                    + ent.name
-                    + "/compare/"
-                    + ent.oldest_link_version
-                    + "..."
-                    + ent.newest_link_version
-                    + "\n"
-                )
-
-            if ent.changes:
-                lines.append(">## What's Changed\n")
-
-                # Deduplicate changelog entries (caused by -pre versions for example).
-                deduplicated_changes: list[tuple[str, list[str]]] = []
-                prev_change: Optional[tuple[str, list[str]]] = None
-                for ch in ent.changes:
-                    if prev_change is None:
-                        prev_change = ch
-                    elif ch[0] != prev_change[0]:
-                        deduplicated_changes.append(prev_change)
-                        prev_change = ch
-                    else:
-                        prev_change[1].extend(ch[1])
-                if prev_change is not None:
-                    deduplicated_changes.append(prev_change)
-
-                for ch in deduplicated_changes:
-                    lines.append(f"> * {ch[0]} ({', '.join(ch[1])})\n")
-                lines.append(">\n")
-
-            if ent.contributors:
-                contributors.update(ent.contributors)
-
-            lines.append("\n")
-        if len(lines) == 0:
-            lines.append("# Nothing changed this time!")
-        elif len(contributors) > 0:
-            lines.append("# Credits\n")
-            lines.append(
-                (
-                    f"Special thanks to {', '.join(sorted(list(contributors), key=str.casefold))}, "
-                    "for their code contributions listed above, and to everyone else who helped, "
-                    "including all of our beta testers! <3"
-                )
+
+def render_changelog_entry(ent: ModEntry) -> Iterator[str]:
+    """
+    Render a mod entry of a compressed changelog.
+
+    :param ent: the mod entry
+    :return: the lines of the entry, with their line breaks
+    """
+    if ent.is_new:
+        yield "# New Mod - " + ent.name + " (" + ent.version + ")\n"
+    else:
+        yield "# Updated " + ent.name + " (" + CHANGELOG_VERSION_RANGE.sub(r"\1 --> \2", ent.version) + ")\n"
+
+    if ent.side_info != "":
+        yield ent.side_info + "\n"
+
+    if ent.is_new or ent.newest_link_version == "":
+        yield (
+            "**Full Changelog**: https://github.com/GTNewHorizons/"
+            + ent.name
+            + "/commits/"
+            + (
+                ent.newest_link_version
+                if ent.newest_link_version != ""
+                else (ent.oldest_link_version if ent.oldest_link_version != "" else ent.version)
             )
+            + "\n"
+        )
+    else:
+        yield (
+            "**Full Changelog**: https://github.com/GTNewHorizons/"
+            + ent.name
+            + "/compare/"
+            + ent.oldest_link_version
+            + "..."
+            + ent.newest_link_version
+            + "\n"
+        )
+
+    if ent.changes:
+        yield ">## What's Changed\n"
+
+        # Deduplicate changelog entries (caused by -pre versions for example).
+        prev_change: Optional[tuple[str, list[str]]] = None
+        for ch in ent.changes:
+            if prev_change is None:
+                prev_change = ch
+            elif ch[0] != prev_change[0]:
+                yield f"> * {prev_change[0]} ({', '.join(prev_change[1])})\n"
+                prev_change = ch
+            else:
+                prev_change[1].extend(ch[1])
+        if prev_change is not None:
+            yield f"> * {prev_change[0]} ({', '.join(prev_change[1])})\n"
+        yield ">\n"
+
+    yield "\n"
 
-        for line in lines:
-            file.write(line)
+
+def render_changelog(items: Iterable[str | ModEntry]) -> Iterator[str]:
+    """
+    Render a compressed changelog, followed by the credits of the contributors.
+
+    :param items: the lines before the mod entries, then the mod entries, like `parse_changelog` gives them
+    :return: the lines of the changelog, with their line breaks
+    """
+    contributors: Set[str] = set()
+    has_entries = False
+
+    for item in items:
+        if isinstance(item, str):
+            yield item + "\n"
+            continue
+        has_entries = True
+        contributors.update(item.contributors)
+        yield from render_changelog_entry(item)
+
+    if not has_entries:
+        yield "# Nothing changed this time!"
+    elif len(contributors) > 0:
+        yield "# Credits\n"
+        yield (
+            f"Special thanks to {', '.join(sorted(list(contributors), key=str.casefold))}, "
+            "for their code contributions listed above, and to everyone else who helped, "
+            "including all of our beta testers! <3"
+        )
+
+
+def compress_changelog(file_path: Path) -> None:
+    """
+    Compress the changelog matching the given changelog path. The changelog is streamed through the parser into a new
+    file, which replaces it once complete.
+
+    :param file_path: the path of the file
+    :return: none
+    """
+    temp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(file_path, "r") as source, open(temp_path, "w") as file:
+            file.writelines(render_changelog(parse_changelog(source)))
+        os.replace(temp_path, file_path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
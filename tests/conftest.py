@@ -0,0 +1,97 @@
+import asyncio
+from pathlib import Path
+from typing import Any, Callable, Iterator, List
+
+import httpx
+import orjson
+import pytest
+
+from gtnh import modpack_manager as modpack_manager_module
+from gtnh.assembler import assembler, curse, downloader, zip_assembler
+from gtnh.assembler.curse import CurseAssembler
+from gtnh.models.gtnh_release import GTNHRelease
+from gtnh.modpack_manager import GTNHModpackManager
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+class FakeNetwork:
+    """
+    Stands in for the network of the modpack manager: every request is recorded and answered by `handler`, which
+    fails the test until one is set.
+    """
+
+    def __init__(self) -> None:
+        self.requests: List[httpx.Request] = []
+        self.handler: Handler = self.unexpected
+
+    @staticmethod
+    def unexpected(request: httpx.Request) -> httpx.Response:
+        raise AssertionError(f"Unexpected request to {request.url}")
+
+    def transport(self) -> httpx.MockTransport:
+        def handle(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return self.handler(request)
+
+        return httpx.MockTransport(handle)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    path.write_bytes(orjson.dumps(data))
+
+
+@pytest.fixture
+def network() -> FakeNetwork:
+    return FakeNetwork()
+
+
+@pytest.fixture
+def modpack_manager(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, network: FakeNetwork
+) -> Iterator[GTNHModpackManager]:
+    """
+    A modpack manager built by its constructor, with its manifests, caches and releases under `tmp_path` and its
+    requests answered by the `network` fixture.
+    """
+    cache_dir = tmp_path / "cache"
+    release_dir = tmp_path / "releases"
+    for name, value in {
+        "ROOT_DIR": tmp_path,
+        "ASSET_CHANGELOG_DIR": tmp_path / "asset_changelogs",
+        "GITHUB_CACHE_DIR": cache_dir / "github",
+        "GITHUB_REPOS_SNAPSHOT": cache_dir / "github_org_repos.json",
+        "MAVEN_EXISTENCE_CACHE": cache_dir / "maven_existence.json",
+        "RELEASE_MANIFEST_DIR": release_dir / "manifests",
+    }.items():
+        monkeypatch.setattr(modpack_manager_module, name, value)
+    monkeypatch.setattr(modpack_manager_module, "get_github_token", lambda: "test")
+    monkeypatch.setattr(downloader, "CACHE_DIR", cache_dir)
+    monkeypatch.setattr(zip_assembler, "RELEASE_ZIP_DIR", release_dir / "zip")
+    monkeypatch.setattr(curse, "RELEASE_CURSE_DIR", release_dir / "curse")
+    monkeypatch.setattr(assembler, "RELEASE_CHANGELOG_DIR", release_dir / "changelogs")
+    monkeypatch.setattr(
+        assembler, "RELEASE_CHANGELOG_NIGHTLY_BUILDS_DIR", release_dir / "changelogs" / "nightly builds"
+    )
+
+    _write_json(
+        tmp_path / "gtnh-assets.json",
+        {
+            "config": {"name": "GT-New-Horizons-Modpack", "latest_version": "1.0", "repo_url": ""},
+            "translations": {"name": "GTNH-Translations", "latest_version": "", "repo_url": ""},
+            "mods": [],
+            "latest_nightly": 0,
+            "latest_successful_nightly": 0,
+        },
+    )
+    _write_json(tmp_path / "gtnh-modpack.json", {})
+    _write_json(tmp_path / "repo-blacklist.json", [])
+
+    client = httpx.AsyncClient(transport=network.transport())
+    yield GTNHModpackManager(client)
+    asyncio.run(client.aclose())
+
+
+@pytest.fixture
+def curse_assembler(modpack_manager: GTNHModpackManager) -> CurseAssembler:
+    return CurseAssembler(modpack_manager, GTNHRelease(version="1.0", config="1.0", github_mods={}, external_mods={}))
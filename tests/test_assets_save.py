@@ -0,0 +1,82 @@
+from datetime import datetime, timezone
+
+import orjson
+
+from gtnh.defs import Side
+from gtnh.models.available_assets import AvailableAssets
+from gtnh.models.gtnh_version import GTNHVersion
+from gtnh.models.mod_info import GTNHModInfo
+
+DUMP_OPTIONS = dict(exclude={"_modmap"}, exclude_unset=True, exclude_none=True)
+
+
+def _manifest() -> bytes:
+    assets = AvailableAssets.parse_obj(
+        {
+            "config": {"name": "GT-New-Horizons-Modpack", "latest_version": "2.3.0", "repo_url": ""},
+            "translations": {"name": "GTNH-Translations", "latest_version": "", "repo_url": ""},
+            "mods": [
+                {
+                    "name": name,
+                    "latest_version": "1.0",
+                    "side": "BOTH",
+                    "versions": [
+                        {
+                            "version_tag": "1.0",
+                            "filename": f"{name}-1.0.jar",
+                            "tagged_at": datetime(2023, 1, 1, tzinfo=timezone.utc),
+                        }
+                    ],
+                }
+                for name in ["ModA", "ModB"]
+            ],
+            "latest_nightly": 1,
+            "latest_successful_nightly": 1,
+        }
+    )
+    return assets.json(**DUMP_OPTIONS).encode()
+
+
+def test_loaded_assets_are_clean() -> None:
+    for lazy in (False, True):
+        assets = AvailableAssets.parse_raw_indexed(_manifest(), lazy=lazy)
+        assets.get_mod("ModA")
+        assert not assets.is_dirty()
+
+
+def test_dumps_matches_a_full_serialization() -> None:
+    assets = AvailableAssets.parse_raw_indexed(_manifest())
+    assets.get_mod("ModA").side = Side.CLIENT
+    assets.get_mod("ModB").add_version(GTNHVersion(version_tag="1.1", filename="ModB-1.1.jar"))
+    assets.add_mod(GTNHModInfo(name="ModC", latest_version="1.0", external_url=None, project_id=None, slug=None))
+    assets.latest_nightly = 2
+    assert assets.is_dirty()
+
+    expected = assets.json(**DUMP_OPTIONS)
+    assert assets.dumps() == expected
+    assert not assets.is_dirty()
+    assert assets.dumps() == expected
+
+
+def test_lazy_dumps_keeps_the_mods_not_loaded() -> None:
+    assets = AvailableAssets.parse_raw_indexed(_manifest(), lazy=True)
+    assets.get_mod("ModB").side = Side.SERVER
+
+    dumped = orjson.loads(assets.dumps())
+
+    assert [mod["side"] for mod in dumped["mods"]] == ["BOTH", "SERVER"]
+    assert assets.is_lazy()
+
+
+def test_version_edits_are_saved_without_mark_dirty() -> None:
+    for lazy in (False, True):
+        assets = AvailableAssets.parse_raw_indexed(_manifest(), lazy=lazy)
+        version = assets.get_mod("ModA").get_version("1.0")
+        assert version is not None
+        assets.dumps()
+
+        version.maven_url = "https://nexus.gtnewhorizons.com/ModA-1.0.jar"
+
+        assert assets.is_dirty()
+        assert orjson.loads(assets.dumps())["mods"][0]["versions"][0]["maven_url"] == version.maven_url
+        assert not assets.is_dirty()
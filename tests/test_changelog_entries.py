@@ -0,0 +1,71 @@
+from pathlib import Path
+
+from gtnh.defs import Side
+from gtnh.models.gtnh_release import GTNHRelease
+from gtnh.models.gtnh_version import GTNHVersion
+from gtnh.models.mod_info import GTNHModInfo
+from gtnh.models.mod_version_info import ModVersionInfo
+from gtnh.modpack_manager import GTNHModpackManager
+from gtnh.utils import compress_changelog, render_changelog
+
+
+def _body(mod: str, previous: str, tag: str, author: str) -> str:
+    return (
+        f"## What's Changed\r\n* Change {tag} by @{author} in https://github.com/GTNewHorizons/{mod}/pull/1\r\n\r\n"
+        f"**Full Changelog**: https://github.com/GTNewHorizons/{mod}/compare/{previous}...{tag}"
+    )
+
+
+def _add_mods(manager: GTNHModpackManager) -> None:
+    manager.changelogs.set("Bar", "2.1.0", _body("Bar", "2.0.0", "2.1.0", "bob"))
+    manager.assets.add_mod(
+        GTNHModInfo(
+            name="Foo",
+            latest_version="1.1.0",
+            versions=[GTNHVersion(version_tag="1.1.0", changelog=_body("Foo", "1.0.0", "1.1.0", "alice"))],
+        )
+    )
+    manager.assets.add_mod(
+        GTNHModInfo(
+            name="Bar",
+            latest_version="2.2.0",
+            versions=[
+                GTNHVersion(version_tag="2.0.0"),
+                GTNHVersion(version_tag="2.1.0"),
+                GTNHVersion(version_tag="2.2.0", changelog=_body("Bar", "2.1.0", "2.2.0", "Carol")),
+            ],
+        )
+    )
+
+
+def test_entries_render_like_the_compressed_changelog(tmp_path: Path, modpack_manager: GTNHModpackManager) -> None:
+    manager = modpack_manager
+    _add_mods(manager)
+    previous = GTNHRelease(
+        version="1",
+        config="1",
+        github_mods={"Bar": ModVersionInfo(version="2.0.0", side=Side.CLIENT), "Old": ModVersionInfo(version="1")},
+        external_mods={},
+    )
+    release = GTNHRelease(
+        version="2",
+        config="1",
+        github_mods={
+            "Bar": ModVersionInfo(version="2.2.0", side=Side.CLIENT),
+            "Foo": ModVersionInfo(version="1.1.0", side=Side.BOTH),
+        },
+        external_mods={},
+    )
+
+    changelog_path = tmp_path / "changelog.md"
+    with open(changelog_path, "w") as file:
+        for items in manager.generate_changelog(release, previous).values():
+            file.writelines(item + "\n" for item in items)
+    compress_changelog(changelog_path)
+
+    rendered = "".join(render_changelog(manager.generate_changelog_entries(release, previous)))
+
+    # the round trip through the file kept the space in front of the new version
+    assert rendered == changelog_path.read_text().replace("-->  ", "--> ")
+    assert "# Updated Bar (2.0.0 --> 2.2.0)\nMod is client-side only.\n" in rendered
+    assert "(2.1.0)" in rendered and "Special thanks to @alice, @bob, @Carol" in rendered
@@ -0,0 +1,20 @@
+from pathlib import Path
+
+from gtnh.changelog_store import ChangelogStore
+
+
+def test_changelogs_round_trip(tmp_path: Path) -> None:
+    store = ChangelogStore(tmp_path)
+    store.set("NotEnoughItems", "2.3.1", "* Fixed things")
+    assert store.get("NotEnoughItems", "2.3.1") == "* Fixed things"
+    store.save()
+
+    written = (tmp_path / "NotEnoughItems.json.gz").read_bytes()
+    store.set("NotEnoughItems", "2.3.1", "* Fixed things")
+    store.save()
+    assert (tmp_path / "NotEnoughItems.json.gz").read_bytes() == written
+
+    reloaded = ChangelogStore(tmp_path)
+    assert reloaded.get("NotEnoughItems", "2.3.1") == "* Fixed things"
+    assert reloaded.get("NotEnoughItems", "2.3.0") == ""
+    assert reloaded.get("GT5-Unofficial", "5.09.41") == ""
@@ -0,0 +1,67 @@
+from pathlib import Path
+
+from gtnh.utils import compress_changelog
+
+CHANGELOG = """# New Mods:
+> * Foo
+# New Mod - Foo:1.1.0
+## *1.1.0*
+>## What's Changed
+>* Add things by @alice in https://github.com/GTNewHorizons/Foo/pull/2
+>
+>**Full Changelog**: https://github.com/GTNewHorizons/Foo/compare/1.0.0...1.1.0
+
+# Updated - Bar - 2.0.0 --> 2.2.0
+Mod is Client Only.
+## *2.2.0*
+>## What's Changed
+>* Fix things by @Bob in https://github.com/GTNewHorizons/Bar/pull/5
+>
+>**Full Changelog**: https://github.com/GTNewHorizons/Bar/compare/2.1.0...2.2.0
+
+## *2.1.0*
+>## What's Changed
+>* Fix things by @Bob in https://github.com/GTNewHorizons/Bar/pull/5
+>## New Contributors
+>* @Bob made their first contribution
+>
+>**Full Changelog**: https://github.com/GTNewHorizons/Bar/compare/2.0.0...2.1.0
+"""
+
+COMPRESSED = """# New Mods:
+> * Foo
+# New Mod - Foo (1.1.0)
+**Full Changelog**: https://github.com/GTNewHorizons/Foo/commits/1.1.0
+>## What's Changed
+> * Add things by @alice in https://github.com/GTNewHorizons/Foo/pull/2 (1.1.0)
+>
+
+# Updated Bar (2.0.0 -->  2.2.0)
+Mod is Client Only.
+**Full Changelog**: https://github.com/GTNewHorizons/Bar/compare/2.0.0...2.2.0
+>## What's Changed
+> * Fix things by @Bob in https://github.com/GTNewHorizons/Bar/pull/5 (2.2.0, 2.1.0)
+>
+
+# Credits
+Special thanks to @alice, @Bob, for their code contributions listed above, and to everyone else who helped, \
+including all of our beta testers! <3"""
+
+
+def test_compress_changelog(tmp_path: Path) -> None:
+    changelog = tmp_path / "changelog.md"
+    changelog.write_text(CHANGELOG)
+
+    compress_changelog(changelog)
+
+    assert changelog.read_text() == COMPRESSED
+    assert list(tmp_path.iterdir()) == [changelog]
+
+
+def test_compress_empty_changelog(tmp_path: Path) -> None:
+    changelog = tmp_path / "changelog.md"
+    changelog.write_text("")
+
+    compress_changelog(changelog)
+
+    assert changelog.read_text() == "# Nothing changed this time!"
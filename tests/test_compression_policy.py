@@ -0,0 +1,31 @@
+from pathlib import Path
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+from gtnh.assembler.compression import CompressionPolicy
+
+
+def test_compressed_entries_are_stored(tmp_path: Path) -> None:
+    jar = tmp_path / "Mod-1.0.jar"
+    jar.write_bytes(b"jar" * 100)
+    policy = CompressionPolicy(compressed_level=None)
+
+    with ZipFile(tmp_path / "pack.zip", "w", compression=ZIP_DEFLATED) as archive:
+        policy.write(archive, jar, "mods/Mod-1.0.jar")
+        with policy.open(archive, "config/icon.PNG") as target:
+            target.write(b"png" * 100)
+        with policy.open(archive, "config/mod.cfg") as target:
+            target.write(b"cfg" * 100)
+
+    with ZipFile(tmp_path / "pack.zip") as archive:
+        assert archive.getinfo("mods/Mod-1.0.jar").compress_type == ZIP_STORED
+        assert archive.getinfo("config/icon.PNG").compress_type == ZIP_STORED
+        assert archive.getinfo("config/mod.cfg").compress_type == ZIP_DEFLATED
+        assert archive.read("config/icon.PNG") == b"png" * 100
+
+
+def test_compressed_entries_can_be_deflated_at_a_level(tmp_path: Path) -> None:
+    policy = CompressionPolicy(compressed_level=1)
+
+    with ZipFile(tmp_path / "pack.zip", "w", compression=ZIP_DEFLATED) as archive:
+        assert policy.compression(archive, "mods/Mod-1.0.jar") == (ZIP_DEFLATED, 1)
+        assert policy.compression(archive, "config/mod.cfg") == (ZIP_DEFLATED, None)
@@ -0,0 +1,37 @@
+import hashlib
+import os
+from pathlib import Path
+from typing import Any
+
+from gtnh.assembler import content_store
+from gtnh.assembler.content_store import add_to_store, object_location, restore_from_store
+
+CONTENT = b"not really a jar"
+SHA256 = hashlib.sha256(CONTENT).hexdigest()
+
+
+def test_identical_files_are_deduped_and_restored(tmp_path: Path, monkeypatch: Any) -> None:
+    monkeypatch.setattr(content_store, "CONTENT_STORE_DIR", tmp_path / "objects")
+    first = tmp_path / "ModA" / "ModA-1.0.jar"
+    second = tmp_path / "ModB" / "ModB-1.0.jar"
+    for path in (first, second):
+        path.parent.mkdir()
+        path.write_bytes(CONTENT)
+        add_to_store(path, SHA256)
+
+    assert os.path.samefile(first, second)
+    assert object_location(SHA256).read_bytes() == CONTENT
+
+    restored = tmp_path / "ModA" / "ModA-1.1.jar"
+    assert restore_from_store(SHA256, len(CONTENT), restored)
+    assert restored.read_bytes() == CONTENT
+
+
+def test_corrupt_objects_are_not_restored(tmp_path: Path, monkeypatch: Any) -> None:
+    monkeypatch.setattr(content_store, "CONTENT_STORE_DIR", tmp_path / "objects")
+    stored = object_location(SHA256)
+    stored.parent.mkdir(parents=True)
+    stored.write_bytes(b"truncated")
+
+    assert not restore_from_store(SHA256, None, tmp_path / "ModA-1.0.jar")
+    assert not stored.exists()
@@ -0,0 +1,31 @@
+import json
+from pathlib import Path
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+from gtnh.assembler.curse import CurseAssembler
+
+
+def test_downloads_archive_stores_the_jars(tmp_path: Path, curse_assembler: CurseAssembler) -> None:
+    jars = [tmp_path / "a.jar", tmp_path / "b.jar"]
+    for jar in jars:
+        jar.write_bytes(b"PK jar " + jar.name.encode())
+    curse_assembler.get_downloads_archive_path().parent.mkdir(parents=True)
+
+    curse_assembler.build_downloads_archive(jars)
+
+    with ZipFile(curse_assembler.get_downloads_archive_path()) as archive:
+        assert [(info.filename, info.compress_type) for info in archive.infolist()] == [
+            ("a.jar", ZIP_STORED),
+            ("b.jar", ZIP_STORED),
+        ]
+        assert archive.read("b.jar") == b"PK jar b.jar"
+
+
+def test_dependencies_json_is_written_in_the_archive(tmp_path: Path, curse_assembler: CurseAssembler) -> None:
+    dependencies = [{"path": "mods/a.jar", "url": "https://downloads/a.jar"}]
+
+    with ZipFile(tmp_path / "curse.zip", "w", compression=ZIP_DEFLATED) as archive:
+        curse_assembler.generate_json_dep(dependencies, archive)
+
+    with ZipFile(tmp_path / "curse.zip") as archive:
+        assert json.loads(archive.read("overrides/config/dependencies.json")) == dependencies
@@ -0,0 +1,62 @@
+from pathlib import Path
+from typing import List, Tuple
+from zipfile import ZipFile
+
+from gtnh.assembler.downloader import get_asset_version_cache_location
+from gtnh.assembler.zip_assembler import ZipAssembler
+from gtnh.defs import Side
+from gtnh.models.gtnh_release import GTNHRelease
+from gtnh.models.gtnh_version import GTNHVersion
+from gtnh.models.mod_info import GTNHModInfo
+from gtnh.models.mod_version_info import ModVersionInfo
+from gtnh.modpack_manager import GTNHModpackManager
+
+
+def _release(**versions: str) -> GTNHRelease:
+    return GTNHRelease(
+        config="1.0", github_mods={n: ModVersionInfo(version=v) for n, v in versions.items()}, external_mods={}
+    )
+
+
+def _mods(release: GTNHRelease) -> List[Tuple[GTNHModInfo, GTNHVersion]]:
+    mods = []
+    for name, info in release.github_mods.items():
+        mod = GTNHModInfo(name=name, latest_version=info.version)
+        version = GTNHVersion(version_tag=info.version, filename=f"{name}-{info.version}.jar")
+        cached = get_asset_version_cache_location(mod, version)
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        cached.write_bytes(f"{name} {info.version}".encode())
+        mods.append((mod, version))
+    return mods
+
+
+def _build(
+    manager: GTNHModpackManager, release: GTNHRelease, previous: GTNHRelease, previous_archive: Path | None
+) -> List[str]:
+    messages: List[str] = []
+    assembler = ZipAssembler(manager, release, task_progress_callback=lambda _, message: messages.append(message))
+    assembler.build_from_previous(previous)
+    archive_path = assembler.get_archive_path(Side.SERVER)
+    archive_path.parent.mkdir(parents=True, exist_ok=True)
+    with ZipFile(archive_path, "w") as archive:
+        if previous_archive is None:
+            assembler.add_mods_from_previous(Side.SERVER, _mods(release), archive, None)
+        else:
+            with ZipFile(previous_archive) as previous_zip:
+                assembler.add_mods_from_previous(Side.SERVER, _mods(release), archive, previous_zip)
+    # the mods added from the cache, the others were copied from the previous archive
+    return [message.split()[2] for message in messages if message.startswith("adding mod")]
+
+
+def test_unchanged_mods_are_copied_from_the_previous_archive(modpack_manager: GTNHModpackManager) -> None:
+    previous = _release(A="1.0", B="1.0", C="1.0")
+    assert _build(modpack_manager, previous, previous, None) == ["A", "B", "C"]
+
+    archive_path = ZipAssembler(modpack_manager, previous).get_archive_path(Side.SERVER)
+    previous_archive = archive_path.rename(archive_path.with_name("previous.zip"))
+    current = _release(A="1.0", B="1.1", D="1.0")
+
+    assert _build(modpack_manager, current, previous, previous_archive) == ["B", "D"]
+    with ZipFile(archive_path) as archive:
+        assert sorted(archive.namelist()) == ["mods/A-1.0.jar", "mods/B-1.1.jar", "mods/D-1.0.jar"]
+        assert archive.read("mods/A-1.0.jar") == b"A 1.0"
@@ -0,0 +1,110 @@
+import asyncio
+from pathlib import Path
+from typing import List
+
+import httpx
+
+from gtnh.assembler.downloader import download_file, partial_download_location, partial_validator_location
+from gtnh.github.scheduler import RequestScheduler
+
+CONTENT = bytes(range(256)) * 64
+URL = "https://example.test/Mod-1.0.jar"
+
+
+def _flaky_server(
+    requests: List[httpx.Request], fail_after: int, content: bytes = CONTENT, etag: str = '"v1"', range_shift: int = 0
+) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        start = 0
+        status = 200
+        headers = {"etag": etag}
+        if "range" in request.headers and request.headers.get("if-range") == etag:
+            start = int(request.headers["range"].removeprefix("bytes=").rstrip("-")) + range_shift
+            status = 206
+            headers["content-range"] = f"bytes {start}-{len(content) - 1}/{len(content)}"
+
+        async def body():  # type: ignore
+            yield content[start : start + fail_after]  # noqa: E203
+            if len(requests) == 1:
+                raise httpx.ReadError("connection reset")
+            yield content[start + fail_after :]  # noqa: E203
+
+        return httpx.Response(status, headers=headers, content=body())
+
+    return httpx.MockTransport(handler)
+
+
+def _download(destination: Path, transport: httpx.MockTransport) -> None:
+    async def run() -> None:
+        async with httpx.AsyncClient(transport=transport) as client:
+            await download_file(client, URL, destination, chunk_size=100, delay=0)
+
+    asyncio.run(run())
+
+
+def test_interrupted_download_is_resumed(tmp_path: Path) -> None:
+    destination = tmp_path / "Mod-1.0.jar"
+    requests: List[httpx.Request] = []
+
+    _download(destination, _flaky_server(requests, 1000))
+
+    assert len(requests) == 2
+    assert requests[1].headers["range"] == "bytes=1000-"
+    assert requests[1].headers["if-range"] == '"v1"'
+    assert destination.read_bytes() == CONTENT
+    assert not partial_download_location(destination).exists()
+    assert not partial_validator_location(destination).exists()
+
+
+def test_stale_partial_download_is_replaced(tmp_path: Path) -> None:
+    destination = tmp_path / "Mod-1.0.jar"
+    _download(destination, _flaky_server([], 1000))
+    # a partial download of the previous upload of the same tag
+    partial_download_location(destination).write_bytes(CONTENT[:1000])
+    partial_validator_location(destination).write_bytes(b'{"url": "%s", "validator": "\\"v1\\""}' % URL.encode())
+    requests: List[httpx.Request] = [httpx.Request("GET", URL)]
+
+    _download(destination, _flaky_server(requests, 10, content=CONTENT[::-1], etag='"v2"'))
+
+    assert destination.read_bytes() == CONTENT[::-1]
+
+
+def test_partial_answer_not_continuing_the_file_is_discarded(tmp_path: Path) -> None:
+    destination = tmp_path / "Mod-1.0.jar"
+    requests: List[httpx.Request] = []
+
+    _download(destination, _flaky_server(requests, 1000, range_shift=10))
+
+    assert len(requests) == 3
+    assert "range" not in requests[2].headers
+    assert destination.read_bytes() == CONTENT
+
+
+def test_scheduler_slot_is_released_while_the_body_streams(tmp_path: Path) -> None:
+    scheduler = RequestScheduler(max_concurrency=1, requests_per_second=1000)
+    slot_free_while_streaming: List[bool] = []
+
+    async def take_slot() -> None:
+        async with scheduler.slot():
+            pass
+
+    async def body():  # type: ignore
+        yield CONTENT[:1000]
+        try:
+            await asyncio.wait_for(take_slot(), timeout=1)
+            slot_free_while_streaming.append(True)
+        except asyncio.TimeoutError:
+            slot_free_while_streaming.append(False)
+        yield CONTENT[1000:]
+
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+
+    async def run() -> None:
+        async with httpx.AsyncClient(transport=transport) as client:
+            await download_file(client, URL, tmp_path / "Mod-1.0.jar", scheduler=scheduler, chunk_size=100)
+
+    asyncio.run(run())
+
+    assert slot_free_while_streaming == [True]
+    assert (tmp_path / "Mod-1.0.jar").read_bytes() == CONTENT
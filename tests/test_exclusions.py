@@ -0,0 +1,69 @@
+import itertools
+from pathlib import Path
+from typing import List
+
+from gtnh.assembler.exclusions import Exclusions
+
+
+def legacy_contains(exclusions: List[str], item: str) -> bool:
+    obj = Path(item)
+    for exclu in exclusions:
+        if item == exclu:
+            return True
+        if Path(exclu) in obj.parents:
+            return True
+        if exclu.endswith("*") and Path(exclu[:-1]) in obj.parents:
+            return True
+    return False
+
+
+EXCLUSIONS = [
+    "README.md",
+    "config/txloader/",
+    "resourcepacks",
+    "mods/OpenSecurity/sounds/alarms/klaxon1.ogg",
+    "scripts/foo*",
+    "journeymap/*",
+    "./serverutilities//",
+    "/abs/folder",
+]
+
+ITEMS = [
+    "",
+    ".",
+    "README.md",
+    "docs/README.md",
+    "config/txloader",
+    "config/txloader/",
+    "config/txloader/forceload/a.lang",
+    "config/txloaders/a.lang",
+    "resourcepacks/",
+    "resourcepacks/pack.zip",
+    "mods/OpenSecurity/sounds/alarms/klaxon1.ogg",
+    "mods/OpenSecurity/sounds/alarms/klaxon2.ogg",
+    "scripts/foo",
+    "scripts/foo/bar.zs",
+    "scripts/foobar.zs",
+    "journeymap/config.json",
+    "serverutilities/ranks.txt",
+    "/abs/folder/file",
+    "/abs/other",
+    "abs/folder/file",
+]
+
+
+def test_lookups_match_the_legacy_implementation() -> None:
+    for exclusions in [EXCLUSIONS, EXCLUSIONS + ["."], []]:
+        compiled = Exclusions(list(exclusions))
+        for item in ITEMS:
+            assert (item in compiled) == legacy_contains(exclusions, item), (exclusions, item)
+
+
+def test_appended_exclusions_are_compiled() -> None:
+    exclusions = Exclusions(["README.md"])
+    exclusions.append("config/")
+    exclusions.extend(itertools.chain(["mods/"]))
+
+    assert "config/a.cfg" in exclusions
+    assert "mods/a.jar" in exclusions
+    assert exclusions.exclusions == ["README.md", "config/", "mods/"]
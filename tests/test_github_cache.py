@@ -0,0 +1,53 @@
+import asyncio
+from pathlib import Path
+from typing import List
+
+import httpx
+from gidgethub.httpx import GitHubAPI
+
+from gtnh.github.cache import GithubResponseCache
+
+RELEASES_URL = "https://api.github.com/repos/GTNewHorizons/NotEnoughItems/releases/latest"
+
+
+def _stub_github(seen: List[httpx.Request]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"etag": '"v1"'})
+        return httpx.Response(
+            200,
+            headers={"etag": '"v1"', "content-type": "application/json; charset=utf-8"},
+            json={"tag_name": "2.3.1"},
+        )
+
+    return httpx.MockTransport(handler)
+
+
+async def _get_latest(cache_dir: Path, seen: List[httpx.Request]) -> str:
+    async with httpx.AsyncClient(transport=_stub_github(seen)) as client:
+        gh = GitHubAPI(client, "test", cache=GithubResponseCache(cache_dir))
+        release = await gh.getitem(RELEASES_URL)
+        return str(release["tag_name"])
+
+
+def test_not_modified_is_replayed_from_disk(tmp_path: Path) -> None:
+    seen: List[httpx.Request] = []
+
+    assert asyncio.run(_get_latest(tmp_path, seen)) == "2.3.1"
+    assert "if-none-match" not in seen[0].headers
+
+    # a fresh cache instance only has the files on disk to go by
+    assert asyncio.run(_get_latest(tmp_path, seen)) == "2.3.1"
+    assert seen[1].headers["if-none-match"] == '"v1"'
+
+
+def test_mapping_roundtrip(tmp_path: Path) -> None:
+    cache = GithubResponseCache(tmp_path)
+    cache[RELEASES_URL] = ('"v1"', None, {"tag_name": "2.3.1"}, None)
+
+    assert list(GithubResponseCache(tmp_path)) == [RELEASES_URL]
+    assert GithubResponseCache(tmp_path)[RELEASES_URL] == ('"v1"', None, {"tag_name": "2.3.1"}, None)
+
+    del cache[RELEASES_URL]
+    assert len(cache) == 0
@@ -0,0 +1,72 @@
+import asyncio
+import json
+from typing import Any, Dict, List
+
+import httpx
+from gidgethub.httpx import GitHubAPI
+
+from gtnh.github import graphql
+from gtnh.github.graphql import get_latest_releases
+
+FAKE_ENDPOINT = "http://graphql.test/graphql"
+
+
+def _fake_graphql(queries: List[Dict[str, Any]]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        queries.append(payload)
+        data: Dict[str, Any] = {}
+        for alias, name in payload["variables"].items():
+            if alias == "owner":
+                continue
+            if name == "Missing":
+                data[alias] = None
+                continue
+            data[alias] = {
+                "name": name,
+                "url": f"https://github.com/GTNewHorizons/{name}",
+                "isPrivate": False,
+                "licenseInfo": {"name": "MIT License"},
+                "latestRelease": {
+                    "tagName": f"{name}-1.0.0",
+                    "isPrerelease": False,
+                    "description": "changes",
+                    "releaseAssets": {"nodes": [{"name": f"{name}-1.0.0.jar", "downloadUrl": "https://example/jar"}]},
+                },
+            }
+        body: Dict[str, Any] = {"data": data}
+        if "Missing" in payload["variables"].values():
+            body["errors"] = [{"type": "NOT_FOUND", "message": "Could not resolve to a Repository"}]
+        return httpx.Response(200, json=body)
+
+    return httpx.MockTransport(handler)
+
+
+async def _fetch(names: List[str], queries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async with httpx.AsyncClient(transport=_fake_graphql(queries)) as client:
+        gh = GitHubAPI(client, "test")
+        return await get_latest_releases(gh, "GTNewHorizons", names, endpoint=FAKE_ENDPOINT)
+
+
+def test_batches_repositories(monkeypatch: Any) -> None:
+    monkeypatch.setattr(graphql, "REPOS_PER_QUERY", 2)
+    queries: List[Dict[str, Any]] = []
+
+    result = asyncio.run(_fetch(["A", "B", "C"], queries))
+
+    assert len(queries) == 2
+    repo, release = result["C"]
+    assert repo.html_url == "https://github.com/GTNewHorizons/C"
+    assert repo.license.name == "MIT License"
+    assert release is not None
+    assert release.tag_name == "C-1.0.0"
+    assert release.assets[0].name == "C-1.0.0.jar"
+    assert release.assets[0].url is None
+
+
+def test_missing_repository_keeps_the_rest_of_the_batch() -> None:
+    queries: List[Dict[str, Any]] = []
+
+    result = asyncio.run(_fetch(["A", "Missing"], queries))
+
+    assert set(result.keys()) == {"A"}
@@ -0,0 +1,36 @@
+import asyncio
+import time
+from typing import List
+
+from gtnh.github.scheduler import RequestScheduler
+
+
+def test_concurrency_is_bounded() -> None:
+    scheduler = RequestScheduler(max_concurrency=2, requests_per_second=1000)
+    in_flight: List[int] = [0]
+    peak: List[int] = [0]
+
+    async def request() -> None:
+        async with scheduler.slot():
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+
+    async def run() -> None:
+        await asyncio.gather(*[request() for _ in range(8)])
+
+    asyncio.run(run())
+
+    assert peak[0] == 2
+
+
+def test_rate_limit_headers_pause_the_scheduler() -> None:
+    scheduler = RequestScheduler()
+
+    assert scheduler.observe(200, {"x-ratelimit-remaining": "42"}) == 0
+    assert scheduler.observe(403, {"retry-after": "3"}) == 3
+
+    reset = str(int(time.time()) + 10)
+    wait = scheduler.observe(403, {"x-ratelimit-remaining": "0", "x-ratelimit-reset": reset})
+    assert 9 <= wait <= 12
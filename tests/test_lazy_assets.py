@@ -0,0 +1,52 @@
+import orjson
+
+from gtnh.models.available_assets import AvailableAssets
+
+
+def _manifest() -> bytes:
+    mods = [
+        {"name": name, "latest_version": "1.0", "versions": [{"version_tag": "1.0", "filename": f"{name}-1.0.jar"}]}
+        for name in ["ModA", "ModB", "ModC"]
+    ]
+    return orjson.dumps(
+        {
+            "config": {"name": "GT-New-Horizons-Modpack", "latest_version": "2.3.0", "repo_url": ""},
+            "translations": {"name": "GTNH-Translations", "latest_version": "", "repo_url": ""},
+            "mods": mods,
+            "latest_nightly": 1,
+            "latest_successful_nightly": 1,
+        }
+    )
+
+
+def test_mods_are_validated_on_access() -> None:
+    assets = AvailableAssets.parse_raw_indexed(_manifest(), lazy=True)
+
+    mod_b = assets.get_mod("ModB")
+    assert mod_b.get_version("1.0") is not None
+    assert assets.has_mod("ModC")
+    assert assets.is_lazy()
+
+    assert [mod.name for mod in assets.get_mods()] == ["ModA", "ModB", "ModC"]
+    assert assets.mods[1] is mod_b
+    assert not assets.is_lazy()
+    assert assets.get_mod("ModB") is mod_b
+
+
+def test_lazy_and_eager_loading_dump_the_same() -> None:
+    eager = AvailableAssets.parse_raw(_manifest())
+    lazy = AvailableAssets.parse_raw_indexed(_manifest(), lazy=True)
+    lazy.get_mod("ModA")
+
+    assert lazy.json(exclude={"_modmap"}, exclude_unset=True, exclude_none=True) == eager.json(
+        exclude={"_modmap"}, exclude_unset=True, exclude_none=True
+    )
+
+
+def test_lazy_assets_work_with_the_pydantic_methods() -> None:
+    assets = AvailableAssets.parse_raw_indexed(_manifest(), lazy=True)
+
+    copied = assets.copy()
+    assert [mod["name"] for mod in assets.dict()["mods"]] == ["ModA", "ModB", "ModC"]
+    assert [mod.name for mod in copied.mods] == ["ModA", "ModB", "ModC"]
+    assert not assets.is_dirty()
@@ -0,0 +1,61 @@
+import asyncio
+from pathlib import Path
+from typing import Dict, List
+
+import httpx
+import pytest
+from conftest import FakeNetwork
+
+from gtnh.exceptions import MavenUnreachableException
+from gtnh.maven_cache import MavenCache
+from gtnh.modpack_manager import GTNHModpackManager
+
+STATUSES: Dict[str, int] = {"/found.jar": 200, "/missing.jar": 404, "/down.jar": 503}
+
+
+def _exists(cache: MavenCache, urls: List[str], requested: List[str]) -> List[bool]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        return httpx.Response(STATUSES[request.url.path])
+
+    async def run() -> List[bool]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return list(await asyncio.gather(*(cache.exists(client, url) for url in urls)))
+
+    return asyncio.run(run())
+
+
+def test_results_are_cached_on_disk(tmp_path: Path) -> None:
+    requested: List[str] = []
+    urls = ["https://maven/found.jar", "https://maven/missing.jar"]
+    cache = MavenCache(tmp_path / "maven.json")
+
+    assert _exists(cache, urls, requested) == [True, False]
+    cache.save()
+    assert _exists(MavenCache(tmp_path / "maven.json"), urls, requested) == [True, False]
+    assert requested == ["/found.jar", "/missing.jar"]
+
+
+def test_missing_urls_expire_first(tmp_path: Path) -> None:
+    requested: List[str] = []
+    urls = ["https://maven/found.jar", "https://maven/missing.jar"]
+    cache = MavenCache(tmp_path / "maven.json", negative_ttl=-1)
+
+    _exists(cache, urls, requested)
+    _exists(cache, urls, requested)
+    assert requested == ["/found.jar", "/missing.jar", "/missing.jar"]
+
+
+def test_server_errors_are_not_cached(tmp_path: Path) -> None:
+    cache = MavenCache(tmp_path / "maven.json")
+
+    with pytest.raises(MavenUnreachableException):
+        _exists(cache, ["https://maven/down.jar"], [])
+    assert cache.get("https://maven/down.jar") is None
+
+
+def test_maven_folder_only_exists_with_a_listing(modpack_manager: GTNHModpackManager, network: FakeNetwork) -> None:
+    network.handler = lambda request: httpx.Response(200 if "Listed" in request.url.path else 204)
+
+    assert asyncio.run(modpack_manager.get_maven("Listed")) is not None
+    assert asyncio.run(modpack_manager.get_maven("Empty")) is None
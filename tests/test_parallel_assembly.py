@@ -0,0 +1,94 @@
+import pickle
+import queue
+from pathlib import Path
+from typing import Any, List, Tuple
+
+import pytest
+
+from gtnh.assembler import assembler
+from gtnh.assembler.assembler import ReleaseAssembler, _assemble_in_subprocess
+from gtnh.assembler.generic_assembler import GenericAssembler
+from gtnh.defs import Side
+from gtnh.models.gtnh_release import GTNHRelease
+from gtnh.models.gtnh_version import GTNHVersion
+from gtnh.models.mod_info import GTNHModInfo
+from gtnh.models.mod_version_info import ModVersionInfo
+from gtnh.modpack_manager import GTNHModpackManager
+
+MAVEN_URL = "https://nexus.gtnewhorizons.com/Resolved-1.0.jar"
+
+
+class _ResolvingAssembler(GenericAssembler):
+    """
+    Stands in for the curse assembler: reports its progress and resolves the maven url of a mod.
+    """
+
+    async def assemble(self, side: Side, verbose: bool = False) -> None:
+        assert self.task_progress_callback is not None and self.previous_release is not None
+        self.task_progress_callback(50.0, f"assembling {side.value} from {self.previous_release.version}")
+        self.modpack_manager.assets.get_mod("Resolved").versions[0].maven_url = MAVEN_URL
+        self.task_progress_callback(50.0, "done")
+
+
+def _release() -> GTNHRelease:
+    return GTNHRelease(
+        version="2.0",
+        config="1.0",
+        github_mods={name: ModVersionInfo(version="1.0") for name in ["Resolved", "Untouched"]},
+        external_mods={},
+    )
+
+
+def _add_mods(manager: GTNHModpackManager) -> None:
+    for name in ["Resolved", "Untouched"]:
+        manager.assets.add_mod(
+            GTNHModInfo(
+                name=name,
+                latest_version="1.0",
+                versions=[GTNHVersion(version_tag="1.0", filename=f"{name}-1.0.jar")],
+            )
+        )
+    manager.save_assets()
+
+
+def test_worker_reports_progress_and_returns_the_resolved_maven_urls(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, modpack_manager: GTNHModpackManager
+) -> None:
+    monkeypatch.setitem(assembler.ARCHIVE_ASSEMBLERS, "resolving", _ResolvingAssembler)
+    _add_mods(modpack_manager)
+    progress: "queue.Queue[Tuple[float, str]]" = queue.Queue()
+    # the arguments cross the process boundary when the worker is spawned
+    arguments: List[Any] = pickle.loads(
+        pickle.dumps(["resolving", Side.CLIENT, False, _release(), tmp_path, False, _release()])
+    )
+
+    maven_urls = _assemble_in_subprocess(*arguments, progress)
+
+    assert maven_urls == {"Resolved": {"1.0": MAVEN_URL}}
+    assert [progress.get_nowait() for _ in range(progress.qsize())] == [
+        (50.0, "assembling CLIENT from 2.0"),
+        (50.0, "done"),
+    ]
+
+
+def test_merged_maven_urls_only_dirty_the_changed_mods(modpack_manager: GTNHModpackManager) -> None:
+    _add_mods(modpack_manager)
+    assembler.RELEASE_CHANGELOG_DIR.mkdir(parents=True)
+    release_assembler = ReleaseAssembler(modpack_manager, _release())
+    manifest = modpack_manager.gtnh_asset_manifest_path.read_bytes()
+
+    release_assembler.merge_maven_urls({})
+    modpack_manager.save_assets()
+    assert not modpack_manager.assets.is_dirty()
+    assert modpack_manager.gtnh_asset_manifest_path.read_bytes() == manifest
+
+    release_assembler.merge_maven_urls({"Resolved": {"1.0": MAVEN_URL}})
+    assert modpack_manager.assets.get_mod("Resolved").is_dirty()
+    assert not modpack_manager.assets.get_mod("Untouched").is_dirty()
+    modpack_manager.save_assets()
+
+    saved = GTNHModpackManager.load_assets(modpack_manager)
+    resolved = saved.get_mod("Resolved").get_version("1.0")
+    untouched = saved.get_mod("Untouched").get_version("1.0")
+    assert resolved is not None and resolved.maven_url == MAVEN_URL
+    assert untouched is not None and untouched.maven_url is None
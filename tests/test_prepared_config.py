@@ -0,0 +1,29 @@
+from pathlib import Path
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from gtnh.assembler.exclusions import Exclusions
+from gtnh.assembler.prepared_config import prepare_config
+
+
+def test_config_is_filtered_once_per_side(tmp_path: Path) -> None:
+    config_file = tmp_path / "config.zip"
+    with ZipFile(config_file, "w", compression=ZIP_DEFLATED) as config_zip:
+        config_zip.writestr("config/client.cfg", b"client" * 10)
+        config_zip.writestr("config/common.cfg", b"common" * 10)
+        config_zip.writestr("server.properties", b"motd=GTNH")
+
+    client = prepare_config(config_file, Exclusions(["server.properties"]))
+    server = prepare_config(config_file, Exclusions(["config/client.cfg"]))
+
+    assert prepare_config(config_file, Exclusions(["server.properties"])) is client
+    assert len(client) == 2 and len(server) == 2
+    # the compressed data is shared between the sides
+    assert client.entries[1][1] is server.entries[0][1]
+
+    written: list[str] = []
+    with ZipFile(tmp_path / "pack.zip", "w") as archive:
+        client.write(archive, prefix=".minecraft/", skip={"config/client.cfg"}, callback=written.append)
+
+    assert written == ["config/common.cfg"]
+    with ZipFile(tmp_path / "pack.zip") as archive:
+        assert archive.read(".minecraft/config/common.cfg") == b"common" * 10
@@ -0,0 +1,54 @@
+import asyncio
+from typing import Any, Callable, Dict, List
+
+import httpx
+from conftest import FakeNetwork
+
+from gtnh import modpack_manager as modpack_manager_module
+from gtnh.models.gtnh_version import GTNHVersion
+from gtnh.models.mod_info import GTNHModInfo
+from gtnh.modpack_manager import GTNHModpackManager
+from gtnh.utils import AttributeDict
+
+
+def _release(tag: str) -> Dict[str, Any]:
+    return {
+        "tag_name": tag,
+        "prerelease": False,
+        "body": "",
+        "assets": [
+            {
+                "name": f"Mod-{tag}.jar",
+                "url": f"https://api.github.com/assets/{tag}",
+                "browser_download_url": f"https://github.com/assets/{tag}",
+                "created_at": "2023-01-01T00:00:00Z",
+            }
+        ],
+    }
+
+
+def _stub_releases(tags: List[str], per_page: int) -> Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        start = (page - 1) * per_page
+        chunk = tags[start : start + per_page]  # noqa: E203
+        return httpx.Response(200, headers={"content-type": "application/json"}, json=[_release(tag) for tag in chunk])
+
+    return handler
+
+
+def test_stops_at_the_first_page_of_known_releases(
+    monkeypatch: Any, modpack_manager: GTNHModpackManager, network: FakeNetwork
+) -> None:
+    monkeypatch.setattr(modpack_manager_module, "GITHUB_RELEASES_PER_PAGE", 2)
+    mod = GTNHModInfo(name="Mod", latest_version="1.2", external_url=None, project_id=None, slug=None)
+    for tag in ["1.1", "1.2"]:
+        mod.add_version(GTNHVersion(version_tag=tag, filename=f"Mod-{tag}.jar"))
+    network.handler = _stub_releases(["1.4", "1.3", "1.2", "1.1", "1.0", "0.9"], 2)
+
+    assert asyncio.run(modpack_manager.update_versions_from_repo(mod, AttributeDict({"name": mod.name})))
+
+    assert [int(request.url.params["page"]) for request in network.requests] == [1, 2]
+    assert mod.latest_version == "1.4"
+    assert mod.has_version("1.3")
+    assert not mod.has_version("1.0")
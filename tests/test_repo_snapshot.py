@@ -0,0 +1,57 @@
+import asyncio
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httpx
+import orjson
+from gidgethub.httpx import GitHubAPI
+
+from gtnh.github.repo_snapshot import RepoSnapshot
+
+
+def _repo(name: str, pushed_at: str) -> Dict[str, Any]:
+    return {"name": name, "pushed_at": pushed_at}
+
+
+def _get_all_repos(snapshot: RepoSnapshot, pages: List[List[Dict[str, Any]]], requested: List[str]) -> Dict[str, Any]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        page = int(request.url.params.get("page", "1"))
+        headers = {"content-type": "application/json"}
+        if page < len(pages):
+            headers["link"] = f'<{request.url.copy_merge_params({"page": page + 1})}>; rel="next"'
+        return httpx.Response(200, headers=headers, json=pages[page - 1])
+
+    async def run() -> Dict[str, Any]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await snapshot.get_all_repos(GitHubAPI(client, "test"), "GTNewHorizons")
+
+    return asyncio.run(run())
+
+
+def test_refresh_stops_at_the_first_known_push(tmp_path: Path) -> None:
+    snapshot = RepoSnapshot(tmp_path / "repos.json", ttl=60)
+    requested: List[str] = []
+    full = [[_repo("A", "2023-01-03T00:00:00Z"), _repo("B", "2023-01-02T00:00:00Z")], [_repo("C", "2023-01-01")]]
+
+    assert set(_get_all_repos(snapshot, full, requested)) == {"A", "B", "C"}
+    assert len(requested) == 2
+
+    # fresh: no request at all
+    requested.clear()
+    assert set(_get_all_repos(snapshot, full, requested)) == {"A", "B", "C"}
+    assert requested == []
+
+    stored = orjson.loads((tmp_path / "repos.json").read_bytes())
+    stored["refreshed_at"] -= 120
+    (tmp_path / "repos.json").write_bytes(orjson.dumps(stored))
+
+    by_push = [
+        [_repo("D", "2023-02-01T00:00:00Z"), _repo("B", "2023-01-05T00:00:00Z"), _repo("A", "2023-01-03T00:00:00Z")]
+    ]
+    by_push.append([_repo("C", "2023-01-01")])
+    repos = _get_all_repos(snapshot, by_push, requested)
+
+    assert len(requested) == 1 and "sort=pushed" in requested[0]
+    assert set(repos) == {"A", "B", "C", "D"}
+    assert repos["B"]["pushed_at"] == "2023-01-05T00:00:00Z"
@@ -0,0 +1,64 @@
+import asyncio
+from typing import Any, Dict, List
+
+import httpx
+from conftest import FakeNetwork
+
+from gtnh.defs import VersionableType
+from gtnh.models.gtnh_translations import GTNHTranslations
+from gtnh.models.gtnh_version import GTNHVersion
+from gtnh.modpack_manager import GTNHModpackManager
+from gtnh.utils import AttributeDict
+
+
+def _release(tag: str, updated_at: str) -> Dict[str, Any]:
+    return {
+        "tag_name": tag,
+        "prerelease": False,
+        "body": "",
+        "assets": [
+            {
+                "name": f"{tag}.zip",
+                "url": f"https://api.github.com/assets/{tag}",
+                "browser_download_url": f"https://github.com/assets/{tag}",
+                "created_at": "2023-01-01T00:00:00Z",
+                "updated_at": updated_at,
+                "size": 10,
+            }
+        ],
+    }
+
+
+def _update(
+    manager: GTNHModpackManager, network: FakeNetwork, translations: GTNHTranslations, releases: List[Dict[str, Any]]
+) -> None:
+    network.handler = lambda request: httpx.Response(200, headers={"content-type": "application/json"}, json=releases)
+    asyncio.run(manager.update_translations_from_repo(translations, AttributeDict({"name": translations.name})))
+
+
+def test_recorded_hash_is_kept_for_unchanged_assets(modpack_manager: GTNHModpackManager, network: FakeNetwork) -> None:
+    translations = GTNHTranslations(
+        name="GTNH-Translations", latest_version="", repo_url="", type=VersionableType.translations
+    )
+    for tag in ["zh_CN-latest", "ja_JP-latest"]:
+        translations.add_version(
+            GTNHVersion(
+                version_tag=tag,
+                filename=f"{tag}.zip",
+                size=10,
+                sha256=f"{tag}-sha",
+                updated_at="2023-01-01T00:00:00Z",
+            )
+        )
+
+    _update(
+        modpack_manager,
+        network,
+        translations,
+        [_release("zh_CN-latest", "2023-01-01T00:00:00Z"), _release("ja_JP-latest", "2023-02-01T00:00:00Z")],
+    )
+
+    zh_cn = translations.get_version("zh_CN-latest")
+    ja_jp = translations.get_version("ja_JP-latest")
+    assert zh_cn is not None and zh_cn.sha256 == "zh_CN-latest-sha"
+    assert ja_jp is not None and ja_jp.sha256 is None
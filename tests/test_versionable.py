@@ -0,0 +1,66 @@
+from gtnh.models.gtnh_version import GTNHVersion
+from gtnh.models.mod_info import GTNHModInfo
+from gtnh.models.versionable import parse_version
+
+
+def _mod(*tags: str) -> GTNHModInfo:
+    mod = GTNHModInfo(name="Mod", latest_version="", external_url=None, project_id=None, slug=None)
+    for tag in tags:
+        mod.add_version(GTNHVersion(version_tag=tag))
+    return mod
+
+
+def _tags(versions: list[GTNHVersion]) -> list[str]:
+    return [version.version_tag for version in versions]
+
+
+def test_versions_are_kept_sorted() -> None:
+    mod = _mod("1.2.0", "1.0.0", "1.10.0", "1.1.0")
+
+    assert _tags(mod.versions) == ["1.0.0", "1.1.0", "1.2.0", "1.10.0"]
+    assert mod.latest_version == "1.10.0"
+    assert _tags(mod.get_versions(left="1.1.0", right="1.2.0")) == ["1.1.0", "1.2.0"]
+    assert _tags(mod.get_versions(left=None, right="1.1.0")) == ["1.0.0", "1.1.0"]
+
+    assert mod.remove_version_tag("1.1.0")
+    assert not mod.has_version("1.1.0")
+    assert _tags(mod.get_versions(left="1.0.0", right="1.10.0")) == ["1.0.0", "1.2.0", "1.10.0"]
+
+
+def test_reassigned_versions_are_reindexed() -> None:
+    mod = _mod("1.0.0", "1.1.0")
+    mod.versions = [GTNHVersion(version_tag="2.1.0"), GTNHVersion(version_tag="2.0.0")]
+
+    mod.sort_versions()
+
+    assert _tags(mod.versions) == ["2.0.0", "2.1.0"]
+    assert mod.get_version("2.1.0") is mod.versions[1]
+    assert mod.get_version("1.0.0") is None
+
+
+def test_lookup_of_tags_with_the_same_ordering() -> None:
+    mod = _mod("1.0-pre", "1.0.pre", "0.9")
+
+    assert mod.has_version("1.0.pre")
+    assert mod.get_version("1.0-pre") is not None
+    assert mod.remove_version_tag("1.0.pre")
+    assert _tags(mod.versions) == ["0.9", "1.0-pre"]
+
+
+def test_removal_keeps_the_parsed_keys() -> None:
+    mod = _mod("1.0.0", "1.1.0", "1.2.0", "1.3.0")
+    keys = mod._keys()
+
+    assert mod.remove_version_tag("1.1.0")
+
+    assert mod._keys() is keys
+    assert keys == [parse_version(tag) for tag in ["1.0.0", "1.2.0", "1.3.0"]]
+    assert mod.get_version_idx("1.3.0") == 2
+
+
+def test_same_length_reassignment_is_reindexed() -> None:
+    mod = _mod("1.0.0", "1.1.0")
+    mod.versions = [GTNHVersion(version_tag="2.0.0"), GTNHVersion(version_tag="2.1.0")]
+
+    assert mod.get_version_idx("2.1.0") == 1
+    assert not mod.has_version("1.1.0")
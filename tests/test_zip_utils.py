@@ -0,0 +1,49 @@
+from pathlib import Path
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
+
+from gtnh.assembler.zip_utils import copy_zip_entry, deterministic_date_time, normalize_archive
+
+
+def test_entries_are_copied_without_recompression(tmp_path: Path) -> None:
+    with ZipFile(tmp_path / "config.zip", "w", compression=ZIP_DEFLATED) as source:
+        source.writestr("config/", b"")
+        source.writestr("config/mod.cfg", b"B:enabled=true\n" * 100)
+        source.writestr("config/icon.png", b"png" * 100, compress_type=ZIP_STORED)
+
+    with ZipFile(tmp_path / "config.zip") as source, ZipFile(tmp_path / "pack.zip", "w") as target:
+        target.writestr("mods/", b"")
+        for item in source.namelist():
+            copy_zip_entry(source, item, target, f".minecraft/{item}")
+        target.writestr("README.md", b"readme")
+
+    with ZipFile(tmp_path / "config.zip") as source, ZipFile(tmp_path / "pack.zip") as target:
+        assert target.testzip() is None
+        copied_names = [f".minecraft/{item}" for item in source.namelist()]
+        assert target.namelist() == ["mods/", *copied_names, "README.md"]
+        for item in source.infolist():
+            copied = target.getinfo(f".minecraft/{item.filename}")
+            assert (copied.compress_type, copied.compress_size, copied.CRC) == (
+                item.compress_type,
+                item.compress_size,
+                item.CRC,
+            )
+            assert target.read(copied) == source.read(item)
+
+
+def test_normalized_archives_only_depend_on_their_entries(tmp_path: Path) -> None:
+    entries = {"config/": b"", "config/mod.cfg": b"B:enabled=true\n", "mods/Mod-1.0.jar": b"jar"}
+    builds = [
+        ("a.zip", sorted(entries), (2020, 1, 1, 0, 0, 0)),
+        ("b.zip", sorted(entries, reverse=True), (2023, 6, 1, 12, 0, 0)),
+    ]
+    for name, order, date_time in builds:
+        with ZipFile(tmp_path / name, "w", compression=ZIP_DEFLATED) as archive:
+            for entry in order:
+                archive.writestr(ZipInfo(entry, date_time=date_time), entries[entry])
+        normalize_archive(tmp_path / name, deterministic_date_time())
+
+    assert (tmp_path / "a.zip").read_bytes() == (tmp_path / "b.zip").read_bytes()
+    with ZipFile(tmp_path / "a.zip") as archive:
+        assert archive.namelist() == sorted(entries)
+        assert archive.testzip() is None
+        assert archive.getinfo("config/").is_dir()